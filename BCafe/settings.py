@@ -49,6 +49,9 @@ INSTALLED_APPS = [
     "orders.apps.OrdersConfig",
     "feedback",
     "ingredient_requests.apps.IngredientRequestsConfig",
+    "reporting.apps.ReportingConfig",
+    "benchmarks",
+    "metrics.apps.MetricsConfig",
     "simple_history",
     ]
 
@@ -66,6 +69,18 @@ REST_FRAMEWORK = {
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 15,
+    # ---------------- Content negotiation ----------------
+    'DEFAULT_RENDERER_CLASSES': [
+        'utility.renderers.ORJSONRenderer',
+        'utility.renderers.MessagePackRenderer',  # Accept: application/msgpack (tablet app)
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'utility.parsers.ORJSONParser',
+        'utility.parsers.MessagePackParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     # ---------------- Throttle ----------------
     'DEFAULT_THROTTLE_CLASSES': [
         'rest_framework.throttling.UserRateThrottle',  # Restrictions for logged in users
@@ -80,7 +95,11 @@ REST_FRAMEWORK = {
 
 
 MIDDLEWARE = [
+    "metrics.middleware.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "django.middleware.gzip.GZipMiddleware",  # responses not already compressed by utility.httpcache
+    "utility.middleware.ProfilingMiddleware",
+    "utility.middleware.ReplicaPinningMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -114,11 +133,50 @@ WSGI_APPLICATION = "BCafe.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# "replica" is a read-only copy of "default"; locally both point at the same
+# SQLite file. Persistent connections are reused for CONN_MAX_AGE seconds and
+# health-checked before each request so a dropped connection is reopened.
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
-    }
+        "CONN_MAX_AGE": 60,
+        "CONN_HEALTH_CHECKS": True,
+        # Writers take the lock at BEGIN instead of failing mid-transaction.
+        "OPTIONS": {"transaction_mode": "IMMEDIATE"},
+        "TEST": {"NAME": BASE_DIR / "test_primary.sqlite3"},
+    },
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db.sqlite3",
+        "CONN_MAX_AGE": 60,
+        "CONN_HEALTH_CHECKS": True,
+        # A second file under test; utility.tests copies the primary into it.
+        "TEST": {"NAME": BASE_DIR / "test_replica.sqlite3"},
+    },
+}
+
+DATABASE_ROUTERS = ["utility.routers.PrimaryReplicaRouter"]
+
+# Read routing
+REPLICA_DATABASE = "replica"
+REPLICA_ROUTED_APPS = ("menu", "info", "feedback")
+REPLICA_PIN_COOKIE = "bcafe_primary_pin"   # set after a write, read-your-writes
+REPLICA_PIN_HEADER = "HTTP_X_READ_PRIMARY"  # "X-Read-Primary: 1" forces primary reads
+REPLICA_PIN_SECONDS = 5
+
+# SQLite connection profile, applied by utility.signals on connect.
+# Set to {} to run with SQLite defaults.
+# - WAL lets readers run while a writer holds the lock.
+# - busy_timeout waits for the lock instead of failing with "database is locked".
+# - mmap_size / cache_size / temp_store keep hot pages and temp b-trees in memory.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,            # ms
+    "mmap_size": 128 * 1024 * 1024,  # bytes
+    "cache_size": -20000,            # negative = KiB, ~20 MB
+    "temp_store": "MEMORY",
 }
 
 
@@ -178,16 +236,96 @@ CELERY_BROKER_URL = 'redis://localhost:6379/0'
 CELERY_RESULT_BACKEND = 'redis://localhost:6379/0'
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
+CELERY_BEAT_SCHEDULE = {
+    'prune-sales-buckets': {
+        'task': 'menu.tasks.prune_sales_buckets',
+        'schedule': 60 * 60 * 24,  # daily
+    },
+    'refresh-demand-forecast': {
+        'task': 'menu.tasks.refresh_demand_forecast',
+        'schedule': 60 * 60 * 24,  # daily
+    },
+    'purge-tombstones': {
+        'task': 'utility.tasks.purge_expired_tombstones',
+        'schedule': 60 * 60 * 24,  # daily
+    },
+}
 
 # CACHES
 CACHES = {
+    # In-process LRU in front of "redis" for versioned keys (utility.cache_backends);
+    # other processes drop changed keys through Redis pub/sub.
     "default": {
+        "BACKEND": "utility.cache_backends.TwoTierCache",
+        "LOCATION": "redis",
+        "OPTIONS": {
+            "LOCAL_PREFIXES": (
+                "httpcache:version:", "httpcache:response:", "httpcache:modified:",
+                "httpcache:timeline:", "httpcache:user:", "info:venue:", "info:schedule:",
+            ),
+            "LOCAL_MAX_ENTRIES": 2000,
+            "LOCAL_MAX_BYTES": 64 * 1024 * 1024,  # per process
+            "LOCAL_TIMEOUT": 300,
+            "INVALIDATION": "pubsub",
+        },
+    },
+    "redis": {
         "BACKEND": "django_redis.cache.RedisCache",
         "LOCATION": "redis://127.0.0.1:6379/1",  # Redis address
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
         }
-    }
+    },
 }
 
-CACHE_TTL = 60 * 5  # 5 min
\ No newline at end of file
+CACHE_TTL = 60 * 5  # 5 min
+
+# HTTP CACHING (utility.httpcache): ETags from data versions, pre-compressed bodies
+HTTP_CACHE_MAX_AGE = 0  # seconds clients may reuse a response before revalidating
+HTTP_CACHE_MIN_COMPRESS = 256  # smaller bodies are stored uncompressed
+
+# STAMPEDE PROTECTION (utility.httpcache.get_or_compute)
+CACHE_STALE_TTL = 60  # seconds an expired entry is still served while one worker refreshes it
+CACHE_LOCK_TIMEOUT = 30  # refresh lock lifetime
+CACHE_LOCK_WAIT = 5  # seconds a cold miss waits for the refreshing worker
+CACHE_EARLY_REFRESH = 1.0  # probabilistic early expiration factor; 0 disables it
+
+
+# HISTORY RETENTION (manage.py history_retention)
+HISTORY_RETENTION_DAYS = 90
+HISTORY_ARCHIVE_DIR = BASE_DIR / "history_archive"
+
+# TOMBSTONE PURGE (manage.py purge_tombstones, utility.tombstones)
+TOMBSTONE_RETENTION_DAYS = 30
+TOMBSTONE_ARCHIVE_DIR = BASE_DIR / "tombstone_archive"
+TOMBSTONE_BATCH_SIZE = 500
+TOMBSTONE_BATCH_PAUSE = 0.5  # seconds between batches
+
+# REQUEST PROFILING (utility.middleware.ProfilingMiddleware), off while both triggers are unset
+PROFILING_TOKEN = ""  # requests sent with "X-Profile: <token>" are profiled
+PROFILING_SAMPLE_RATE = 0.0  # share of all requests profiled at random
+PROFILING_INTERVAL = 0.001  # seconds between stack samples
+PROFILING_DIR = BASE_DIR / "profiles"
+PROFILING_MAX_PROFILES = 200  # ring buffer size
+
+# METRICS (/metrics/, metrics.registry). Across gunicorn/Celery workers, set
+# PROMETHEUS_MULTIPROC_DIR in their environment to an empty directory.
+METRICS_TOKEN = ""  # scrape with "Authorization: Bearer <token>"; closed when empty...
+METRICS_PUBLIC = False  # ...unless this is set (scraped on a private port only)
+METRICS_CELERY_QUEUES = ("celery",)
+
+# COMPILED READERS (utility.readers, CompiledListMixin); False serializes lists with DRF again
+COMPILED_READERS = True
+
+# SALES BUCKETS (menu.sales)
+SALES_HOURLY_RETENTION_DAYS = 8
+SALES_MAX_WINDOW_DAYS = 366  # longest ?window= for top sellers
+
+# DEMAND FORECAST (menu.forecast)
+FORECAST_HISTORY_DAYS = 730
+FORECAST_SMOOTHING = 0.3  # exponential smoothing alpha
+FORECAST_CACHE_TTL = 60 * 60 * 24
+
+# OPENING HOURS (info.schedule), used for reservations until WorkingHours rows
+# exist. Orders are accepted at any time until then.
+DEFAULT_OPENING_HOURS = ("10:00", "22:00")
@@ -0,0 +1,20 @@
+"""
+Settings for `python manage.py test` (see manage.py): the suite runs
+without Redis. The two-tier cache keeps its shape but its L2 is a
+per-process locmem cache, so invalidation is "local" instead of pub/sub,
+and Celery tasks run in-process.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+CACHES = {
+    "default": {
+        **CACHES["default"],
+        "LOCATION": "l2",
+        "OPTIONS": {**CACHES["default"]["OPTIONS"], "INVALIDATION": "local"},
+    },
+    "l2": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "bcafe-tests"},
+}
+
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_EAGER_PROPAGATES = True
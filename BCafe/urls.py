@@ -27,4 +27,7 @@ urlpatterns = [
     path("orders/", include('orders.urls')),
     path("feedback/",include('feedback.urls')),
     path("ingredient_requests/",include('ingredient_requests.urls')),
+    path("reports/", include('reporting.urls')),
+    path("profiling/", include('utility.urls')),
+    path("metrics/", include('metrics.urls')),
 ]
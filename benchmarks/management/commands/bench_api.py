@@ -0,0 +1,72 @@
+# -------------------  Django imports   ------------------------
+from django.core.management.base import BaseCommand, CommandError
+# -------------------   Apps imports ------------------------
+from benchmarks.report import build_report, format_comparison, format_report, load, save
+from benchmarks.runner import RequestFailed, run, throttles_disabled
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.seed import Dataset
+# -------------------  Other imports   ------------------------
+from contextlib import nullcontext
+
+##################################################################################
+#                              bench_api command                                 #
+##################################################################################
+
+class Command(BaseCommand):
+    help = (
+        "Run the weighted request mix (browse, order, payment, reporting) against "
+        "the bench_seed dataset and report req/s, p50/p99 and queries per request."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scenario", action="append", choices=sorted(SCENARIOS),
+            help="Limit the mix to these scenarios (repeatable). Default: all, by weight.",
+        )
+        parser.add_argument("--requests", type=int, default=1000, help="Stop after this many requests.")
+        parser.add_argument("--duration", type=float, help="Stop after this many seconds instead.")
+        parser.add_argument(
+            "--base-url",
+            help="Benchmark a running server over HTTP (e.g. http://127.0.0.1:8000). "
+                 "Default: in-process through the test client, with query counts.",
+        )
+        parser.add_argument("--concurrency", type=int, default=8, help="HTTP workers (--base-url only).")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--with-throttles", action="store_true",
+            help="Keep DRF rate limits in-process. A server under --base-url applies its own settings.",
+        )
+        parser.add_argument("--output", help="Write the JSON report here.")
+        parser.add_argument("--compare", help="Baseline JSON report to diff against.")
+
+    def handle(self, *args, **options):
+        data = Dataset.load()
+        if not (data.menu_item_ids and data.customers and data.cashiers and data.admins):
+            raise CommandError("No benchmark data. Run `manage.py bench_seed` first.")
+        scenarios = options["scenario"] or sorted(SCENARIOS)
+        requests = None if options["duration"] else options["requests"]
+        in_process = options["base_url"] is None
+
+        throttled = options["with_throttles"] or not in_process
+        try:
+            with nullcontext() if throttled else throttles_disabled():
+                recorder, seconds = run(
+                    data, scenarios, requests=requests, duration=options["duration"],
+                    base_url=options["base_url"], concurrency=1 if in_process else options["concurrency"],
+                    seed=options["seed"], tolerated=(429,) if throttled else (),
+                )
+        except RequestFailed as exc:
+            raise CommandError(f"Benchmark aborted: {exc}")
+
+        report = build_report(
+            recorder.samples, seconds,
+            mode="in-process" if in_process else "http", base_url=options["base_url"],
+            scenarios=scenarios, concurrency=1 if in_process else options["concurrency"], seed=options["seed"],
+        )
+        self.stdout.write(format_report(report))
+        if options["output"]:
+            save(report, options["output"])
+            self.stdout.write(f"Report written to {options['output']}")
+        if options["compare"]:
+            self.stdout.write("")
+            self.stdout.write(format_comparison(load(options["compare"]), report))
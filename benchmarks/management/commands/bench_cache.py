@@ -0,0 +1,22 @@
+# -------------------  Django imports   ------------------------
+from django.core.management.base import BaseCommand, CommandError
+# -------------------   Apps imports ------------------------
+from benchmarks.tiers import measure
+
+##################################################################################
+#                             bench_cache command                                #
+##################################################################################
+
+class Command(BaseCommand):
+    help = "Hot menu reads with and without the in-process tier of the default cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=1000, help="Requests per endpoint and mode.")
+
+    def handle(self, *args, **options):
+        results = measure(options["requests"])
+        if results is None:
+            raise CommandError("The default cache is not a utility.cache_backends.TwoTierCache.")
+        self.stdout.write(f"{'mode':<10}{'endpoint':<28}{'ms/request':>12}{'L2 calls/request':>18}")
+        for (mode, path), row in results.items():
+            self.stdout.write(f"{mode:<10}{path:<28}{row['ms']:>12.3f}{row['remote_calls']:>18.2f}")
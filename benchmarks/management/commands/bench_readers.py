@@ -0,0 +1,39 @@
+# -------------------  Django imports   ------------------------
+from django.core.management.base import BaseCommand
+# -------------------   Apps imports ------------------------
+from benchmarks.readers import CASES, measure
+
+def ratio(value):
+    return "-" if value is None else f"{value:.1f}x"
+
+##################################################################################
+#                            bench_readers command                               #
+##################################################################################
+
+class Command(BaseCommand):
+    help = (
+        "Compare CPU per item of the compiled readers with the DRF serializers "
+        "they replace, and check both render the same JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--case", action="append", choices=sorted(CASES), help="Default: all.")
+        parser.add_argument("--limit", type=int, help="Items per case. Default: all rows.")
+        parser.add_argument("--repeat", type=int, default=5, help="Best of this many runs.")
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            "CPU microseconds per item: DRF fetches instances and renders them, "
+            "the reader reads rows into dicts and renders those"
+        )
+        self.stdout.write(
+            f"{'case':<14}{'items':>7}{'drf fetch':>11}{'drf render':>12}{'read':>8}{'render':>8}"
+            f"{'total x':>9}  golden"
+        )
+        for name in options["case"] or sorted(CASES):
+            row = measure(name, options["limit"], options["repeat"])
+            self.stdout.write(
+                f"{name:<14}{row['items']:>7}{row['drf_fetch_us']:>11.1f}{row['drf_render_us']:>12.1f}"
+                f"{row['fetch_us']:>8.1f}{row['render_us']:>8.1f}"
+                f"{ratio(row['total_speedup']):>9}  {row['golden']}"
+            )
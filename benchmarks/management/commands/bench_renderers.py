@@ -0,0 +1,24 @@
+# -------------------  Django imports   ------------------------
+from django.core.management.base import BaseCommand, CommandError
+# -------------------   Apps imports ------------------------
+from benchmarks.renderers import measure
+
+##################################################################################
+#                           bench_renderers command                              #
+##################################################################################
+
+class Command(BaseCommand):
+    help = "Encode/decode time and size per format for a list of serialized menu items."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=20, help="Best of this many runs.")
+
+    def handle(self, *args, **options):
+        count, results = measure(options["items"], options["repeat"])
+        if not count:
+            raise CommandError("No menu items. Run `manage.py bench_seed` first.")
+        self.stdout.write(f"{count} menu items")
+        self.stdout.write(f"{'format':<12}{'encode ms':>11}{'decode ms':>11}{'bytes':>10}")
+        for name, row in results.items():
+            self.stdout.write(f"{name:<12}{row['encode_ms']:>11.2f}{row['decode_ms']:>11.2f}{row['bytes']:>10}")
@@ -0,0 +1,25 @@
+# -------------------  Django imports   ------------------------
+from django.core.management.base import BaseCommand
+# -------------------   Apps imports ------------------------
+from benchmarks.seed import seed, reset
+
+##################################################################################
+#                              bench_seed command                                #
+##################################################################################
+
+class Command(BaseCommand):
+    help = "Create (or --reset) the reproducible benchmark dataset. Use a throwaway database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", type=float, default=1.0, help="Multiplier of the base row counts.")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--reset", action="store_true", help="Only delete the benchmark rows.")
+
+    def handle(self, *args, **options):
+        if options["reset"]:
+            reset()
+            self.stdout.write("Benchmark rows deleted.")
+            return
+        _, created = seed(scale=options["scale"], seed=options["seed"])
+        for kind, count in created.items():
+            self.stdout.write(f"{kind:<14}{count:>10}")
@@ -0,0 +1,76 @@
+# -------------------  Django imports   ------------------------
+from django.core.management.base import BaseCommand, CommandError
+# -------------------   Apps imports ------------------------
+from benchmarks.scale import ScaleSeeder, bulk_load, ensure_base
+from reporting.rollups import rebuild
+# -------------------  Other imports   ------------------------
+import numpy as np
+import time
+
+SUFFIXES = {"k": 10 ** 3, "m": 10 ** 6}
+
+
+def count(value):
+    """Row counts like 5000, 200k or 5M."""
+    text = value.strip().lower().replace("_", "")
+    factor = SUFFIXES.get(text[-1:], 1)
+    try:
+        return int(float(text[:-1] if factor > 1 else text) * factor)
+    except ValueError:
+        raise CommandError(f"Invalid count: {value}")
+
+##################################################################################
+#                              seed_scale command                                #
+##################################################################################
+
+class Command(BaseCommand):
+    help = (
+        "Append production-scale orders (with lines, payments and feedback) and "
+        "reservations, generated with NumPy and written without the ORM or signals. "
+        "Use a throwaway database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--orders", type=count, default=count("100k"), help="e.g. 500k or 5M")
+        parser.add_argument("--reservations", type=count, help="Default: a fifth of --orders.")
+        parser.add_argument("--feedback-rate", type=float, default=0.15, help="Share of paid orders rated.")
+        parser.add_argument("--customers", type=count, default=count("10k"))
+        parser.add_argument("--menu-items", type=count, default=200)
+        parser.add_argument("--tables", type=int, default=40)
+        parser.add_argument("--days", type=int, default=730, help="Spread the rows over this many past days.")
+        parser.add_argument("--chunk-size", type=count, default=count("50k"), help="Orders per transaction.")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--rebuild-reports", action="store_true", help="Rebuild the revenue rollups afterwards.")
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(options["seed"])
+        base = ensure_base(options["customers"], options["menu_items"], options["tables"], rng)
+        seeder = ScaleSeeder(base, options["days"], rng, options["chunk_size"], options["feedback_rate"])
+        reservations = options["reservations"]
+        if reservations is None:
+            reservations = options["orders"] // 5
+
+        started = time.perf_counter()
+        counts = dict(seeder.counts)
+        # The rate includes rebuilding the indexes.
+        with bulk_load([writer.model for writer in seeder.writers.values()], seeder.using):
+            for counts in seeder.orders(options["orders"]):
+                self.progress(counts, started)
+            for counts in seeder.reservations(reservations):
+                self.progress(counts, started)
+        seeder.finish()
+
+        seconds = time.perf_counter() - started
+        total = sum(counts.values())
+        for kind, rows in counts.items():
+            self.stdout.write(f"{kind:<14}{rows:>12}")
+        self.stdout.write(f"{total} rows in {seconds:.1f}s ({total / seconds:,.0f} rows/s)")
+
+        if options["rebuild_reports"]:
+            self.stdout.write(f"Rebuilt reports for {rebuild()} payments.")
+
+    def progress(self, counts, started):
+        total = sum(counts.values())
+        rate = total / max(time.perf_counter() - started, 1e-9)
+        self.stderr.write(f"\r{total:,} rows ({rate:,.0f} rows/s)", ending="")
+        self.stderr.flush()
@@ -0,0 +1,80 @@
+# Compiled readers (utility.readers) against the DRF serializers they
+# replace: CPU per item and a golden check that both give the same JSON.
+# The DRF side is split into fetching model instances and rendering them
+# (serializer + JSONRenderer), the reader side into reading the rows into
+# dicts and rendering those (orjson).
+
+# -------------------  DRF imports   ------------------------
+from rest_framework.renderers import JSONRenderer
+# -------------------   Apps imports ------------------------
+from feedback.models import Feedback
+from feedback.serializers import FeedbackSerializer
+from menu.models import MenuItem
+from menu.serializers import MenuItemSerializer
+from reservation.models import Reservation
+from reservation.serializers import ReservationSerializer
+from utility.readers import get_reader
+from utility.renderers import ORJSONRenderer
+# -------------------  Other imports   ------------------------
+import json
+import time
+
+# name -> (serializer, queryset of the endpoint); the DRF side gets the
+# select_related() it needs, so it is not measured with N+1 queries.
+CASES = {
+    "menu items": (MenuItemSerializer, lambda: MenuItem.objects.select_related("category").order_by("pk")),
+    "reservations": (ReservationSerializer, lambda: Reservation.objects.order_by("pk")),
+    "feedback": (FeedbackSerializer, lambda: Feedback.objects.order_by("pk")),
+}
+
+
+def serializer_path(serializer_class, queryset):
+    """(fetch seconds, render seconds, JSON) through the DRF serializer."""
+    start = time.process_time()
+    instances = list(queryset.all())
+    fetched = time.process_time()
+    body = JSONRenderer().render(serializer_class(instances, many=True).data)
+    return fetched - start, time.process_time() - fetched, body
+
+
+def reader_path(serializer_class, queryset):
+    """(fetch seconds, render seconds, JSON) through the compiled reader."""
+    reader = get_reader(serializer_class)
+    start = time.process_time()
+    items = list(reader.items(queryset))
+    fetched = time.process_time()
+    body = ORJSONRenderer().render(items)
+    return fetched - start, time.process_time() - fetched, body
+
+
+def best_of(path, serializer_class, queryset, repeat):
+    """Fastest fetch and render CPU times over `repeat` runs, and the JSON."""
+    runs = [path(serializer_class, queryset) for _ in range(repeat)]
+    return min(run[0] for run in runs), min(run[1] for run in runs), runs[-1][2]
+
+
+def first_difference(expected, actual):
+    for index, (left, right) in enumerate(zip(expected, actual)):
+        if left != right:
+            keys = sorted(key for key in left.keys() | right.keys() if left.get(key) != right.get(key))
+            return f"item {index}: {', '.join(keys)}"
+    return f"length {len(expected)} != {len(actual)}"
+
+
+def measure(name, limit=None, repeat=5):
+    serializer_class, queryset = CASES[name]
+    queryset = queryset()[:limit] if limit else queryset()
+    get_reader(serializer_class)  # compile outside the timings
+    drf_fetch, drf_render, expected = best_of(serializer_path, serializer_class, queryset, repeat)
+    fetch, render, actual = best_of(reader_path, serializer_class, queryset, repeat)
+    expected, actual = json.loads(expected), json.loads(actual)
+    per_item = 1e6 / max(len(expected), 1)
+    return {
+        "items": len(expected),
+        "drf_fetch_us": drf_fetch * per_item,
+        "drf_render_us": drf_render * per_item,
+        "fetch_us": fetch * per_item,
+        "render_us": render * per_item,
+        "total_speedup": (drf_fetch + drf_render) / (fetch + render) if fetch + render else None,
+        "golden": "ok" if expected == actual else first_difference(expected, actual),
+    }
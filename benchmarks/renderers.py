@@ -0,0 +1,52 @@
+# Encode and decode time of the response formats for a page of menu items:
+# DRF's JSONRenderer/JSONParser against the orjson and MessagePack ones.
+
+# -------------------  DRF imports   ------------------------
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+# -------------------   Apps imports ------------------------
+from menu.models import MenuItem
+from menu.serializers import MenuItemSerializer
+from utility.parsers import MessagePackParser, ORJSONParser
+from utility.renderers import MessagePackRenderer, ORJSONRenderer
+# -------------------  Other imports   ------------------------
+from itertools import cycle, islice
+import io
+import time
+
+FORMATS = {
+    "json (drf)": (JSONRenderer, JSONParser),
+    "orjson": (ORJSONRenderer, ORJSONParser),
+    "msgpack": (MessagePackRenderer, MessagePackParser),
+}
+
+
+def menu_payload(count):
+    """`count` serialized menu items (existing ones repeated as needed)."""
+    items = MenuItemSerializer(MenuItem.objects.select_related("category").order_by("pk"), many=True).data
+    return list(islice(cycle(items), count)) if items else []
+
+
+def best_time(function, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def measure(count=1000, repeat=20):
+    """Per format: encode ms, decode ms and size in bytes of `count` menu items."""
+    payload = menu_payload(count)
+    results = {}
+    for name, (renderer_class, parser_class) in FORMATS.items():
+        renderer, parser = renderer_class(), parser_class()
+        body = renderer.render(payload)
+        results[name] = {
+            "encode_ms": best_time(lambda: renderer.render(payload), repeat) * 1000,
+            "decode_ms": best_time(lambda: parser.parse(io.BytesIO(body)), repeat) * 1000,
+            "bytes": len(body),
+        }
+    return len(payload), results
@@ -0,0 +1,121 @@
+# Benchmark reports: per-request throughput, latency percentiles and query
+# counts, saved as JSON so two runs (e.g. two commits) can be diffed.
+
+# -------------------  Other imports   ------------------------
+from datetime import datetime, timezone
+import json
+import math
+import subprocess
+
+##################################################################################
+#                                  Summaries                                     #
+##################################################################################
+
+def percentile(values, q):
+    """Nearest-rank percentile of a sorted list."""
+    if not values:
+        return None
+    return values[max(0, math.ceil(q / 100 * len(values)) - 1)]
+
+
+def summarize(samples, seconds):
+    """Stats of (name, status, seconds, queries) samples over `seconds` of wall time."""
+    groups = {}
+    for sample in samples:
+        groups.setdefault(sample[0], []).append(sample)
+    groups["TOTAL"] = list(samples)
+
+    stats = {}
+    for name, rows in groups.items():
+        latencies = sorted(row[2] * 1000 for row in rows)
+        queries = [row[3] for row in rows if row[3] is not None]
+        statuses = {}
+        for row in rows:
+            statuses[str(row[1])] = statuses.get(str(row[1]), 0) + 1
+        stats[name] = {
+            "requests": len(rows),
+            "errors": sum(1 for row in rows if row[1] >= 400),
+            "statuses": statuses,
+            "rps": len(rows) / seconds if seconds else None,
+            "mean_ms": sum(latencies) / len(latencies),
+            "p50_ms": percentile(latencies, 50),
+            "p90_ms": percentile(latencies, 90),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": latencies[-1],
+            "queries_mean": sum(queries) / len(queries) if queries else None,
+            "queries_max": max(queries) if queries else None,
+        }
+    return stats
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(samples, seconds, **meta):
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "seconds": seconds,
+            **meta,
+        },
+        "endpoints": summarize(samples, seconds),
+    }
+
+
+def save(report, path):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+
+
+def load(path):
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+##################################################################################
+#                                  Rendering                                     #
+##################################################################################
+
+COLUMNS = [("requests", "req", "d"), ("rps", "req/s", ".1f"), ("p50_ms", "p50 ms", ".1f"),
+           ("p99_ms", "p99 ms", ".1f"), ("queries_mean", "queries", ".1f"), ("errors", "errors", "d")]
+
+
+def _cell(value, spec):
+    return "-" if value is None else format(value, spec)
+
+
+def format_report(report):
+    lines = [f"{'request':<24}" + "".join(f"{title:>10}" for _, title, _ in COLUMNS)]
+    endpoints = report["endpoints"]
+    for name in sorted(endpoints, key=lambda name: (name == "TOTAL", name)):
+        row = endpoints[name]
+        lines.append(f"{name:<24}" + "".join(f"{_cell(row[key], spec):>10}" for key, _, spec in COLUMNS))
+    return "\n".join(lines)
+
+
+def _change(old, new):
+    if old is None or new is None:
+        return "-"
+    if not old:
+        return f"{new:.1f}"
+    return f"{(new - old) / old * 100:+.0f}%"
+
+
+def format_comparison(baseline, current):
+    """Relative change per request of req/s, p50, p99 and queries."""
+    keys = [("rps", "req/s"), ("p50_ms", "p50"), ("p99_ms", "p99"), ("queries_mean", "queries")]
+    lines = [
+        f"baseline {baseline['meta'].get('revision')} -> current {current['meta'].get('revision')}",
+        f"{'request':<24}" + "".join(f"{title:>10}" for _, title in keys),
+    ]
+    names = sorted(set(baseline["endpoints"]) | set(current["endpoints"]), key=lambda name: (name == "TOTAL", name))
+    for name in names:
+        old, new = baseline["endpoints"].get(name, {}), current["endpoints"].get(name, {})
+        lines.append(f"{name:<24}" + "".join(f"{_change(old.get(key), new.get(key)):>10}" for key, _ in keys))
+    return "\n".join(lines)
@@ -0,0 +1,175 @@
+# -------------------  Django imports   ------------------------
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+# -------------------  DRF imports   ------------------------
+from rest_framework.views import APIView
+from rest_framework_simplejwt.tokens import AccessToken
+# -------------------  Other imports   ------------------------
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from unittest import mock
+import json
+import random
+import threading
+import time
+# -------------------   Apps imports ------------------------
+from .scenarios import pick
+
+##################################################################################
+#                                   Samples                                      #
+##################################################################################
+
+class RequestFailed(Exception):
+    """A request answered 4xx/5xx; timing error pages would skew the report."""
+
+class Recorder:
+    """Collects (name, status, seconds, queries) samples from every worker."""
+
+    def __init__(self):
+        self.samples = []
+        self._lock = threading.Lock()
+
+    def add(self, name, status, seconds, queries=None):
+        with self._lock:
+            self.samples.append((name, status, seconds, queries))
+
+    def __len__(self):
+        return len(self.samples)
+
+
+class TokenCache:
+    """JWT access tokens minted locally, one per benchmark user."""
+
+    def __init__(self):
+        self.tokens = {}
+        self._lock = threading.Lock()
+
+    def header(self, username):
+        with self._lock:
+            if username not in self.tokens:
+                user = get_user_model().objects.get(username=username)
+                self.tokens[username] = str(AccessToken.for_user(user))
+            return f"Bearer {self.tokens[username]}"
+
+##################################################################################
+#                                   Drivers                                      #
+##################################################################################
+
+def _parse(content):
+    try:
+        return json.loads(content) if content else None
+    except ValueError:
+        return None
+
+
+def _check(method, path, status, content, tolerated):
+    if status >= 400 and status not in tolerated:
+        raise RequestFailed(f"{method} {path} answered {status}: {content[:200]!r}")
+
+
+class InProcessClient:
+    """
+    Calls the app through Django's test client in this process and counts
+    the SQL queries of every request across all database aliases.
+    """
+
+    def __init__(self, recorder, tokens, tolerated=()):
+        self.recorder = recorder
+        self.tokens = tokens
+        self.tolerated = tolerated
+        # Server errors surface as RequestFailed with their status.
+        self.client = Client(raise_request_exception=False)
+
+    def call(self, name, method, path, user=None, data=None):
+        headers = {"HTTP_AUTHORIZATION": self.tokens.header(user)} if user else {}
+        body = {} if data is None else {"data": json.dumps(data), "content_type": "application/json"}
+        with ExitStack() as stack:
+            captured = [stack.enter_context(CaptureQueriesContext(connections[alias])) for alias in connections]
+            start = time.perf_counter()
+            response = getattr(self.client, method.lower())(path, **body, **headers)
+            seconds = time.perf_counter() - start
+        _check(method, path, response.status_code, response.content, self.tolerated)
+        self.recorder.add(name, response.status_code, seconds, sum(len(c) for c in captured))
+        return response.status_code, _parse(response.content)
+
+
+class HttpClient:
+    """Calls a running server over HTTP with httpx; no query counts."""
+
+    def __init__(self, recorder, tokens, base_url, tolerated=(), timeout=30.0):
+        import httpx
+        self.recorder = recorder
+        self.tokens = tokens
+        self.tolerated = tolerated
+        self.client = httpx.Client(base_url=base_url, timeout=timeout)
+
+    def call(self, name, method, path, user=None, data=None):
+        headers = {"Authorization": self.tokens.header(user)} if user else {}
+        start = time.perf_counter()
+        response = self.client.request(method, path, json=data, headers=headers)
+        seconds = time.perf_counter() - start
+        _check(method, path, response.status_code, response.content, self.tolerated)
+        self.recorder.add(name, response.status_code, seconds)
+        return response.status_code, _parse(response.content)
+
+    def close(self):
+        self.client.close()
+
+##################################################################################
+#                                    Runs                                        #
+##################################################################################
+
+@contextmanager
+def throttles_disabled():
+    """Rate limits (10/min per user) would turn the run into a 429 benchmark."""
+    with mock.patch.object(APIView, "check_throttles", lambda self, request: None):
+        yield
+
+
+def _worker(client, data, scenarios, rng, should_stop, failed):
+    try:
+        while not should_stop():
+            pick(rng, scenarios)(client, data, rng)
+    except Exception:
+        failed.set()
+        raise
+
+
+def run(data, scenarios, requests=None, duration=None, base_url=None, concurrency=1, seed=0, tolerated=()):
+    """
+    Run the weighted scenario mix until `requests` requests were made or
+    `duration` seconds passed. In-process when `base_url` is None (one
+    worker, with query counts); otherwise `concurrency` HTTP workers.
+    Raises RequestFailed on the first 4xx/5xx not in `tolerated`.
+    Returns (recorder, wall seconds).
+    """
+    recorder, tokens, failed = Recorder(), TokenCache(), threading.Event()
+    start = time.perf_counter()
+
+    def should_stop():
+        if failed.is_set() or requests is not None and len(recorder) >= requests:
+            return True
+        return duration is not None and time.perf_counter() - start >= duration
+
+    if base_url is None:
+        # The test client sends "Host: testserver".
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            _worker(
+                InProcessClient(recorder, tokens, tolerated), data, scenarios,
+                random.Random(seed), should_stop, failed,
+            )
+    else:
+        clients = [HttpClient(recorder, tokens, base_url, tolerated) for _ in range(concurrency)]
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = [
+                pool.submit(_worker, client, data, scenarios, random.Random(seed + i), should_stop, failed)
+                for i, client in enumerate(clients)
+            ]
+            for future in futures:
+                future.result()
+        for client in clients:
+            client.close()
+    return recorder, time.perf_counter() - start
@@ -0,0 +1,360 @@
+# Production-scale synthetic data. Columns are generated with NumPy a chunk
+# at a time and written straight to the tables (executemany on SQLite, COPY
+# on PostgreSQL): no model instances, no save()/full_clean(), no signals.
+# Primary keys are assigned here, so foreign keys never need a round-trip.
+# On SQLite, bulk_load() drops the secondary indexes for the load and
+# rebuilds them once at the end, and skips CHECK constraints (the generated
+# values satisfy them).
+
+# -------------------  Django imports   ------------------------
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connections, router, transaction
+from django.db.models import Max
+from django.utils import timezone
+# -------------------   Apps imports ------------------------
+from feedback.models import Feedback
+from menu.models import Category, MenuItem
+from orders.models import Order, OrderItem, Payment
+from reservation.models import Reservation, Table
+from .seed import PASSWORD
+# -------------------  Other imports   ------------------------
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+import csv
+import io
+import numpy as np
+
+SCALE_PREFIX = "scale"
+
+ORDER_STATUSES = np.array(["paid", "confirmed", "pending", "cancelled"])
+ORDER_STATUS_WEIGHTS = np.array([0.75, 0.08, 0.12, 0.05])
+RATINGS = np.array([str(value) for value in range(1, 11)])
+SATISFACTION = np.array(["1", "2", "3"])
+TABLE_TYPES = np.array(["2", "4", "8", "10"])
+DURATIONS = np.array([60, 90, 120, 150])
+
+##################################################################################
+#                                Table writer                                    #
+##################################################################################
+
+class TableWriter:
+    """Appends rows of one model given as column lists, bypassing the ORM."""
+
+    def __init__(self, model, fields):
+        self.model = model
+        self.using = router.db_for_write(model)
+        self.connection = connections[self.using]
+        self.columns = [model._meta.get_field(name).column for name in fields]
+        quote = self.connection.ops.quote_name
+        self.table = quote(model._meta.db_table)
+        self.column_sql = ", ".join(quote(column) for column in self.columns)
+
+    def write(self, columns):
+        """Insert rows given as one list per field. Returns the row count."""
+        rows = list(zip(*columns))
+        if not rows:
+            return 0
+        with self.connection.cursor() as cursor:
+            if self.connection.vendor == "postgresql":
+                self._copy(cursor, rows)
+            else:
+                placeholders = ", ".join(["%s"] * len(self.columns))
+                cursor.executemany(
+                    f"INSERT INTO {self.table} ({self.column_sql}) VALUES ({placeholders})", rows
+                )
+        return len(rows)
+
+    def _copy(self, cursor, rows):
+        sql = f"COPY {self.table} ({self.column_sql}) FROM STDIN"
+        raw = cursor.cursor
+        if hasattr(raw, "copy"):  # psycopg 3
+            with raw.copy(sql) as copy:
+                for row in rows:
+                    copy.write_row(row)
+        else:  # psycopg2
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(("" if value is None else value for value in row) for row in rows)
+            buffer.seek(0)
+            raw.copy_expert(f"{sql} WITH (FORMAT csv, NULL '')", buffer)
+
+    def next_id(self):
+        return (self.model._base_manager.using(self.using).aggregate(top=Max("pk"))["top"] or 0) + 1
+
+    def reset_sequence(self):
+        """Explicit ids leave PostgreSQL sequences behind; no-op elsewhere."""
+        statements = self.connection.ops.sequence_reset_sql(no_style(), [self.model])
+        with self.connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+##################################################################################
+#                                 Bulk load                                      #
+##################################################################################
+
+LOAD_PRAGMAS = {
+    "synchronous": "OFF",
+    "cache_size": -256 * 1024,  # KiB, for the index sorts
+    "ignore_check_constraints": "ON",
+    "threads": 4,  # sorter helper threads when building indexes
+}
+
+
+@contextmanager
+def bulk_load(models, using="default"):
+    """
+    SQLite only (a no-op elsewhere): drop the secondary indexes of `models`,
+    write without fsyncs or CHECK constraints, then recreate the indexes in
+    one sorted pass each and restore the connection's pragmas. Indexes
+    backing UNIQUE constraints are kept.
+    """
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        yield
+        return
+    tables = [model._meta.db_table for model in models]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL "
+            f"AND tbl_name IN ({', '.join(['%s'] * len(tables))})",
+            tables,
+        )
+        indexes = cursor.fetchall()
+        for name, _ in indexes:
+            cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+        previous = {}
+        for name, value in LOAD_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}")
+            previous[name] = cursor.fetchone()[0]
+            cursor.execute(f"PRAGMA {name}={value}")
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            for _, sql in indexes:
+                cursor.execute(sql)
+            for name, value in previous.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+
+##################################################################################
+#                              Column helpers                                    #
+##################################################################################
+
+def timestamps(values, vendor):
+    """datetime64[us] (UTC) values as strings the backend stores natively."""
+    text = np.datetime_as_string(values, unit="us")
+    if vendor == "postgresql":
+        return np.char.add(text, "+00:00").tolist()
+    # Django keeps SQLite datetimes as "YYYY-MM-DD HH:MM:SS.ffffff" (UTC) text;
+    # range filters compare strings, so the separator has to match.
+    return np.char.replace(text, "T", " ").tolist()
+
+
+def constant(value, count):
+    return [value] * count
+
+##################################################################################
+#                                Base entities                                   #
+##################################################################################
+
+def ensure_base(customers, menu_items, tables, rng):
+    """
+    Customers, menu items and tables to reference, created through
+    bulk_create (a few thousand rows) when fewer exist.
+    Returns (customer ids, menu item ids, menu item prices, table ids, table types).
+    """
+    User = get_user_model()
+    missing = customers - User.objects.filter(role="customer").count()
+    if missing > 0:
+        password = make_password(PASSWORD)
+        start = User.objects.aggregate(top=Max("pk"))["top"] or 0
+        User.objects.bulk_create(
+            (
+                User(username=f"{SCALE_PREFIX}_customer_{start + i}", email=f"{SCALE_PREFIX}_{start + i}@example.com",
+                     role="customer", password=password)
+                for i in range(missing)
+            ),
+            batch_size=5000,
+        )
+
+    live_items = MenuItem.objects.filter(status="available")
+    missing = menu_items - live_items.count()
+    if missing > 0:
+        category, _ = Category.objects.get_or_create(name=f"{SCALE_PREFIX} category")
+        start = MenuItem.all_objects.aggregate(top=Max("pk"))["top"] or 0
+        prices = rng.integers(40, 900, missing) * 100
+        MenuItem.objects.bulk_create(
+            (
+                MenuItem(category=category, name=f"{SCALE_PREFIX} item {start + i}", price=Decimal(int(price)),
+                         stock=10 ** 6, preparation_time=timedelta(minutes=10))
+                for i, price in enumerate(prices)
+            ),
+            batch_size=5000,
+        )
+
+    missing = tables - Table.objects.count()
+    if missing > 0:
+        start = Table.objects.aggregate(top=Max("number"))["top"] or 0
+        Table.objects.bulk_create(
+            Table(number=start + i + 1, capacity=str(rng.choice(TABLE_TYPES))) for i in range(missing)
+        )
+
+    customer_ids = np.array(User.objects.filter(role="customer").values_list("pk", flat=True))
+    item_rows = list(live_items.values_list("pk", "price"))
+    table_rows = list(Table.objects.values_list("pk", "capacity"))
+    return (
+        customer_ids,
+        np.array([pk for pk, _ in item_rows]),
+        np.array([float(price) for _, price in item_rows]),
+        np.array([pk for pk, _ in table_rows]),
+        np.array([capacity for _, capacity in table_rows]),
+    )
+
+##################################################################################
+#                                 Generators                                     #
+##################################################################################
+
+ORDER_FIELDS = ["id", "user", "table", "status", "note", "payment_status",
+                "created_at", "updated_at", "is_deleted", "deleted_at"]
+ORDER_ITEM_FIELDS = ["id", "order", "menu_item", "quantity", "created_at", "updated_at", "is_deleted", "deleted_at"]
+PAYMENT_FIELDS = ["id", "order", "amount", "status", "method", "paid_at",
+                  "created_at", "updated_at", "is_deleted", "deleted_at"]
+FEEDBACK_FIELDS = ["id", "user", "order", "item", "feedback_type", "food_rating", "service_satisfaction",
+                   "staff_behavior", "cleanliness", "preparation_time", "revisit_intent", "comment",
+                   "admin_response", "status", "user_ip", "user_agent",
+                   "created_at", "updated_at", "is_deleted", "deleted_at"]
+RESERVATION_FIELDS = ["id", "full_name", "phone_number", "date", "time", "number_of_guests", "table_type",
+                      "extra_notes", "reservation_type", "birthday_design", "birthday_cake", "duration",
+                      "table", "is_approved", "created_at", "updated_at", "is_deleted", "deleted_at"]
+
+
+class ScaleSeeder:
+    """Writes orders (with lines, payments and feedback) and reservations in chunks."""
+
+    def __init__(self, base, days, rng, chunk_size, feedback_rate):
+        self.customer_ids, self.item_ids, self.item_prices, self.table_ids, self.table_types = base
+        self.rng = rng
+        self.chunk_size = chunk_size
+        self.feedback_rate = feedback_rate
+        self.now = np.datetime64(timezone.now().replace(tzinfo=None), "us")
+        self.span_us = int(days * 24 * 3600 * 1e6)
+        self.writers = {
+            "orders": TableWriter(Order, ORDER_FIELDS),
+            "order_items": TableWriter(OrderItem, ORDER_ITEM_FIELDS),
+            "payments": TableWriter(Payment, PAYMENT_FIELDS),
+            "feedback": TableWriter(Feedback, FEEDBACK_FIELDS),
+            "reservations": TableWriter(Reservation, RESERVATION_FIELDS),
+        }
+        self.using = self.writers["orders"].using
+        self.vendor = self.writers["orders"].connection.vendor
+        self.next_ids = {name: writer.next_id() for name, writer in self.writers.items()}
+        self.counts = dict.fromkeys(self.writers, 0)
+
+    def _ids(self, name, count):
+        start = self.next_ids[name]
+        self.next_ids[name] += count
+        return np.arange(start, start + count)
+
+    def _times(self, count, start, end, total):
+        """
+        Sorted times for rows start..end of `total`, oldest first. Ids then
+        grow with time like in production, and (created_at, id) indexes
+        are appended to instead of split at random pages.
+        """
+        low, high = self.span_us * (total - end) // total, self.span_us * (total - start) // total
+        offsets = np.sort(self.rng.integers(low, max(high, low + 1), count))[::-1]
+        return self.now - offsets.astype("timedelta64[us]")
+
+    def _write(self, name, columns):
+        self.counts[name] += self.writers[name].write(columns)
+
+    def orders(self, total):
+        for start in range(0, total, self.chunk_size):
+            n = min(self.chunk_size, total - start)
+            with transaction.atomic(using=self.writers["orders"].using):
+                self.order_chunk(n, self._times(n, start, start + n, total))
+            yield dict(self.counts)
+
+    def order_chunk(self, n, created):
+        rng = self.rng
+        order_ids = self._ids("orders", n)
+        created_text = timestamps(created, self.vendor)
+        status = rng.choice(ORDER_STATUSES, n, p=ORDER_STATUS_WEIGHTS)
+        tables = rng.choice(self.table_ids, n).astype(object)
+        tables[rng.random(n) < 0.3] = None  # takeaway
+        users = rng.choice(self.customer_ids, n)
+        self._write("orders", [
+            order_ids.tolist(), users.tolist(), tables.tolist(), status.tolist(), constant(None, n),
+            constant(None, n), created_text, created_text, constant(False, n), constant(None, n),
+        ])
+
+        # 1-4 lines per order.
+        per_order = rng.integers(1, 5, n)
+        m = int(per_order.sum())
+        line_order = np.repeat(np.arange(n), per_order)
+        item_index = rng.integers(0, len(self.item_ids), m)
+        quantity = rng.integers(1, 4, m)
+        line_created = [created_text[i] for i in line_order.tolist()]
+        self._write("order_items", [
+            self._ids("order_items", m).tolist(), order_ids[line_order].tolist(), self.item_ids[item_index].tolist(),
+            quantity.tolist(), line_created, line_created, constant(False, m), constant(None, m),
+        ])
+
+        # One payment per paid order, for the order total.
+        totals = np.bincount(line_order, weights=self.item_prices[item_index] * quantity, minlength=n)
+        paid = np.flatnonzero(status == "paid")
+        p = len(paid)
+        paid_at = timestamps(created[paid] + np.timedelta64(30, "m"), self.vendor)
+        self._write("payments", [
+            self._ids("payments", p).tolist(), order_ids[paid].tolist(), np.round(totals[paid], 2).tolist(),
+            constant("paid", p), rng.choice(["cash", "online"], p, p=[0.4, 0.6]).tolist(), paid_at,
+            paid_at, paid_at, constant(False, p), constant(None, p),
+        ])
+
+        # Feedback on a share of the paid orders, about one of their lines.
+        rated = paid[rng.random(p) < self.feedback_rate]
+        f = len(rated)
+        first_line = np.concatenate(([0], np.cumsum(per_order)[:-1]))
+        line = first_line[rated] + (rng.random(f) * per_order[rated]).astype(np.int64)
+        feedback_at = timestamps(created[rated] + np.timedelta64(2, "h"), self.vendor)
+        self._write("feedback", [
+            self._ids("feedback", f).tolist(), users[rated].tolist(), order_ids[rated].tolist(),
+            self.item_ids[item_index[line]].tolist(), constant("restaurant and cafe", f),
+            rng.choice(RATINGS, f).tolist(),
+            *(rng.choice(SATISFACTION, f).tolist() for _ in range(5)),
+            constant("", f), constant("", f), rng.choice(["pending", "reviewed"], f).tolist(),
+            constant(None, f), constant("", f), feedback_at, feedback_at, constant(False, f), constant(None, f),
+        ])
+
+    def reservations(self, total):
+        for start in range(0, total, self.chunk_size):
+            n = min(self.chunk_size, total - start)
+            with transaction.atomic(using=self.writers["reservations"].using):
+                self.reservation_chunk(n, self._times(n, start, start + n, total))
+            yield dict(self.counts)
+
+    def reservation_chunk(self, n, created):
+        rng = self.rng
+        ids = self._ids("reservations", n)
+        created_text = timestamps(created, self.vendor)
+        # Booked for up to two weeks after they were made.
+        day = (created + rng.integers(0, 14, n).astype("timedelta64[D]")).astype("datetime64[D]")
+        slot = rng.integers(20, 43, n) * 30  # 10:00 .. 21:00 in minutes
+        times = [f"{minutes // 60:02d}:{minutes % 60:02d}:00" for minutes in slot.tolist()]
+        table = rng.integers(0, len(self.table_ids), n)
+        birthday = rng.random(n) < 0.1
+        self._write("reservations", [
+            ids.tolist(), [f"Guest {i}" for i in ids.tolist()], [f"0912{i % 10 ** 7:07d}" for i in ids.tolist()],
+            np.datetime_as_string(day).tolist(), times, rng.integers(1, 9, n).tolist(),
+            self.table_types[table].tolist(), constant(None, n),
+            np.where(birthday, "birthday", "normal").tolist(), birthday.tolist(),
+            (birthday & (rng.random(n) < 0.5)).tolist(), rng.choice(DURATIONS, n).tolist(),
+            self.table_ids[table].tolist(), (rng.random(n) < 0.6).tolist(),
+            created_text, created_text, constant(False, n), constant(None, n),
+        ])
+
+    def finish(self):
+        for writer in self.writers.values():
+            writer.reset_sequence()
@@ -0,0 +1,78 @@
+# The request mix. A scenario is one user journey: a function that makes
+# its requests through `client.call(name, method, path, user=..., data=...)`
+# and gets back (status, parsed JSON or None). Request names group the
+# timings in the report, so ids are kept out of them.
+
+##################################################################################
+#                                  Scenarios                                     #
+##################################################################################
+
+def browse_menu(client, data, rng):
+    """An anonymous guest looking at the menu and the landing page."""
+    client.call("venue", "GET", "/info/venue/")
+    client.call("categories", "GET", "/menu/categories/")
+    client.call("menu items", "GET", f"/menu/menu-items/?page={rng.randint(1, 4)}")
+    category_id = rng.choice(data.category_ids)
+    client.call("items by category", "GET", f"/menu/categories/{category_id}/menu-items/")
+    extra = rng.choice([
+        ("active items", "/menu/menu-items/active/"),
+        ("special offers", "/menu/special-offers/"),
+        ("top selling", "/menu/menu-items/top-selling/?window=30d"),
+    ])
+    client.call(extra[0], "GET", extra[1])
+
+
+def place_order(client, data, rng, user=None):
+    """A customer ordering a few items, then checking their order history."""
+    user = user or rng.choice(data.customers)
+    items = [
+        {"menu_item_id": menu_item_id, "quantity": rng.randint(1, 3)}
+        for menu_item_id in rng.sample(data.menu_item_ids, k=min(len(data.menu_item_ids), rng.randint(1, 3)))
+    ]
+    status, body = client.call(
+        "order create", "POST", "/orders/orders/", user=user,
+        data={"items": items, "table": rng.choice(data.table_ids)},
+    )
+    client.call("order history", "GET", "/orders/orders/history/", user=user)
+    return body if status == 201 else None
+
+
+def cashier_payment(client, data, rng):
+    """Order placed by a customer, then paid at the register."""
+    order = place_order(client, data, rng)
+    if not order:
+        return
+    cashier = rng.choice(data.cashiers)
+    status, payment = client.call(
+        "payment create", "POST", "/orders/payments/", user=cashier,
+        data={"order_id": order["id"], "amount": str(order["total_price"]), "method": rng.choice(["cash", "online"])},
+    )
+    if status == 201:
+        client.call("payment mark paid", "PATCH", f"/orders/payments/{payment['id']}/mark-paid/", user=cashier, data={})
+
+
+def admin_reporting(client, data, rng):
+    """The manager's dashboard."""
+    admin = rng.choice(data.admins)
+    client.call("revenue by day", "GET", "/reports/revenue/?group_by=day", user=admin)
+    client.call(
+        "revenue by " + (group := rng.choice(["hour", "method", "category", "table"])),
+        "GET", f"/reports/revenue/?group_by={group}", user=admin,
+    )
+    client.call("admin feedback", "GET", "/feedback/admin/list/", user=admin)
+    client.call("total collected", "GET", "/orders/payments/total-collected/", user=admin)
+
+
+# name -> (function, weight in the default mix)
+SCENARIOS = {
+    "browse": (browse_menu, 60),
+    "order": (place_order, 20),
+    "payment": (cashier_payment, 12),
+    "reporting": (admin_reporting, 8),
+}
+
+
+def pick(rng, names):
+    """A scenario function drawn by weight among `names`."""
+    weights = [SCENARIOS[name][1] for name in names]
+    return SCENARIOS[rng.choices(names, weights=weights)[0]][0]
@@ -0,0 +1,219 @@
+# Seeded data generator for the benchmark suite. Rows are written with
+# bulk_create (no model signals), then the report rollups are rebuilt once,
+# so a dataset of a given (scale, seed) is identical from run to run.
+# Run it against a throwaway database: it adds users, tables and hours.
+
+# -------------------  Django imports   ------------------------
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+# -------------------   Apps imports ------------------------
+from feedback.models import Feedback
+from info.models import WorkingHours
+from info.choices import WeekDays
+from menu.models import Category, MenuItem
+from orders.models import Order, OrderItem, Payment
+from reservation.models import Reservation, Table
+from reporting.rollups import rebuild
+# -------------------  Other imports   ------------------------
+from dataclasses import dataclass, field
+from datetime import time, timedelta
+from decimal import Decimal
+import random
+
+PREFIX = "bench"
+PASSWORD = "bench-password"
+
+# Rows per unit of scale.
+BASE_COUNTS = {
+    "categories": 6,
+    "menu_items": 60,
+    "tables": 20,
+    "customers": 50,
+    "orders": 500,
+    "reservations": 200,
+    "feedback": 150,
+}
+HISTORY_DAYS = 90
+
+##################################################################################
+#                                   Dataset                                      #
+##################################################################################
+
+@dataclass
+class Dataset:
+    """Ids the scenarios pick from."""
+    category_ids: list = field(default_factory=list)
+    menu_item_ids: list = field(default_factory=list)
+    table_ids: list = field(default_factory=list)
+    customers: list = field(default_factory=list)
+    cashiers: list = field(default_factory=list)
+    admins: list = field(default_factory=list)
+    order_ids: list = field(default_factory=list)
+
+    @classmethod
+    def load(cls):
+        """The benchmark rows already in the database."""
+        User = get_user_model()
+        users = User.objects.filter(username__startswith=f"{PREFIX}_")
+        return cls(
+            category_ids=list(Category.objects.filter(name__startswith=f"{PREFIX} ").values_list("pk", flat=True)),
+            menu_item_ids=list(
+                MenuItem.objects.filter(category__name__startswith=f"{PREFIX} ").values_list("pk", flat=True)
+            ),
+            table_ids=list(Table.objects.filter(number__gte=1000).values_list("pk", flat=True)),
+            customers=list(users.filter(role="customer").values_list("username", flat=True)),
+            cashiers=list(users.filter(role="cashier").values_list("username", flat=True)),
+            admins=list(users.filter(role="admin").values_list("username", flat=True)),
+            order_ids=list(Order.objects.filter(user__in=users).values_list("pk", flat=True)),
+        )
+
+##################################################################################
+#                                  Generation                                    #
+##################################################################################
+
+def reset():
+    """Delete earlier benchmark rows (orders, feedback and so on cascade)."""
+    get_user_model().objects.filter(username__startswith=f"{PREFIX}_").delete()
+    Category.all_objects.filter(name__startswith=f"{PREFIX} ").delete()
+    Table.objects.filter(number__gte=1000).delete()
+
+
+def _spread(rng, now, count):
+    """`count` timestamps over the last HISTORY_DAYS days, opening hours only."""
+    return [
+        now - timedelta(days=rng.randrange(HISTORY_DAYS), hours=rng.randrange(0, 10), minutes=rng.randrange(60))
+        for _ in range(count)
+    ]
+
+
+def seed(scale=1, seed=0, batch_size=2000):
+    """
+    Create a benchmark dataset `scale` times BASE_COUNTS, reproducible for a
+    given `seed`. Returns the Dataset and the number of rows per kind.
+    """
+    rng = random.Random(seed)
+    counts = {kind: max(1, int(count * scale)) for kind, count in BASE_COUNTS.items()}
+    now = timezone.now()
+    User = get_user_model()
+    password = make_password(PASSWORD)
+
+    with transaction.atomic():
+        reset()
+        # Open around the clock, so order placement never hits closed hours.
+        existing = set(WorkingHours.objects.values_list("day", flat=True))
+        WorkingHours.objects.bulk_create(
+            WorkingHours(day=day, open_time=time(0, 0), close_time=time(23, 59))
+            for day in WeekDays.values if day not in existing
+        )
+
+        users = [
+            User(username=f"{PREFIX}_customer_{i}", email=f"{PREFIX}_customer_{i}@example.com",
+                 role="customer", password=password)
+            for i in range(counts["customers"])
+        ] + [
+            User(username=f"{PREFIX}_cashier_{i}", email=f"{PREFIX}_cashier_{i}@example.com",
+                 role="cashier", password=password)
+            for i in range(max(2, counts["customers"] // 25))
+        ] + [
+            User(username=f"{PREFIX}_admin", email=f"{PREFIX}_admin@example.com",
+                 role="admin", is_staff=True, password=password)
+        ]
+        User.objects.bulk_create(users, batch_size=batch_size)
+        customers = list(User.objects.filter(username__startswith=f"{PREFIX}_customer_").order_by("pk"))
+
+        categories = Category.objects.bulk_create(
+            Category(name=f"{PREFIX} category {i}", is_cofe=i % 2 == 0) for i in range(counts["categories"])
+        )
+        items = MenuItem.objects.bulk_create(
+            (
+                MenuItem(
+                    category=categories[i % len(categories)],
+                    name=f"{PREFIX} item {i}",
+                    description=f"Benchmark item {i}",
+                    price=Decimal(rng.randrange(40, 900) * 100),
+                    stock=10 ** 6,
+                    is_special=rng.random() < 0.1,
+                    preparation_time=timedelta(minutes=rng.randrange(2, 30)),
+                    discount_percent=rng.choice([0, 0, 0, 10, 20]),
+                )
+                for i in range(counts["menu_items"])
+            ),
+            batch_size=batch_size,
+        )
+        tables = Table.objects.bulk_create(
+            Table(number=1000 + i, capacity=rng.choice(["2", "4", "8", "10"])) for i in range(counts["tables"])
+        )
+
+        statuses = rng.choices(["paid", "confirmed", "pending", "cancelled"], weights=[70, 10, 15, 5], k=counts["orders"])
+        orders = Order.objects.bulk_create(
+            (
+                Order(user=rng.choice(customers), table=rng.choice(tables), status=status)
+                for status in statuses
+            ),
+            batch_size=batch_size,
+        )
+        # auto_now_add stamps "now" on insert; spread the orders over the history window.
+        for order, created_at in zip(orders, _spread(rng, now, len(orders))):
+            order.created_at = created_at
+        Order.objects.bulk_update(orders, ["created_at"], batch_size=batch_size)
+
+        lines, payments = [], []
+        for order in orders:
+            total = Decimal(0)
+            for menu_item in rng.sample(items, k=min(len(items), rng.randint(1, 4))):
+                quantity = rng.randint(1, 3)
+                lines.append(OrderItem(order=order, menu_item=menu_item, quantity=quantity))
+                total += menu_item.price * quantity
+            if order.status == "paid":
+                payments.append(Payment(
+                    order=order, amount=total, status="paid",
+                    method=rng.choice(["cash", "online"]), paid_at=order.created_at + timedelta(minutes=30),
+                ))
+        OrderItem.objects.bulk_create(lines, batch_size=batch_size)
+        Payment.objects.bulk_create(payments, batch_size=batch_size)
+
+        Reservation.objects.bulk_create(
+            (
+                Reservation(
+                    full_name=f"Guest {i}", phone_number=f"0912{i:07d}",
+                    date=(now + timedelta(days=rng.randrange(-30, 30))).date(),
+                    time=time(rng.randrange(10, 21), rng.choice([0, 30])),
+                    number_of_guests=rng.randint(1, 8), table_type=table.capacity, table=table,
+                    is_approved=rng.random() < 0.6,
+                )
+                for i, table in enumerate(rng.choices(tables, k=counts["reservations"]))
+            ),
+            batch_size=batch_size,
+        )
+
+        lines_by_order = {}
+        for line in lines:
+            lines_by_order.setdefault(line.order_id, []).append(line)
+        rated = rng.sample([order for order in orders if order.status == "paid"],
+                           k=min(counts["feedback"], len(payments)))
+        Feedback.objects.bulk_create(
+            (
+                Feedback(
+                    user_id=order.user_id, order=order, item_id=rng.choice(lines_by_order[order.pk]).menu_item_id,
+                    food_rating=str(rng.randint(1, 10)),
+                    service_satisfaction=rng.choice("123"), staff_behavior=rng.choice("123"),
+                    cleanliness=rng.choice("123"), preparation_time=rng.choice("123"),
+                    revisit_intent=rng.choice("123"), comment=f"Benchmark feedback {order.pk}",
+                    status=rng.choice(["pending", "reviewed"]),
+                )
+                for order in rated
+            ),
+            batch_size=batch_size,
+        )
+
+    # Rollups are maintained by signals, which bulk_create skips.
+    rebuild((now - timedelta(days=HISTORY_DAYS + 1)).date(), now.date())
+
+    created = {
+        "users": len(users), "categories": len(categories), "menu_items": len(items), "tables": len(tables),
+        "orders": len(orders), "order_items": len(lines), "payments": len(payments),
+        "reservations": counts["reservations"], "feedback": len(rated),
+    }
+    return Dataset.load(), created
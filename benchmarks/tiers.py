@@ -0,0 +1,74 @@
+# Hot menu reads through the two-tier cache (utility.cache_backends) with
+# and without its in-process tier: latency per request and calls into the
+# L2 cache (Redis round-trips) per request. Every request is a cache hit.
+
+# -------------------  Django imports   ------------------------
+from django.core.cache import caches
+from django.test import Client
+# -------------------   Apps imports ------------------------
+from utility.cache_backends import TwoTierCache
+# -------------------  Other imports   ------------------------
+from contextlib import contextmanager
+from collections import Counter
+import time
+
+PATHS = ("/menu/menu-items/", "/menu/menu-items/active/", "/menu/categories/")
+REMOTE_METHODS = ("get", "get_many", "set", "add", "delete", "has_key")
+
+
+@contextmanager
+def count_remote_calls(backend):
+    """Counts of the L2 backend's methods called in the block."""
+    remote, calls = backend.remote, Counter()
+
+    def counted(name, method):
+        def call(*args, **kwargs):
+            calls[name] += 1
+            return method(*args, **kwargs)
+        return call
+
+    for name in REMOTE_METHODS:
+        setattr(remote, name, counted(name, getattr(remote, name)))
+    try:
+        yield calls
+    finally:
+        for name in REMOTE_METHODS:
+            delattr(remote, name)
+
+
+@contextmanager
+def local_tier(backend, enabled):
+    prefixes = backend.prefixes
+    if not enabled:
+        backend.prefixes = ()
+    try:
+        yield
+    finally:
+        backend.prefixes = prefixes
+
+
+def measure(requests=1000):
+    """Per mode and path: ms per request and L2 calls per request, or None without a TwoTierCache."""
+    backend = caches["default"]
+    if not isinstance(backend, TwoTierCache):
+        return None
+    client = Client()
+    for path in PATHS:
+        client.get(path)  # fills L2 (and L1)
+    results = {}
+    for mode, enabled in (("L2 only", False), ("two-tier", True)):
+        with local_tier(backend, enabled):
+            for path in PATHS:
+                client.get(path)  # fills L1 when enabled
+                with count_remote_calls(backend) as calls:
+                    start = time.perf_counter()
+                    for _ in range(requests):
+                        response = client.get(path)
+                    seconds = time.perf_counter() - start
+                if response.status_code != 200:
+                    raise RuntimeError(f"{path} answered {response.status_code}")
+                results[mode, path] = {
+                    "ms": seconds / requests * 1000,
+                    "remote_calls": sum(calls.values()) / requests,
+                }
+    return results
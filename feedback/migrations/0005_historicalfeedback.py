@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:51
+
+import django.db.models.deletion
+import simple_history.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feedback', '0004_feedback_deleted_at_alter_feedback_created_at'),
+        ('menu', '0007_historicalmenuitem'),
+        ('orders', '0007_historicalinvoice'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HistoricalFeedback',
+            fields=[
+                ('id', models.BigIntegerField(auto_created=True, blank=True, db_index=True, verbose_name='ID')),
+                ('created_at', models.DateTimeField(blank=True, editable=False)),
+                ('updated_at', models.DateTimeField(blank=True, editable=False)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('feedback_type', models.CharField(choices=[('restaurant and cafe', 'Restaurant and cafe'), ('service', 'Service'), ('staff', 'Staff'), ('environment', 'Environment')], default='restaurant and cafe', max_length=20)),
+                ('food_rating', models.CharField(choices=[('1', '1 - Terrible'), ('2', '2 - Very Bad'), ('3', '3 - Bad'), ('4', '4 - Not Good'), ('5', '5 - Average'), ('6', '6 - Okay'), ('7', '7 - Good'), ('8', '8 - Very Good'), ('9', '9 - Excellent'), ('10', '10 - Perfect')], max_length=2)),
+                ('service_satisfaction', models.CharField(choices=[('1', 'Yes'), ('2', 'Somewhat'), ('3', 'No')], max_length=2)),
+                ('staff_behavior', models.CharField(choices=[('1', 'Yes'), ('2', 'Somewhat'), ('3', 'No')], max_length=2)),
+                ('cleanliness', models.CharField(choices=[('1', 'Yes'), ('2', 'Somewhat'), ('3', 'No')], max_length=2)),
+                ('preparation_time', models.CharField(choices=[('1', 'Yes'), ('2', 'Somewhat'), ('3', 'No')], max_length=2)),
+                ('revisit_intent', models.CharField(choices=[('1', 'Yes'), ('2', 'Somewhat'), ('3', 'No')], max_length=2)),
+                ('comment', models.TextField(blank=True)),
+                ('admin_response', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('reviewed', 'Reviewed')], default='pending', max_length=20)),
+                ('user_ip', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.CharField(blank=True, max_length=255)),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('item', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='menu.menuitem')),
+                ('order', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='orders.order')),
+                ('user', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'historical Feedback',
+                'verbose_name_plural': 'historical Feedbacks',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:09
+
+import django.db.models.manager
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feedback', '0005_historicalfeedback'),
+        ('menu', '0009_alter_category_managers_alter_menuitem_managers_and_more'),
+        ('orders', '0009_alter_invoice_managers_alter_order_managers_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='feedback',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='feedback',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['status', 'item'], name='feedback_live_status_item'),
+        ),
+    ]
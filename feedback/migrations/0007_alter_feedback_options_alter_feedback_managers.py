@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:49
+
+import django.db.models.manager
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feedback', '0006_alter_feedback_managers_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='feedback',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects', 'verbose_name': 'Feedback', 'verbose_name_plural': 'Feedbacks'},
+        ),
+        migrations.AlterModelManagers(
+            name='feedback',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
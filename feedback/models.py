@@ -1,10 +1,12 @@
 # -------------------   Django imports ------------------------
 from django.db import models
+from django.db.models import Q
 from django.conf import settings
 # -------------------   Apps imports ------------------------
 from menu.models import MenuItem
 from orders.models import Order
 from utility.models import BaseModel
+from simple_history.models import HistoricalRecords
 from .choices import (
     SatisfactionChoices,
     FoodRatingChoices,
@@ -40,10 +42,15 @@ class Feedback(BaseModel):
         )
     user_ip = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.CharField(max_length=255, blank=True)
+    history = HistoricalRecords()
 
-    class Meta:
+    class Meta(BaseModel.Meta):
         verbose_name = "Feedback"
         verbose_name_plural = "Feedbacks"
+        indexes = [
+            # Moderation queues and per-item ratings over live feedback only.
+            models.Index(fields=['status', 'item'], condition=Q(is_deleted=False), name='feedback_live_status_item'),
+        ]
 
     def __str__(self):
         return f"Feedback by {self.user} on {self.item} [{self.status}]"
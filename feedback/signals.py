@@ -0,0 +1,17 @@
+# -------------------  Django imports   ------------------------
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+# -------------------   Apps imports ------------------------
+from utility.httpcache import bump_data_version
+from .models import Feedback
+# -------------------  Other imports   ------------------------
+from functools import partial
+
+# ----------------------- Cached feedback lists -------------------
+
+@receiver(post_save, sender=Feedback)
+@receiver(post_delete, sender=Feedback)
+def bump_feedback_data(sender, **kwargs):
+    """Feedback lists are cached per caller under this data version (views.cache_per_user)."""
+    transaction.on_commit(partial(bump_data_version, Feedback))
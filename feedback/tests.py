@@ -0,0 +1,58 @@
+# -------------------  Django imports   ------------------------
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+# -------------------  DRF imports   ------------------------
+from rest_framework.test import APITestCase
+# -------------------   Apps imports ------------------------
+from menu.models import Category, MenuItem
+from orders.models import Order
+from .models import Feedback
+# -------------------  Other imports   ------------------------
+from datetime import datetime, timezone as dt_timezone
+
+##################################################################################
+#                     Compiled reader vs FeedbackSerializer                      #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None)
+class FeedbackReaderTests(APITestCase):
+    """AdminFeedbackList renders the same JSON through the compiled reader as through the serializer."""
+
+    def setUp(self):
+        admin = get_user_model().objects.create_user("admin", password="secret-pass-1", is_staff=True)
+        self.client.force_authenticate(admin)
+        customer = get_user_model().objects.create_user("customer", password="secret-pass-2")
+        item = MenuItem.objects.create(category=Category.objects.create(name="Coffee"), name="Mocha", price="5")
+        order = Order.objects.create(user=customer)
+        ratings = dict(
+            food_rating="8", service_satisfaction="1", staff_behavior="2", cleanliness="1",
+            preparation_time="3", revisit_intent="1",
+        )
+        Feedback.objects.create(user=customer, order=order, item=item, comment="Great", **ratings)
+        Feedback.objects.create(
+            user=customer, order=order, item=item, feedback_type="service", admin_response="Thanks",
+            user_ip="10.0.0.7", user_agent="curl/8", **ratings,
+        )
+        Feedback.objects.create(user=customer, order=order, item=item, **ratings).delete()
+        # Whole seconds: the serializer prints no microseconds for them.
+        Feedback.objects.filter(feedback_type="service").update(
+            updated_at=datetime(2025, 1, 5, 10, 30, tzinfo=dt_timezone.utc)
+        )
+
+    def get(self, compiled):
+        cache.clear()
+        with override_settings(COMPILED_READERS=compiled):
+            response = self.client.get("/feedback/admin/list/")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_admin_feedback_list(self):
+        expected = self.get(compiled=False)
+        self.assertEqual(expected["count"], 2)
+        self.assertEqual(self.get(compiled=True), expected)
+
+    def test_admin_feedback_list_in_other_time_zone(self):
+        with timezone.override("Asia/Tehran"):
+            self.assertEqual(self.get(compiled=True), self.get(compiled=False))
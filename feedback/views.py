@@ -4,13 +4,14 @@ from rest_framework.permissions import IsAuthenticated
 # -------------------  DRF imports   ------------------------
 from django.conf import settings
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from django.db.models import Avg
 # -------------------   Apps imports ------------------------
 from .models import Feedback
 from .serializers import FeedbackSerializer
 from menu.permissions import IsAdminOnly
-from utility.mixins import SoftDeleteMixin, RestoreMixin
+from utility.mixins import CompiledListMixin, SoftDeleteMixin, RestoreMixin
+from utility.views import HistoryListView
+from utility.httpcache import cache_per_user
 
 
 CACHE_TTL = getattr(settings, 'CACHE_TTL', 60*5)
@@ -19,7 +20,7 @@ CACHE_TTL = getattr(settings, 'CACHE_TTL', 60*5)
 #                              Base Feedback View                                #
 ##################################################################################
 
-class BaseFeedbackView(generics.GenericAPIView):
+class BaseFeedbackView(SoftDeleteMixin, RestoreMixin, generics.GenericAPIView):
     """
     Base view for all Feedback-related views.
     Includes soft delete, restore, and caching.
@@ -31,30 +32,18 @@ class BaseFeedbackView(generics.GenericAPIView):
     def get_queryset(self):
         return self.queryset.filter(is_deleted=False)
 
-    def perform_destroy(self, instance):
-        """
-        Soft delete an instance.
-        """
-        SoftDeleteMixin.perform_destroy(self, instance)
-
-    def perform_restore(self, instance):
-        """
-        Restore a soft-deleted instance.
-        """
-        RestoreMixin.perform_restore(self, instance)
-
 
 ##################################################################################
 #                              Admin Views                                       #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
-class AdminFeedbackList(BaseFeedbackView, generics.ListAPIView):
+@method_decorator(cache_per_user(Feedback, ttl=CACHE_TTL), name='get')
+class AdminFeedbackList(CompiledListMixin, BaseFeedbackView, generics.ListAPIView):
     """List all feedbacks (Admin only)."""
     permission_classes = [IsAdminOnly]
 
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_per_user(Feedback, ttl=CACHE_TTL), name='get')
 class FeedbackByStatus(BaseFeedbackView, generics.ListAPIView):
     """Filter feedbacks by status (PENDING, REVIEWED) for admin."""
     permission_classes = [IsAdminOnly]
@@ -66,7 +55,7 @@ class FeedbackByStatus(BaseFeedbackView, generics.ListAPIView):
         return super().get_queryset()
 
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_per_user(Feedback, ttl=CACHE_TTL), name='get')
 class FeedbackByType(BaseFeedbackView, generics.ListAPIView):
     """Filter feedbacks by type (Service, Staff, Environment) for admin."""
     permission_classes = [IsAdminOnly]
@@ -107,17 +96,14 @@ class ExportFeedbacks(BaseFeedbackView, generics.ListAPIView):
     permission_classes = [IsAdminOnly]
 
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
-class FeedbackHistoryView(BaseFeedbackView, generics.ListAPIView):
+@method_decorator(cache_per_user(Feedback, ttl=CACHE_TTL), name='get')
+class FeedbackHistoryView(HistoryListView):
     """
     List all historical records of feedbacks (Admin only).
     Uses django-simple-history.
     """
+    model = Feedback
     permission_classes = [IsAdminOnly]
-
-    def get_queryset(self):
-        # Access history from simple_history
-        return Feedback.history.all()
     
 ##################################################################################
 #                              User Views                                        #
@@ -2,7 +2,7 @@
 from django.contrib import admin
 from simple_history.admin import SimpleHistoryAdmin
 # -------------------   Apps imports ------------------------
-from .models import AboutUs, ContactUs, WorkingHours
+from .models import AboutUs, ContactUs, WorkingHours, HolidayOverride
 
 #############################################
 #                ‌Base Admin                 #
@@ -53,7 +53,20 @@ class WorkingHoursAdmin(SimpleHistoryAdmin, BaseAdmin):
     ordering = ['day']
     list_filter = ['day']
     readonly_fields = BaseAdmin.readonly_fields + ["history"]
+
+#############################################
+#            HolidayOverride Admin          #
+#############################################
+
+class HolidayOverrideAdmin(SimpleHistoryAdmin, BaseAdmin):
+    list_display = ['date', 'is_closed', 'open_time', 'close_time', 'note']
+    search_fields = ['note']
+    ordering = ['date']
+    list_filter = ['is_closed']
+    date_hierarchy = 'date'
+    readonly_fields = BaseAdmin.readonly_fields + ["history"]
     
 admin.site.register(AboutUs, AboutUsAdmin)
 admin.site.register(ContactUs, ContactUsAdmin)
-admin.site.register(WorkingHours, WorkingHoursAdmin)
\ No newline at end of file
+admin.site.register(WorkingHours, WorkingHoursAdmin)
+admin.site.register(HolidayOverride, HolidayOverrideAdmin)
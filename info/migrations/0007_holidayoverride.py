@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:06
+
+import django.db.models.deletion
+import simple_history.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('info', '0006_alter_aboutus_options_alter_contactus_options_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HistoricalHolidayOverride',
+            fields=[
+                ('id', models.BigIntegerField(auto_created=True, blank=True, db_index=True, verbose_name='ID')),
+                ('created_at', models.DateTimeField(blank=True, editable=False)),
+                ('updated_at', models.DateTimeField(blank=True, editable=False)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('date', models.DateField(db_index=True, verbose_name='Date')),
+                ('is_closed', models.BooleanField(default=True, verbose_name='Closed all day')),
+                ('open_time', models.TimeField(blank=True, null=True, verbose_name='Opening Time')),
+                ('close_time', models.TimeField(blank=True, null=True, verbose_name='Closing Time')),
+                ('note', models.CharField(blank=True, max_length=150, verbose_name='Note')),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'historical Holiday Override',
+                'verbose_name_plural': 'historical Holiday Overrides',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='HolidayOverride',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('date', models.DateField(unique=True, verbose_name='Date')),
+                ('is_closed', models.BooleanField(default=True, verbose_name='Closed all day')),
+                ('open_time', models.TimeField(blank=True, null=True, verbose_name='Opening Time')),
+                ('close_time', models.TimeField(blank=True, null=True, verbose_name='Closing Time')),
+                ('note', models.CharField(blank=True, max_length=150, verbose_name='Note')),
+            ],
+            options={
+                'verbose_name': 'Holiday Override',
+                'verbose_name_plural': 'Holiday Overrides',
+                'ordering': ['date'],
+                'constraints': [models.CheckConstraint(condition=models.Q(('is_closed', True), models.Q(('close_time__gt', models.F('open_time')), ('open_time__isnull', False)), _connector='OR'), name='valid_holiday_override')],
+            },
+        ),
+    ]
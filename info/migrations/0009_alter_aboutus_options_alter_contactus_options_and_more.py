@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:49
+
+import django.db.models.manager
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('info', '0008_alter_aboutus_managers_alter_contactus_managers_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='aboutus',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects', 'ordering': ['-created_at'], 'verbose_name': 'About Us', 'verbose_name_plural': 'About Us Sections'},
+        ),
+        migrations.AlterModelOptions(
+            name='contactus',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects', 'ordering': ['-created_at'], 'verbose_name': 'Contact Us', 'verbose_name_plural': 'Contact Information'},
+        ),
+        migrations.AlterModelOptions(
+            name='holidayoverride',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects', 'ordering': ['date'], 'verbose_name': 'Holiday Override', 'verbose_name_plural': 'Holiday Overrides'},
+        ),
+        migrations.AlterModelOptions(
+            name='workinghours',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects', 'ordering': ['day'], 'verbose_name': 'Working Hour', 'verbose_name_plural': 'Working Hours'},
+        ),
+        migrations.AlterModelManagers(
+            name='aboutus',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='contactus',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='holidayoverride',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='workinghours',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -33,7 +33,7 @@ class AboutUs(BaseModel):
     def __repr__(self):
         return f"<AboutUs title='{self.title}'>"
        
-    class Meta:
+    class Meta(BaseModel.Meta):
         verbose_name = "About Us"
         verbose_name_plural = "About Us Sections"
         ordering = ["-created_at"]
@@ -63,7 +63,7 @@ class ContactUs(BaseModel):
     def __repr__(self):
         return f"<ContactUs phone_number='{self.phone_number}'>"
     
-    class Meta:
+    class Meta(BaseModel.Meta):
         verbose_name = "Contact Us"
         verbose_name_plural = "Contact Information"
         ordering = ["-created_at"]
@@ -93,7 +93,7 @@ class WorkingHours(BaseModel):
     def __repr__(self):
         return f"<WorkingHours day='{self.day}' open='{self.open_time}' close='{self.close_time}'>"
     
-    class Meta:
+    class Meta(BaseModel.Meta):
         verbose_name = "Working Hour"
         verbose_name_plural = "Working Hours"
         ordering = ["day"]
@@ -118,3 +118,41 @@ class WorkingHours(BaseModel):
         """Ensure valid open and close times."""
         if self.open_time >= self.close_time:
             raise ValidationError("Closing time must be after opening time.")
+
+##################################################################################
+#                           HolidayOverride Model                                #
+##################################################################################
+
+class HolidayOverride(BaseModel):
+    """
+    Replaces the weekly working hours on one date: closed all day, or open
+    with special hours.
+    """
+    date = models.DateField(unique=True, verbose_name="Date")
+    is_closed = models.BooleanField(default=True, verbose_name="Closed all day")
+    open_time = models.TimeField(null=True, blank=True, verbose_name="Opening Time")
+    close_time = models.TimeField(null=True, blank=True, verbose_name="Closing Time")
+    note = models.CharField(max_length=150, blank=True, verbose_name="Note")
+    history = HistoricalRecords(inherit=True)
+
+    def __str__(self):
+        if self.is_closed:
+            return f"{self.date}: closed"
+        return f"{self.date}: {self.open_time.strftime('%H:%M')} - {self.close_time.strftime('%H:%M')}"
+
+    class Meta(BaseModel.Meta):
+        verbose_name = "Holiday Override"
+        verbose_name_plural = "Holiday Overrides"
+        ordering = ["date"]
+        constraints = [
+            models.CheckConstraint(
+                check=Q(is_closed=True) | Q(open_time__isnull=False, close_time__gt=F('open_time')),
+                name='valid_holiday_override'
+            ),
+        ]
+
+    def clean(self):
+        """Special hours need both times, in order."""
+        if not self.is_closed and (not self.open_time or not self.close_time or self.open_time >= self.close_time):
+            raise ValidationError("Open days need an opening time before the closing time.")
+
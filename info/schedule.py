@@ -0,0 +1,165 @@
+# -------------------  Django imports   ------------------------
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+# -------------------   Apps imports ------------------------
+from .models import WorkingHours, HolidayOverride
+from utility.httpcache import fresh_read_scope, new_version
+# -------------------  Other imports   ------------------------
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
+import threading
+
+SCHEDULE_VERSION_KEY = "info:schedule:version"
+
+# WeekDays values -> datetime.weekday()
+WEEKDAY_NUMBERS = {"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6}
+
+##################################################################################
+#                              Compiled schedule                                 #
+##################################################################################
+
+def _minutes(value):
+    return value.hour * 60 + value.minute
+
+
+class Schedule:
+    """
+    Opening hours compiled into per-weekday interval lists (minutes since
+    midnight) plus per-date holiday overrides. Lookups touch one day's
+    handful of intervals, so they do not depend on the amount of data.
+    Naive datetimes are taken as local time. `has_hours` is False while the
+    weekly table is the DEFAULT_OPENING_HOURS fallback.
+    """
+
+    def __init__(self, weekly, overrides, version=None, has_hours=True):
+        self.weekly = weekly          # {weekday: [(open_minute, close_minute), ...]}
+        self.overrides = overrides    # {date: [(open_minute, close_minute), ...]}, [] = closed
+        self.version = version
+        self.has_hours = has_hours
+
+    def intervals(self, day):
+        if day in self.overrides:
+            return self.overrides[day]
+        return self.weekly.get(day.weekday(), [])
+
+    def _local(self, at):
+        if timezone.is_aware(at):
+            return timezone.localtime(at)
+        return timezone.make_aware(at)
+
+    def _at(self, day, minute):
+        return timezone.make_aware(datetime.combine(day, time()) + timedelta(minutes=minute))
+
+    def interval_at(self, at):
+        """(opens, closes) aware datetimes of the opening that contains `at`, or None."""
+        at = self._local(at)
+        minute = _minutes(at)
+        intervals = self.intervals(at.date())
+        index = bisect_right(intervals, (minute, float("inf"))) - 1
+        if index >= 0 and intervals[index][0] <= minute < intervals[index][1]:
+            start, end = intervals[index]
+            return self._at(at.date(), start), self._at(at.date(), end)
+        return None
+
+    def is_open(self, at=None):
+        return self.interval_at(at or timezone.now()) is not None
+
+    def closes_at(self, at):
+        """Whether an opening ends exactly at `at` (is_open() is False there)."""
+        at = self._local(at)
+        if at.second or at.microsecond:
+            return False
+        return any(end == _minutes(at) for _, end in self.intervals(at.date()))
+
+    def next_open(self, at=None, horizon_days=366):
+        """`at` itself if open, else the next opening time (None if never)."""
+        at = self._local(at or timezone.now())
+        if self.interval_at(at):
+            return at
+        minute = _minutes(at)
+        for offset in range(horizon_days + 1):
+            day = at.date() + timedelta(days=offset)
+            for start, _ in self.intervals(day):
+                if offset or start > minute:
+                    return self._at(day, start)
+        return None
+
+    def as_dict(self, days=7):
+        """Compiled schedule for clients: the weekly table and the next `days` days."""
+        names = {number: name for name, number in WEEKDAY_NUMBERS.items()}
+        today = timezone.localdate()
+
+        def fmt(intervals):
+            return [[f"{start // 60:02d}:{start % 60:02d}", f"{end // 60:02d}:{end % 60:02d}"] for start, end in intervals]
+
+        now = timezone.now()
+        next_open = self.next_open(now)
+        return {
+            "version": self.version,
+            "weekly": {names[number]: fmt(self.weekly.get(number, [])) for number in range(7)},
+            "days": {
+                (today + timedelta(days=offset)).isoformat(): fmt(self.intervals(today + timedelta(days=offset)))
+                for offset in range(days)
+            },
+            "is_open": self.is_open(now),
+            "next_open": next_open.isoformat() if next_open else None,
+        }
+
+##################################################################################
+#                         Building & version invalidation                        #
+##################################################################################
+
+def default_weekly():
+    """Hours used until WorkingHours rows exist (settings.DEFAULT_OPENING_HOURS)."""
+    opens, closes = getattr(settings, "DEFAULT_OPENING_HOURS", ("10:00", "22:00"))
+    interval = (_minutes(time.fromisoformat(opens)), _minutes(time.fromisoformat(closes)))
+    return {number: [interval] for number in range(7)}
+
+
+def build_schedule(version=None):
+    weekly = {}
+    for day, open_time, close_time in WorkingHours.objects.filter(is_deleted=False).values_list(
+        "day", "open_time", "close_time"
+    ):
+        weekly.setdefault(WEEKDAY_NUMBERS[day], []).append((_minutes(open_time), _minutes(close_time)))
+    has_hours = bool(weekly)
+    if not has_hours:
+        weekly = default_weekly()
+
+    overrides = {}
+    for date, is_closed, open_time, close_time in HolidayOverride.objects.filter(
+        is_deleted=False, date__gte=timezone.localdate() - timedelta(days=1)
+    ).values_list("date", "is_closed", "open_time", "close_time"):
+        overrides[date] = [] if is_closed else [(_minutes(open_time), _minutes(close_time))]
+
+    for intervals in list(weekly.values()) + list(overrides.values()):
+        intervals.sort()
+    return Schedule(weekly, overrides, version, has_hours)
+
+
+_lock = threading.Lock()
+_compiled = None
+
+
+def bump_schedule_version():
+    """Called when hours or overrides change; every process rebuilds on next use."""
+    cache.set(SCHEDULE_VERSION_KEY, new_version(), None)
+
+
+def get_schedule():
+    """
+    The process-local compiled schedule. One cache read per call checks the
+    shared version; the database is only queried after a change.
+    """
+    global _compiled
+    version = cache.get(SCHEDULE_VERSION_KEY)
+    if version is None:
+        version = new_version()
+        cache.add(SCHEDULE_VERSION_KEY, version, None)
+        version = cache.get(SCHEDULE_VERSION_KEY, version)
+    compiled = _compiled
+    if compiled is None or compiled.version != version:
+        with _lock, fresh_read_scope([version]):
+            _compiled = compiled = build_schedule(version)
+    return compiled
@@ -1,7 +1,7 @@
 # -------------------  DRF imports   ------------------------
 from rest_framework import serializers
 # -------------------   Apps imports ------------------------
-from .models import AboutUs, ContactUs, WorkingHours
+from .models import AboutUs, ContactUs, WorkingHours, HolidayOverride
 from utility.serializers import BaseSerializer
 
 ##################################################################################
@@ -40,4 +40,24 @@ class WorkingHoursSerializer(BaseSerializer):
         close_time = attrs.get('close_time')
         if open_time and close_time and open_time >= close_time:
             raise serializers.ValidationError("Closing time must be after opening time.")
-        return attrs
\ No newline at end of file
+        return attrs
+
+##################################################################################
+#                      HolidayOverrideSerializer serializers                     #
+##################################################################################
+
+class HolidayOverrideSerializer(BaseSerializer):
+    class Meta:
+        model = HolidayOverride
+        fields = '__all__'
+        read_only_fields = ('id', 'created_at', 'updated_at', 'history',)
+
+    def validate(self, attrs):
+        """Special opening hours need both times, in order."""
+        is_closed = attrs.get('is_closed', getattr(self.instance, 'is_closed', True))
+        open_time = attrs.get('open_time', getattr(self.instance, 'open_time', None))
+        close_time = attrs.get('close_time', getattr(self.instance, 'close_time', None))
+        if not is_closed and (not open_time or not close_time or open_time >= close_time):
+            raise serializers.ValidationError("Open days need an opening time before the closing time.")
+        return attrs
+
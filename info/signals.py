@@ -0,0 +1,32 @@
+# -------------------  Django imports   ------------------------
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+# -------------------   Apps imports ------------------------
+from .models import AboutUs, ContactUs, WorkingHours, HolidayOverride
+from .schedule import bump_schedule_version
+from .venue import bump_venue_version
+from utility.httpcache import bump_data_version
+
+@receiver(post_save, sender=WorkingHours)
+@receiver(post_delete, sender=WorkingHours)
+@receiver(post_save, sender=HolidayOverride)
+@receiver(post_delete, sender=HolidayOverride)
+def invalidate_schedule(sender, **kwargs):
+    """Every process recompiles its schedule index on next use."""
+    transaction.on_commit(bump_schedule_version)
+
+
+@receiver(post_save, sender=AboutUs)
+@receiver(post_delete, sender=AboutUs)
+@receiver(post_save, sender=ContactUs)
+@receiver(post_delete, sender=ContactUs)
+@receiver(post_save, sender=WorkingHours)
+@receiver(post_delete, sender=WorkingHours)
+@receiver(post_save, sender=HolidayOverride)
+@receiver(post_delete, sender=HolidayOverride)
+def invalidate_venue(sender, **kwargs):
+    """The venue payload embeds every info model, so any change rebuilds it."""
+    transaction.on_commit(bump_venue_version)
+    # Cached list/detail responses (utility.httpcache) of this model only.
+    transaction.on_commit(lambda: bump_data_version(sender))
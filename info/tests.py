@@ -0,0 +1,80 @@
+# -------------------  Django imports   ------------------------
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+# -------------------  DRF imports   ------------------------
+from rest_framework.test import APITestCase
+# -------------------   Apps imports ------------------------
+from .models import AboutUs, WorkingHours
+from .schedule import SCHEDULE_VERSION_KEY, get_schedule
+# -------------------  Other imports   ------------------------
+from datetime import time
+import msgpack
+
+##################################################################################
+#                              Compiled schedule                                 #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None, DEFAULT_OPENING_HOURS=("10:00", "22:00"))
+class ScheduleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_version_key_is_read_from_the_local_tier(self):
+        # get_schedule() reads it on every call: it must not cost a Redis round trip.
+        self.assertIsNotNone(cache.local_for(SCHEDULE_VERSION_KEY))
+
+    def test_fallback_hours_until_working_hours_exist(self):
+        schedule = get_schedule()
+        self.assertFalse(schedule.has_hours)
+        self.assertEqual(schedule.weekly[0], [(10 * 60, 22 * 60)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            WorkingHours.objects.create(day="mon", open_time=time(8), close_time=time(12))
+        schedule = get_schedule()
+        self.assertTrue(schedule.has_hours)
+        self.assertEqual(schedule.weekly, {0: [(8 * 60, 12 * 60)]})
+
+##################################################################################
+#                                Venue payload                                   #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None)
+class VenueTests(APITestCase):
+    """/info/venue/: negotiated like the other endpoints, revalidated by ETag."""
+
+    def setUp(self):
+        cache.clear()
+        AboutUs.objects.create(title="BCafe", content="Coffee since 2020.")
+        self.etag = self.client.get("/info/venue/")["ETag"]
+
+    def status(self, if_none_match):
+        return self.client.get("/info/venue/", headers={"if-none-match": if_none_match}).status_code
+
+    def test_matching_etags_get_304(self):
+        for header in (self.etag, f"W/{self.etag}", f'"other", {self.etag}', "*"):
+            self.assertEqual(self.status(header), 304, header)
+
+    def test_other_etags_get_the_payload(self):
+        for header in ('"other"', f"{self.etag}x", self.etag.replace('"', "")):
+            self.assertEqual(self.status(header), 200, header)
+
+    def test_write_changes_the_etag(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            AboutUs.objects.create(title="Terrace", content="Open in summer.")
+        response = self.client.get("/info/venue/", headers={"if-none-match": self.etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sorted(row["title"] for row in response.json()["about"]), ["BCafe", "Terrace"])
+
+    def test_msgpack_is_negotiated(self):
+        json_response = self.client.get("/info/venue/")
+        response = self.client.get("/info/venue/", headers={"accept": "application/msgpack"})
+
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertIn("Accept", response["Vary"])
+        self.assertNotEqual(response["ETag"], self.etag)
+        self.assertEqual(msgpack.unpackb(response.content), json_response.json())
+        self.assertEqual(
+            self.client.get("/info/venue/", headers={"accept": "application/msgpack", "if-none-match": self.etag}).status_code,
+            200,
+        )
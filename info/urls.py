@@ -2,7 +2,9 @@ from django.urls import path
 from .views import (
     AboutUsList, AboutUsDetail, AboutUsRestore, AboutUsHistory,
     ContactUsList, ContactUsDetail, ContactUsRestore, ContactUsHistory,
-    WorkingHoursList, WorkingHoursDetail, WorkingHoursRestore, WorkingHoursHistory
+    WorkingHoursList, WorkingHoursDetail, WorkingHoursRestore, WorkingHoursHistory,
+    HolidayOverrideList, HolidayOverrideDetail, HolidayOverrideRestore, HolidayOverrideHistory,
+    ScheduleView, VenueView
 )
 
 urlpatterns = [
@@ -23,4 +25,16 @@ urlpatterns = [
     path('working-hours/<int:pk>/', WorkingHoursDetail.as_view(), name='working-hours-detail'),
     path('working-hours/restore/<int:pk>/', WorkingHoursRestore.as_view(), name='working-hours-restore'),
     path('working-hours/history/', WorkingHoursHistory.as_view(), name='working-hours-history'),
+
+    # Holiday Overrides
+    path('holidays/', HolidayOverrideList.as_view(), name='holiday-list'),
+    path('holidays/<int:pk>/', HolidayOverrideDetail.as_view(), name='holiday-detail'),
+    path('holidays/restore/<int:pk>/', HolidayOverrideRestore.as_view(), name='holiday-restore'),
+    path('holidays/history/', HolidayOverrideHistory.as_view(), name='holiday-history'),
+
+    # Compiled opening schedule
+    path('schedule/', ScheduleView.as_view(), name='schedule'),
+
+    # Aggregated landing page payload
+    path('venue/', VenueView.as_view(), name='venue'),
 ]
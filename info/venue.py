@@ -0,0 +1,67 @@
+# -------------------  Django imports   ------------------------
+from django.core.cache import cache
+from django.utils import timezone
+# -------------------   Apps imports ------------------------
+from .models import AboutUs, ContactUs, WorkingHours
+from .serializers import AboutUsSerializer, ContactUsSerializer, WorkingHoursSerializer
+from .schedule import get_schedule
+from utility.httpcache import fresh_read_scope, new_version
+
+VENUE_VERSION_KEY = "info:venue:version"
+VENUE_PAYLOAD_KEY = "info:venue:{version}:{day}:{format}"
+
+##################################################################################
+#                           Aggregated venue payload                             #
+##################################################################################
+
+def venue_version():
+    version = cache.get(VENUE_VERSION_KEY)
+    if version is None:
+        cache.add(VENUE_VERSION_KEY, new_version(), None)
+        version = cache.get(VENUE_VERSION_KEY)
+    return version
+
+
+def bump_venue_version():
+    """Called when any info model changes; the next request rebuilds the payload."""
+    cache.set(VENUE_VERSION_KEY, new_version(), None)
+
+
+def build_venue(version, day):
+    """About, contact and hours sections plus the compiled schedule."""
+    schedule = get_schedule().as_dict()
+    # Live fields change by the minute; /info/schedule/ serves them.
+    schedule.pop("is_open")
+    schedule.pop("next_open")
+    data = {
+        "version": version,
+        "date": day.isoformat(),
+        "about": AboutUsSerializer(AboutUs.objects.filter(is_deleted=False), many=True).data,
+        "contact": ContactUsSerializer(ContactUs.objects.filter(is_deleted=False), many=True).data,
+        "working_hours": WorkingHoursSerializer(WorkingHours.objects.filter(is_deleted=False), many=True).data,
+        "schedule": schedule,
+    }
+    return data
+
+
+def venue_etag(renderer):
+    """The ETag of the venue payload as `renderer` encodes it."""
+    return f'"{venue_version()}-{timezone.localdate():%Y%m%d}-{renderer.format}"'
+
+
+def get_venue(renderer):
+    """
+    (etag, body) of the venue payload encoded by `renderer`. The body is
+    rendered once per data version, local day (the schedule lists the
+    coming days) and format and shared through the cache, so a hit costs
+    no queries or serialization.
+    """
+    version = venue_version()
+    day = timezone.localdate()
+    key = VENUE_PAYLOAD_KEY.format(version=version, day=day.isoformat(), format=renderer.format)
+    body = cache.get(key)
+    if body is None:
+        with fresh_read_scope([version]):
+            body = renderer.render(build_venue(version, day))
+        cache.set(key, body, 60 * 60 * 24)
+    return f'"{version}-{day:%Y%m%d}-{renderer.format}"', body
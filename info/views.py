@@ -1,68 +1,56 @@
 # -------------------  Django & DRF imports   ------------------------
-from django.conf import settings
-from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 # -------------------  DRF imports   ------------------------
 from rest_framework import generics, status
 from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 # -------------------   Apps imports ------------------------
-from .models import AboutUs, ContactUs, WorkingHours
-from .serializers import AboutUsSerializer, ContactUsSerializer, WorkingHoursSerializer
+from .models import AboutUs, ContactUs, WorkingHours, HolidayOverride
+from .serializers import AboutUsSerializer, ContactUsSerializer, WorkingHoursSerializer, HolidayOverrideSerializer
+from .schedule import get_schedule
+from .venue import get_venue, venue_etag
 from .permissions import IsAdminOrReadOnly
-from utility.views import BaseAPIView
+from utility.httpcache import cache_response
+from utility.views import BaseAPIView, HistoryListView
 from utility.mixins import SoftDeleteMixin, RestoreMixin
-
-
-CACHE_TTL = getattr(settings, 'CACHE_TTL', 60*5)
+from utility.renderers import MessagePackRenderer, ORJSONRenderer
 
 
 ##################################################################################
 #                             InfoBase Views                                      #
 ##################################################################################
 
-class InfoBaseView(BaseAPIView):
+class InfoBaseView(SoftDeleteMixin, BaseAPIView):
     permission_classes = [IsAdminOrReadOnly]
 
     def get_queryset(self):
         return self.model.objects.filter(is_deleted=False)
 
-    def perform_update(self, serializer):
-        instance = serializer.save()
-        cache.delete(f'views.decorators.cache.cache_page.{self.request.get_full_path()}')
-        return instance
-
-    def perform_destroy(self, instance):
-        SoftDeleteMixin.perform_destroy(self, instance)
-        cache.delete(f'views.decorators.cache.cache_page.{self.request.get_full_path()}')
-
 # ----------------- Restore & History -----------------
 class InfoRestoreView(RestoreMixin, APIView):
     permission_classes = [IsAdminUser]
 
     def post(self, request, pk):
-        instance = self.model.objects.get(pk=pk)
+        instance = self.get_restore_object(self.model, pk)
         self.perform_restore(instance)
         return Response({"success": f"{self.model.__name__} restored"}, status=status.HTTP_200_OK)
 
-class InfoHistoryList(generics.ListAPIView):
+class InfoHistoryList(HistoryListView):
     permission_classes = [IsAdminUser]
-
-    def get_queryset(self):
-        return self.model.history.all()
     
 ##################################################################################
 #                             AboutUs Views                                      #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_response(AboutUs), name='dispatch')
 class AboutUsList(InfoBaseView, generics.ListCreateAPIView):
     model = AboutUs
     serializer_class = AboutUsSerializer
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_response(AboutUs), name='dispatch')
 class AboutUsDetail(InfoBaseView, generics.RetrieveUpdateDestroyAPIView):
     model = AboutUs
     serializer_class = AboutUsSerializer
@@ -77,12 +65,12 @@ class AboutUsHistory(InfoHistoryList):
 #                             ContactUs Views                                    #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_response(ContactUs), name='dispatch')
 class ContactUsList(InfoBaseView, generics.ListCreateAPIView):
     model = ContactUs
     serializer_class = ContactUsSerializer
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_response(ContactUs), name='dispatch')
 class ContactUsDetail(InfoBaseView, generics.RetrieveUpdateDestroyAPIView):
     model = ContactUs
     serializer_class = ContactUsSerializer
@@ -98,12 +86,12 @@ class ContactUsHistory(InfoHistoryList):
 #                             WorkingHours Views                                 #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_response(WorkingHours), name='dispatch')
 class WorkingHoursList(InfoBaseView, generics.ListCreateAPIView):
     model = WorkingHours
     serializer_class = WorkingHoursSerializer
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_response(WorkingHours), name='dispatch')
 class WorkingHoursDetail(InfoBaseView, generics.RetrieveUpdateDestroyAPIView):
     model = WorkingHours
     serializer_class = WorkingHoursSerializer
@@ -113,3 +101,66 @@ class WorkingHoursRestore(InfoRestoreView):
 
 class WorkingHoursHistory(InfoHistoryList):
     model = WorkingHours
+
+##################################################################################
+#                           HolidayOverride Views                                #
+##################################################################################
+
+@method_decorator(cache_response(HolidayOverride), name='dispatch')
+class HolidayOverrideList(InfoBaseView, generics.ListCreateAPIView):
+    model = HolidayOverride
+    serializer_class = HolidayOverrideSerializer
+
+@method_decorator(cache_response(HolidayOverride), name='dispatch')
+class HolidayOverrideDetail(InfoBaseView, generics.RetrieveUpdateDestroyAPIView):
+    model = HolidayOverride
+    serializer_class = HolidayOverrideSerializer
+
+class HolidayOverrideRestore(InfoRestoreView):
+    model = HolidayOverride
+
+class HolidayOverrideHistory(InfoHistoryList):
+    model = HolidayOverride
+
+##################################################################################
+#                              Schedule Views                                    #
+##################################################################################
+
+class ScheduleView(APIView):
+    """
+    The compiled opening schedule: weekly hours, the next 7 days with
+    holiday overrides applied, whether the cafe is open now and when it
+    opens next. Served from the in-process schedule index, not the database.
+    """
+    permission_classes = []
+
+    def get(self, request):
+        return Response(get_schedule().as_dict())
+
+
+##################################################################################
+#                                Venue View                                      #
+##################################################################################
+
+class VenueView(APIView):
+    """
+    About, contact and working hours sections plus the compiled schedule in
+    one response, so the landing page needs a single round-trip. The body is
+    pre-rendered in the negotiated format (JSON or MessagePack) and cached
+    per data version; clients revalidate with If-None-Match and get 304
+    while nothing has changed.
+    """
+    permission_classes = []
+    renderer_classes = [ORJSONRenderer, MessagePackRenderer]
+
+    def get(self, request):
+        renderer = request.accepted_renderer
+        etag = venue_etag(renderer)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            etag, body = get_venue(renderer)
+            response = HttpResponse(body, content_type=renderer.media_type)
+        response["ETag"] = etag
+        response["Cache-Control"] = "public, max-age=0, must-revalidate"
+        patch_vary_headers(response, ("Accept",))
+        return response
@@ -1,7 +1,7 @@
 # -------------------   Django imports ------------------------
 from django.contrib import admin
 # -------------------   Apps imports ------------------------
-from .models import IngredientRequest, IngredientItem
+from .models import IngredientRequest, IngredientItem, RecipeIngredient, ReorderRule
 
 #############################################
 #               Base Admin                  #
@@ -25,9 +25,9 @@ class IngredientItemInline(admin.TabularInline):
 #############################################
 
 class IngredientRequestAdmin(BaseAdmin):
-    list_display = ['id', 'chef', 'note', 'is_reviewed', 'created_at', 'updated_at']
+    list_display = ['id', 'chef', 'note', 'is_reviewed', 'is_draft', 'draft_day', 'created_at', 'updated_at']
     search_fields = ['chef__username', 'note']
-    list_filter = ['is_reviewed', 'created_at']
+    list_filter = ['is_reviewed', 'is_draft', 'created_at']
     inlines = [IngredientItemInline]
 
 #############################################
@@ -39,6 +39,25 @@ class IngredientItemAdmin(BaseAdmin):
     search_fields = ['name', 'request__chef__username']
     list_filter = ['is_approved', 'is_rejected', 'is_purchased']
 
+#############################################
+#         RecipeIngredient Admin            #
+#############################################
+
+class RecipeIngredientAdmin(BaseAdmin):
+    list_display = ['id', 'menu_item', 'name', 'quantity', 'unit']
+    search_fields = ['name', 'menu_item__name']
+
+#############################################
+#            ReorderRule Admin              #
+#############################################
+
+class ReorderRuleAdmin(BaseAdmin):
+    list_display = ['id', 'menu_item', 'chef', 'reorder_point', 'target_stock', 'is_active']
+    search_fields = ['menu_item__name', 'chef__username']
+    list_filter = ['is_active']
+
 
 admin.site.register(IngredientRequest, IngredientRequestAdmin)
 admin.site.register(IngredientItem, IngredientItemAdmin)
+admin.site.register(RecipeIngredient, RecipeIngredientAdmin)
+admin.site.register(ReorderRule, ReorderRuleAdmin)
@@ -0,0 +1,14 @@
+from django.db.models import TextChoices
+
+class Unit(TextChoices):
+    GRAM = 'g', 'Gram'
+    KILOGRAM = 'kg', 'Kilogram'
+    MILLILITRE = 'ml', 'Millilitre'
+    LITRE = 'l', 'Litre'
+    PIECE = 'pcs', 'Piece'
+    DOZEN = 'dozen', 'Dozen'
+
+class BaseUnit(TextChoices):
+    GRAM = 'g', 'Gram'
+    MILLILITRE = 'ml', 'Millilitre'
+    PIECE = 'pcs', 'Piece'
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingredient_requests', '0004_historicalingredientrequest'),
+        ('menu', '0008_salesbucket'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicalingredientrequest',
+            name='is_draft',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='ingredientrequest',
+            name='is_draft',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.CreateModel(
+            name='RecipeIngredient',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('name', models.CharField(max_length=100)),
+                ('quantity', models.DecimalField(decimal_places=3, max_digits=10)),
+                ('unit', models.CharField(blank=True, max_length=20)),
+                ('menu_item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recipe', to='menu.menuitem')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('menu_item', 'name'), name='unique_ingredient_per_recipe')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ReorderRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('reorder_point', models.PositiveIntegerField()),
+                ('target_stock', models.PositiveIntegerField()),
+                ('is_active', models.BooleanField(default=True)),
+                ('chef', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reorder_rules', to=settings.AUTH_USER_MODEL)),
+                ('menu_item', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='reorder_rule', to='menu.menuitem')),
+            ],
+            options={
+                'constraints': [models.CheckConstraint(condition=models.Q(('target_stock__gt', models.F('reorder_point'))), name='target_above_reorder_point')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ReorderSuggestion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('units', models.PositiveIntegerField()),
+                ('menu_item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reorder_suggestions', to='menu.menuitem')),
+                ('request', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reorder_suggestions', to='ingredient_requests.ingredientrequest')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('request', 'menu_item'), name='unique_suggestion_per_request')],
+            },
+        ),
+    ]
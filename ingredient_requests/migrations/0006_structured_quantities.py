@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:02
+
+from django.db import migrations, models
+
+from ingredient_requests.quantities import parse_quantity, to_base, format_quantity
+
+
+def parse_existing_quantities(apps, schema_editor):
+    """
+    Fill amount/unit from the free-form quantity text where it parses.
+    Pages by pk: no cursor stays open on the table while a page is updated.
+    """
+    IngredientItem = apps.get_model('ingredient_requests', 'IngredientItem')
+    unparsed = IngredientItem.objects.filter(amount__isnull=True).order_by('pk')
+    last = 0
+    while True:
+        page = list(unparsed.filter(pk__gt=last)[:1000])
+        if not page:
+            return
+        last = page[-1].pk
+        batch = []
+        for item in page:
+            parsed = parse_quantity(item.quantity)
+            if parsed is None:
+                continue
+            item.amount, item.unit = parsed
+            item.base_amount, item.base_unit = to_base(item.amount, item.unit)
+            item.quantity = format_quantity(item.amount, item.unit)
+            batch.append(item)
+        IngredientItem.objects.bulk_update(batch, ['amount', 'unit', 'base_amount', 'base_unit', 'quantity'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingredient_requests', '0005_historicalingredientrequest_is_draft_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ingredientitem',
+            name='amount',
+            field=models.DecimalField(blank=True, decimal_places=3, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='ingredientitem',
+            name='base_amount',
+            field=models.DecimalField(blank=True, decimal_places=3, max_digits=15, null=True),
+        ),
+        migrations.AddField(
+            model_name='ingredientitem',
+            name='base_unit',
+            field=models.CharField(blank=True, choices=[('g', 'Gram'), ('ml', 'Millilitre'), ('pcs', 'Piece')], max_length=10),
+        ),
+        migrations.AddField(
+            model_name='ingredientitem',
+            name='unit',
+            field=models.CharField(blank=True, choices=[('g', 'Gram'), ('kg', 'Kilogram'), ('ml', 'Millilitre'), ('l', 'Litre'), ('pcs', 'Piece'), ('dozen', 'Dozen')], max_length=10),
+        ),
+        migrations.AlterField(
+            model_name='recipeingredient',
+            name='unit',
+            field=models.CharField(choices=[('g', 'Gram'), ('kg', 'Kilogram'), ('ml', 'Millilitre'), ('l', 'Litre'), ('pcs', 'Piece'), ('dozen', 'Dozen')], default='pcs', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='ingredientitem',
+            index=models.Index(fields=['name', 'is_approved', 'is_purchased'], name='ingredient__name_ecebb2_idx'),
+        ),
+        migrations.RunPython(parse_existing_quantities, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+from datetime import date
+
+DRAFT_NOTE_PREFIX = 'Automatic reorder suggestions for '
+
+
+def date_existing_drafts(apps, schema_editor):
+    """
+    Set draft_day of the reorder engine's requests from their generated note.
+    Drafts whose note was already edited cannot be dated and stay unkeyed.
+    """
+    IngredientRequest = apps.get_model('ingredient_requests', 'IngredientRequest')
+    drafts = IngredientRequest.all_objects.filter(note__startswith=DRAFT_NOTE_PREFIX, draft_day__isnull=True).order_by('pk')
+    last = 0
+    while True:
+        page = list(drafts.filter(pk__gt=last)[:1000])
+        if not page:
+            return
+        last = page[-1].pk
+        batch = []
+        for request in page:
+            try:
+                request.draft_day = date.fromisoformat(request.note[len(DRAFT_NOTE_PREFIX):])
+            except ValueError:
+                continue
+            batch.append(request)
+        IngredientRequest.all_objects.bulk_update(batch, ['draft_day'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingredient_requests', '0008_alter_ingredientitem_managers_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicalingredientrequest',
+            name='draft_day',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='ingredientrequest',
+            name='draft_day',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.RunPython(date_existing_drafts, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='ingredientrequest',
+            constraint=models.UniqueConstraint(fields=('chef', 'draft_day'), name='unique_draft_per_chef_day'),
+        ),
+    ]
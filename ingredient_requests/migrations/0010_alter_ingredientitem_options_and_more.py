@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:49
+
+import django.db.models.manager
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingredient_requests', '0009_draft_day'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='ingredientitem',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='ingredientrequest',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='itemreviewbatch',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='recipeingredient',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='reorderrule',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='reordersuggestion',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects'},
+        ),
+        migrations.AlterModelManagers(
+            name='ingredientitem',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='ingredientrequest',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='itemreviewbatch',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='recipeingredient',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='reorderrule',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='reordersuggestion',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
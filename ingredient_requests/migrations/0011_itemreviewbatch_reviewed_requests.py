@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingredient_requests', '0010_alter_ingredientitem_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='itemreviewbatch',
+            name='reviewed_requests',
+            field=models.JSONField(default=list),
+        ),
+    ]
@@ -2,7 +2,11 @@
 from django.db import models
 from django.conf import settings
 # -------------------   Apps imports ------------------------
+from menu.models import MenuItem
 from utility.models import BaseModel
+from simple_history.models import HistoricalRecords
+from .choices import Unit, BaseUnit
+from .quantities import parse_quantity, to_base, format_quantity
 
 ##################################################################################
 #                       IngredientRequest Model                                  #
@@ -12,11 +16,14 @@ class IngredientRequest(BaseModel):
     chef = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="ingredient_requests")
     note = models.TextField(blank=True, null=True)
     is_reviewed = models.BooleanField(default=False)  # Manager approval or rejection
+    is_draft = models.BooleanField(default=False)  # Generated by the reorder engine, not submitted yet
+    draft_day = models.DateField(null=True, blank=True)  # Day the reorder engine drafted it for, kept after submission
+    history = HistoricalRecords()
 
     def __str__(self):
         return f"Request by {self.chef}"
     
-    class Meta:
+    class Meta(BaseModel.Meta):
         indexes = [
             models.Index(fields=['chef']),
             models.Index(fields=['is_reviewed', 'created_at']),
@@ -24,7 +31,9 @@ class IngredientRequest(BaseModel):
         
         constraints = [
             # Only one request with one note per chef
-            models.UniqueConstraint(fields=['chef', 'note'], name='unique_request_per_chef')
+            models.UniqueConstraint(fields=['chef', 'note'], name='unique_request_per_chef'),
+            # One automatic draft per chef and day, whatever its note says
+            models.UniqueConstraint(fields=['chef', 'draft_day'], name='unique_draft_per_chef_day'),
         ]
         
 ##################################################################################
@@ -34,7 +43,12 @@ class IngredientRequest(BaseModel):
 class IngredientItem(BaseModel):
     request = models.ForeignKey(IngredientRequest, on_delete=models.CASCADE, related_name="items")
     name = models.CharField(max_length=100)
-    quantity = models.CharField(max_length=100)
+    quantity = models.CharField(max_length=100)  # display text, e.g. "2.5 kg"
+    amount = models.DecimalField(max_digits=12, decimal_places=3, null=True, blank=True)
+    unit = models.CharField(max_length=10, choices=Unit.choices, blank=True)
+    # amount converted to g / ml / pcs, so quantities can be summed in SQL
+    base_amount = models.DecimalField(max_digits=15, decimal_places=3, null=True, blank=True)
+    base_unit = models.CharField(max_length=10, choices=BaseUnit.choices, blank=True)
     is_approved = models.BooleanField(default=False)
     is_rejected = models.BooleanField(default=False)
     is_purchased = models.BooleanField(default=False)
@@ -42,11 +56,50 @@ class IngredientItem(BaseModel):
     def __str__(self):
         return f"{self.name} ({self.quantity})"
 
-    class Meta:
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_quantity()
+        return instance
+
+    def _remember_quantity(self):
+        """The quantity fields as stored, to tell which side a later save changed."""
+        self._stored_quantity = tuple(self.__dict__.get(name) for name in ("quantity", "amount", "unit"))
+
+    def normalize_quantity(self):
+        """
+        Keep the quantity text and amount/unit in step, then derive the base
+        amount. The text is parsed when there is no amount or when only the
+        text changed since the row was loaded; otherwise amount/unit win and
+        the text is rewritten from them. Unparseable text is kept as is with
+        no amount.
+        """
+        stored = getattr(self, "_stored_quantity", None)
+        text_edited = (
+            stored is not None and self.quantity != stored[0] and (self.amount, self.unit) == stored[1:]
+        )
+        if self.amount is None or text_edited:
+            parsed = parse_quantity(self.quantity)
+            if parsed is None:
+                self.amount, self.unit, self.base_amount, self.base_unit = None, "", None, ""
+                return
+            self.amount, self.unit = parsed
+        self.unit = self.unit or Unit.PIECE
+        self.base_amount, self.base_unit = to_base(self.amount, self.unit)
+        self.quantity = format_quantity(self.amount, self.unit)
+
+    def save(self, *args, **kwargs):
+        self.normalize_quantity()
+        super().save(*args, **kwargs)
+        self._remember_quantity()
+
+    class Meta(BaseModel.Meta):
         indexes = [
             models.Index(fields=['request']),
             models.Index(fields=['name']),
             models.Index(fields=['request', 'name']), 
+            # Purchasing totals: approved-but-not-purchased per ingredient
+            models.Index(fields=['name', 'is_approved', 'is_purchased']),
         ]
 
         constraints = [
@@ -58,4 +111,91 @@ class IngredientItem(BaseModel):
                 check=~(models.Q(is_approved=True) & models.Q(is_rejected=True)),
                 name='approved_not_rejected'
             ),
-        ]
\ No newline at end of file
+        ]
+
+##################################################################################
+#                         ItemReviewBatch Model                                  #
+##################################################################################
+
+class ItemReviewBatch(BaseModel):
+    """
+    One bulk decision on ingredient items: who did it and what changed.
+    `changes` is [[item_id, action], ...]; `reviewed_requests` lists the
+    requests the batch left fully decided.
+    """
+    reviewer = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name="item_review_batches"
+    )
+    changes = models.JSONField(default=list)
+    reviewed_requests = models.JSONField(default=list)
+
+    def __str__(self):
+        return f"{len(self.changes)} item decisions by {self.reviewer}"
+
+##################################################################################
+#                        RecipeIngredient Model                                  #
+##################################################################################
+
+class RecipeIngredient(BaseModel):
+    """
+    Bill of materials: how much of an ingredient one unit of a menu item uses.
+    """
+    menu_item = models.ForeignKey(MenuItem, on_delete=models.CASCADE, related_name="recipe")
+    name = models.CharField(max_length=100)
+    quantity = models.DecimalField(max_digits=10, decimal_places=3)  # per menu item unit
+    unit = models.CharField(max_length=10, choices=Unit.choices, default=Unit.PIECE)
+
+    def __str__(self):
+        return f"{self.menu_item.name}: {self.quantity} {self.unit} {self.name}"
+
+    class Meta(BaseModel.Meta):
+        constraints = [
+            models.UniqueConstraint(fields=['menu_item', 'name'], name='unique_ingredient_per_recipe')
+        ]
+
+##################################################################################
+#                          ReorderRule Model                                     #
+##################################################################################
+
+class ReorderRule(BaseModel):
+    """
+    When a menu item's stock drops to `reorder_point`, suggest enough
+    ingredients to bring it back to `target_stock` in a draft request of `chef`.
+    """
+    menu_item = models.OneToOneField(MenuItem, on_delete=models.CASCADE, related_name="reorder_rule")
+    chef = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="reorder_rules")
+    reorder_point = models.PositiveIntegerField()
+    target_stock = models.PositiveIntegerField()
+    is_active = models.BooleanField(default=True)
+
+    def __str__(self):
+        return f"Reorder {self.menu_item.name} at {self.reorder_point} up to {self.target_stock}"
+
+    class Meta(BaseModel.Meta):
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(target_stock__gt=models.F('reorder_point')),
+                name='target_above_reorder_point'
+            ),
+        ]
+
+##################################################################################
+#                        ReorderSuggestion Model                                 #
+##################################################################################
+
+class ReorderSuggestion(BaseModel):
+    """
+    Menu item units a draft request has to cover. The request's ingredient
+    items are the recipe totals over its suggestions.
+    """
+    request = models.ForeignKey(IngredientRequest, on_delete=models.CASCADE, related_name="reorder_suggestions")
+    menu_item = models.ForeignKey(MenuItem, on_delete=models.CASCADE, related_name="reorder_suggestions")
+    units = models.PositiveIntegerField()
+
+    def __str__(self):
+        return f"{self.units} x {self.menu_item.name} for request #{self.request_id}"
+
+    class Meta(BaseModel.Meta):
+        constraints = [
+            models.UniqueConstraint(fields=['request', 'menu_item'], name='unique_suggestion_per_request')
+        ]
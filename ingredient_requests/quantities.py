@@ -0,0 +1,91 @@
+# Ingredient quantities: units, conversion to base units and parsing of the
+# free-form strings chefs used to type ("2 kg", "500g", "1/2 l", "3").
+# Pure functions only, so data migrations can import this module.
+
+# -------------------  Other imports   ------------------------
+from decimal import Decimal, InvalidOperation
+import re
+
+# unit -> (base unit, factor to the base unit)
+CONVERSIONS = {
+    "g": ("g", Decimal(1)),
+    "kg": ("g", Decimal(1000)),
+    "ml": ("ml", Decimal(1)),
+    "l": ("ml", Decimal(1000)),
+    "pcs": ("pcs", Decimal(1)),
+    "dozen": ("pcs", Decimal(12)),
+}
+
+# Display unit for large amounts of a base unit (e.g. 1500 g -> 1.5 kg).
+LARGER_UNIT = {"g": "kg", "ml": "l"}
+
+UNIT_ALIASES = {
+    "g": "g", "gr": "g", "gram": "g", "gramme": "g", "گرم": "g",
+    "kg": "kg", "kilo": "kg", "kilogram": "kg", "kilogramme": "kg", "کیلو": "kg", "کیلوگرم": "kg",
+    "ml": "ml", "millilitre": "ml", "milliliter": "ml", "میلی‌لیتر": "ml", "میلی لیتر": "ml",
+    "l": "l", "lt": "l", "ltr": "l", "litre": "l", "liter": "l", "لیتر": "l",
+    "pcs": "pcs", "pc": "pcs", "piece": "pcs", "unit": "pcs", "x": "pcs", "عدد": "pcs", "تا": "pcs",
+    "dozen": "dozen", "dz": "dozen", "doz": "dozen", "جین": "dozen",
+}
+
+PERSIAN_DIGITS = str.maketrans("۰۱۲۳۴۵۶۷۸۹٫", "0123456789.")
+QUANTITY_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?(?:\s*/\s*\d+)?)\s*(.*?)\s*$")
+
+
+def normalize_unit(text):
+    """Unit code for a unit name or alias ("" means pieces), or None."""
+    key = text.strip().lower().rstrip(".")
+    if not key:
+        return "pcs"
+    if key in UNIT_ALIASES:
+        return UNIT_ALIASES[key]
+    if key.endswith("s") and key[:-1] in UNIT_ALIASES:
+        return UNIT_ALIASES[key[:-1]]
+    return None
+
+
+def parse_quantity(text):
+    """
+    (amount, unit) from strings like "2 kg", "500g", "1/2 l", "1,5 liters",
+    "۳ عدد" or "3". Returns None when the string cannot be understood.
+    """
+    if not text:
+        return None
+    text = text.translate(PERSIAN_DIGITS)
+    if "," in text and "." not in text:
+        text = text.replace(",", ".")
+    match = QUANTITY_PATTERN.match(text)
+    if not match:
+        return None
+    number, unit = match.groups()
+    unit = normalize_unit(unit)
+    if unit is None:
+        return None
+    try:
+        if "/" in number:
+            numerator, denominator = (Decimal(part) for part in number.split("/"))
+            amount = numerator / denominator
+        else:
+            amount = Decimal(number)
+    except (InvalidOperation, ZeroDivisionError):
+        return None
+    return amount.quantize(Decimal("0.001")), unit
+
+
+def to_base(amount, unit):
+    """(amount in the base unit, base unit)."""
+    base_unit, factor = CONVERSIONS[unit]
+    return amount * factor, base_unit
+
+
+def humanize(base_amount, base_unit):
+    """Largest sensible unit for a base amount: (1500, "g") -> (1.5, "kg")."""
+    larger = LARGER_UNIT.get(base_unit)
+    if larger and abs(base_amount) >= CONVERSIONS[larger][1]:
+        return base_amount / CONVERSIONS[larger][1], larger
+    return base_amount, base_unit
+
+
+def format_quantity(amount, unit):
+    amount = Decimal(amount).normalize()
+    return f"{amount:f} {unit}"
@@ -0,0 +1,111 @@
+# -------------------  Django imports   ------------------------
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+# -------------------   Apps imports ------------------------
+from .models import IngredientRequest, IngredientItem, ReorderRule, ReorderSuggestion
+from .quantities import to_base, humanize
+# -------------------  Other imports   ------------------------
+from collections import Counter, defaultdict
+from functools import partial
+
+REORDER_POINTS_CACHE_KEY = "ingredient_requests:reorder_points"
+DRAFT_NOTE = "Automatic reorder suggestions for {day:%Y-%m-%d}"
+
+##################################################################################
+#                              Change stream                                     #
+##################################################################################
+
+def reorder_points():
+    """{menu_item_id: reorder_point} of active rules, cached until a rule changes."""
+    return cache.get_or_set(
+        REORDER_POINTS_CACHE_KEY,
+        lambda: dict(ReorderRule.objects.filter(is_active=True).values_list("menu_item_id", "reorder_point")),
+        None,
+    )
+
+
+def forget_reorder_points():
+    cache.delete(REORDER_POINTS_CACHE_KEY)
+
+
+def stock_changed(menu_item_id, stock):
+    """
+    Called on every stock write. Items above their reorder point (or without
+    a rule) cost one cache lookup; the others are evaluated after commit.
+    """
+    point = reorder_points().get(menu_item_id)
+    if point is not None and stock <= point:
+        transaction.on_commit(partial(evaluate_reorders, [menu_item_id]))
+
+##################################################################################
+#                              Evaluation                                        #
+##################################################################################
+
+def draft_request(chef, day=None):
+    """
+    The chef's draft request for `day`, created on first use and found by
+    draft_day, so the chef may edit its note. None once the chef has
+    submitted or deleted that day's draft.
+    """
+    day = day or timezone.localdate()
+    request, _ = IngredientRequest.all_objects.get_or_create(
+        chef=chef, draft_day=day, defaults={"is_draft": True, "note": DRAFT_NOTE.format(day=day)}
+    )
+    return request if request.is_draft and not request.is_deleted else None
+
+
+def evaluate_reorders(menu_item_ids, day=None):
+    """
+    Suggest replenishment for the given menu items only: items at or below
+    their reorder point get a suggestion of (target_stock - stock) units in
+    their chef's draft request, and the draft's ingredient lines are rebuilt.
+    Returns the touched draft requests.
+    """
+    rules = ReorderRule.objects.filter(
+        menu_item_id__in=menu_item_ids,
+        is_active=True,
+        menu_item__stock__lte=F("reorder_point"),
+    ).select_related("menu_item", "chef")
+
+    touched = {}
+    with transaction.atomic():
+        for rule in rules:
+            request = draft_request(rule.chef, day)
+            if request is None:
+                continue
+            ReorderSuggestion.all_objects.update_or_create(
+                request=request, menu_item=rule.menu_item,
+                defaults={"units": rule.target_stock - rule.menu_item.stock},
+            )
+            touched[request.pk] = request
+        for request in touched.values():
+            sync_draft_items(request)
+    return list(touched.values())
+
+
+def sync_draft_items(request):
+    """
+    Set the draft's ingredient lines to the recipe totals of its suggestions.
+    A name used with units of different kinds (e.g. eggs in pcs and in g)
+    cannot be summed: it gets one line per base unit, "Eggs (pcs)", "Eggs (g)".
+    """
+    amounts = defaultdict(int)
+    suggestions = request.reorder_suggestions.prefetch_related("menu_item__recipe")
+    for suggestion in suggestions:
+        for line in suggestion.menu_item.recipe.all():
+            base_amount, base_unit = to_base(line.quantity * suggestion.units, line.unit)
+            amounts[line.name, base_unit] += base_amount
+
+    kinds = Counter(name for name, _ in amounts)
+    max_length = IngredientItem._meta.get_field("name").max_length
+    for (name, base_unit), base_amount in amounts.items():
+        if kinds[name] > 1:
+            suffix = f" ({base_unit})"
+            name = name[:max_length - len(suffix)] + suffix
+        amount, unit = humanize(base_amount, base_unit)
+        # A line the chef deleted keeps its tombstone and is not revived.
+        IngredientItem.all_objects.update_or_create(
+            request=request, name=name, defaults={"amount": amount, "unit": unit}
+        )
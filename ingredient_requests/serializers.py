@@ -1,18 +1,45 @@
 # -------------------  DRF imports   ------------------------
 from rest_framework import serializers
+# -------------------  Django imports   ------------------------
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
 # -------------------   Apps imports ------------------------
-from .models import IngredientRequest, IngredientItem
+from .models import IngredientRequest, IngredientItem, ItemReviewBatch
+from .choices import Unit
+from .quantities import parse_quantity, to_base, humanize
 from utility.serializers import BaseSerializer
+from utility.httpcache import bump_data_version, bump_user_version
+from simple_history.utils import bulk_update_with_history
+from functools import partial
 
 ##################################################################################
 #                      IngredientItem serializers                                #
 ##################################################################################
 
 class IngredientItemSerializer(BaseSerializer):
+    quantity = serializers.CharField(max_length=100, required=False)
+
     class Meta:
         model = IngredientItem
         fields = '__all__'
-        read_only_fields = ['is_approved', 'is_rejected', 'is_purchased', 'request']
+        read_only_fields = ['is_approved', 'is_rejected', 'is_purchased', 'request', 'base_amount', 'base_unit']
+
+    def validate(self, data):
+        """
+        Accept either `amount` (+ `unit`) or a quantity text such as "2 kg",
+        which is parsed into amount and unit.
+        """
+        if data.get('amount') is None and 'quantity' in data:
+            parsed = parse_quantity(data['quantity'])
+            if parsed is None:
+                raise serializers.ValidationError(
+                    {'quantity': "Use an amount and a unit, e.g. '2 kg', '500 g', '1.5 l' or '12 pcs'."}
+                )
+            data['amount'], data['unit'] = parsed
+        elif data.get('amount') is None and not self.instance:
+            raise serializers.ValidationError({'quantity': "Either quantity or amount is required."})
+        return data
 
 ##################################################################################
 #                      IngredientRequest serializers                             #
@@ -25,13 +52,58 @@ class IngredientRequestSerializer(BaseSerializer):
 
     class Meta:
         model = IngredientRequest
-        fields = ['id', 'chef', 'note', 'items', 'items_detail', 'is_reviewed', 'created_at', 'updated_at']
+        fields = ['id', 'chef', 'note', 'items', 'items_detail', 'is_reviewed', 'is_draft', 'draft_day', 'created_at', 'updated_at']
+        read_only_fields = ['draft_day']
+
+    def validate_items(self, items):
+        """
+        Merge lines with the same ingredient name (case-insensitive) by adding
+        their amounts, so the unique_item_per_request constraint is settled
+        in memory instead of failing on insert.
+        """
+        merged = {}
+        for item in items:
+            item['name'] = item['name'].strip()
+            key = item['name'].casefold()
+            if key not in merged:
+                merged[key] = item
+                continue
+            first = merged[key]
+            total, base_unit = to_base(first['amount'], first.get('unit') or Unit.PIECE)
+            extra, extra_unit = to_base(item['amount'], item.get('unit') or Unit.PIECE)
+            if extra_unit != base_unit:
+                raise serializers.ValidationError(
+                    f"'{item['name']}' appears twice with units that cannot be added ({base_unit}, {extra_unit})."
+                )
+            first['amount'], first['unit'] = humanize(total + extra, base_unit)
+            first.pop('quantity', None)
+        return list(merged.values())
+
+    def validate(self, data):
+        chef = self.instance.chef if self.instance else self.context['request'].user
+        note = data.get('note', self.instance.note if self.instance else None)
+        # Tombstones still hold the unique (chef, note) pair.
+        duplicates = IngredientRequest.all_objects.filter(chef=chef, note=note)
+        if self.instance:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+        if 'note' in data and duplicates.exists():
+            raise serializers.ValidationError({'note': "You already have a request with this note."})
+        return data
+
+    def _create_items(self, request, items_data):
+        items = [IngredientItem(request=request, **item_data) for item_data in items_data]
+        for item in items:
+            # bulk_create skips save(), which normally derives these fields.
+            item.normalize_quantity()
+        IngredientItem.objects.bulk_create(items)
 
     def create(self, validated_data):
+        """Request and all its items in one transaction, with a constant number of queries."""
         items_data = validated_data.pop('items')
-        request = IngredientRequest.objects.create(chef=self.context['request'].user, **validated_data)
-        for item_data in items_data:
-            IngredientItem.objects.create(request=request, **item_data)
+        validated_data.setdefault('chef', self.context['request'].user)
+        with transaction.atomic():
+            request = IngredientRequest.objects.create(**validated_data)
+            self._create_items(request, items_data)
         return request
 
     def update(self, instance, validated_data):
@@ -41,12 +113,91 @@ class IngredientRequestSerializer(BaseSerializer):
 
         items_data = validated_data.pop('items', None)
         instance.note = validated_data.get('note', instance.note)
-        instance.save()
+        instance.is_draft = validated_data.get('is_draft', instance.is_draft)
+        with transaction.atomic():
+            instance.save()
+            if items_data is not None:
+                # Replace previous items with the new list
+                instance.items.all().delete()
+                self._create_items(instance, items_data)
+        return instance
+
+##################################################################################
+#                      Bulk item decision serializers                            #
+##################################################################################
 
-        if items_data is not None:
-            # Delete previous items and create new items
-            instance.items.all().delete()
-            for item_data in items_data:
-                IngredientItem.objects.create(request=instance, **item_data)
+class ItemDecisionSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    action = serializers.ChoiceField(choices=['approve', 'reject', 'purchase'])
 
-        return instance
+
+class BulkItemDecisionSerializer(serializers.Serializer):
+    """
+    Applies approve / reject / purchase to many items at once.
+    All changes are checked in memory first (including the
+    approved_not_rejected constraint); if any fails, nothing is written.
+    """
+    changes = ItemDecisionSerializer(many=True, allow_empty=False, max_length=500)
+
+    def validate_changes(self, changes):
+        ids = [change['id'] for change in changes]
+        if len(ids) != len(set(ids)):
+            raise serializers.ValidationError("Each item may appear only once.")
+        items = IngredientItem.objects.select_for_update().filter(pk__in=ids, is_deleted=False).in_bulk()
+
+        errors = {}
+        for change in changes:
+            item = items.get(change['id'])
+            if item is None:
+                errors[change['id']] = "Item not found."
+                continue
+            if change['action'] == 'approve':
+                item.is_approved = True
+            elif change['action'] == 'reject':
+                item.is_rejected = True
+            elif not item.is_approved:
+                errors[item.pk] = "Only approved items can be purchased."
+                continue
+            else:
+                item.is_purchased = True
+            if item.is_approved and item.is_rejected:
+                errors[item.pk] = "An item cannot be both approved and rejected."
+        if errors:
+            raise serializers.ValidationError(errors)
+        self.items = list(items.values())
+        return changes
+
+    def create(self, validated_data):
+        now = timezone.now()
+        for item in self.items:
+            item.updated_at = now
+        IngredientItem.objects.bulk_update(self.items, ['is_approved', 'is_rejected', 'is_purchased', 'updated_at'])
+
+        # Requests whose items are now all approved or rejected are reviewed.
+        undecided = IngredientItem.objects.filter(
+            request=OuterRef('pk'), is_approved=False, is_rejected=False, is_deleted=False
+        )
+        request_ids = {item.request_id for item in self.items}
+        reviewed = list(
+            IngredientRequest.objects.filter(pk__in=request_ids, is_reviewed=False)
+            .exclude(Exists(undecided)).order_by('pk')
+        )
+        batch = ItemReviewBatch.objects.create(
+            reviewer=self.context['request'].user,
+            changes=[[change['id'], change['action']] for change in validated_data['changes']],
+            reviewed_requests=[request.pk for request in reviewed],
+        )
+        for request in reviewed:
+            request.is_reviewed = True
+            request.updated_at = now
+        bulk_update_with_history(
+            reviewed, IngredientRequest, ['is_reviewed', 'updated_at'],
+            default_change_reason=f"Item review batch #{batch.pk}",
+        )
+        # The bulk updates send no signals: refresh the cached request lists.
+        chefs = IngredientRequest.all_objects.filter(pk__in=request_ids).values_list('chef_id', flat=True).distinct()
+        for chef_id in chefs:
+            transaction.on_commit(partial(bump_user_version, 'ingredient_requests', chef_id))
+        transaction.on_commit(partial(bump_data_version, IngredientItem))
+        transaction.on_commit(partial(bump_data_version, IngredientRequest))
+        return batch
@@ -1,8 +1,52 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from .models import IngredientRequest
+from functools import partial
+from menu.models import MenuItem
+from .models import IngredientItem, IngredientRequest, ReorderRule
+from .replenishment import stock_changed, forget_reorder_points, evaluate_reorders
+from utility.httpcache import bump_data_version, bump_user_version
+
+def notify_admin(request):
+    print(f"New request registered on behalf of {request.chef.username} with {request.items.count()} items.")
+
 
 @receiver(post_save, sender=IngredientRequest)
-def notify_admin_on_request(sender, instance, created, **kwargs):
-    if created:
-        print(f"New request registered on behalf of {instance.chef.username}.")
\ No newline at end of file
+def notify_admin_on_request(sender, instance, created, raw=False, **kwargs):
+    # After commit, so the items written in the same transaction exist.
+    # Raw saves (fixtures, tombstone restores) are not new requests.
+    if created and not raw:
+        transaction.on_commit(partial(notify_admin, instance))
+
+
+@receiver(post_save, sender=MenuItem)
+def check_reorder_point(sender, instance, update_fields=None, **kwargs):
+    # Only stock writes can cross a reorder point.
+    if update_fields is None or "stock" in update_fields:
+        stock_changed(instance.pk, instance.stock)
+
+
+@receiver(post_save, sender=ReorderRule)
+@receiver(post_delete, sender=ReorderRule)
+def reset_reorder_points(sender, instance, **kwargs):
+    transaction.on_commit(forget_reorder_points)
+    # A new or lowered rule may already be crossed by the current stock.
+    if kwargs.get("signal") is post_save and instance.is_active:
+        transaction.on_commit(partial(evaluate_reorders, [instance.menu_item_id]))
+
+
+# Per-user cache of MyIngredientRequestsList, and the data versions of the
+# other cached request lists. Bulk writes (bulk_create, bulk_update) send
+# no signals and bump both themselves.
+@receiver(post_save, sender=IngredientRequest)
+@receiver(post_delete, sender=IngredientRequest)
+def invalidate_chef_requests(sender, instance, **kwargs):
+    transaction.on_commit(partial(bump_user_version, "ingredient_requests", instance.chef_id))
+    transaction.on_commit(partial(bump_data_version, IngredientRequest))
+
+
+@receiver(post_save, sender=IngredientItem)
+@receiver(post_delete, sender=IngredientItem)
+def invalidate_chef_request_items(sender, instance, **kwargs):
+    transaction.on_commit(partial(bump_user_version, "ingredient_requests", instance.request.chef_id))
+    transaction.on_commit(partial(bump_data_version, IngredientItem))
@@ -0,0 +1,266 @@
+# -------------------  Django imports   ------------------------
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+# -------------------  DRF imports   ------------------------
+from rest_framework.test import APITestCase
+# -------------------   Apps imports ------------------------
+from menu.models import Category, MenuItem
+from .models import IngredientItem, IngredientRequest, ItemReviewBatch, RecipeIngredient, ReorderSuggestion
+from .quantities import humanize, parse_quantity, to_base
+from .replenishment import draft_request, sync_draft_items
+from .serializers import IngredientRequestSerializer
+# -------------------  Other imports   ------------------------
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+##################################################################################
+#                                Quantities                                      #
+##################################################################################
+
+class QuantityTests(SimpleTestCase):
+    def test_parse_quantity(self):
+        cases = {
+            "2 kg": (Decimal("2"), "kg"),
+            "500g": (Decimal("500"), "g"),
+            "1/2 l": (Decimal("0.5"), "l"),
+            "1,5 liters": (Decimal("1.5"), "l"),
+            "۳ عدد": (Decimal("3"), "pcs"),
+            "3": (Decimal("3"), "pcs"),
+            "2 Dozen.": (Decimal("2"), "dozen"),
+            "0.3333 kg": (Decimal("0.333"), "kg"),
+        }
+        for text, expected in cases.items():
+            self.assertEqual(parse_quantity(text), expected, text)
+        for text in ("", None, "some", "1/0 kg", "2 bags", "kg 2"):
+            self.assertIsNone(parse_quantity(text), text)
+
+    def test_to_base_and_humanize(self):
+        self.assertEqual(to_base(Decimal("1.5"), "kg"), (Decimal("1500"), "g"))
+        self.assertEqual(to_base(Decimal("2"), "dozen"), (Decimal("24"), "pcs"))
+        self.assertEqual(humanize(Decimal("1500"), "g"), (Decimal("1.5"), "kg"))
+        self.assertEqual(humanize(Decimal("2000"), "ml"), (Decimal("2"), "l"))
+        self.assertEqual(humanize(Decimal("999"), "g"), (Decimal("999"), "g"))
+        self.assertEqual(humanize(Decimal("5000"), "pcs"), (Decimal("5000"), "pcs"))
+
+
+class IngredientItemQuantityTests(TestCase):
+    """save() keeps the quantity text and amount/unit in step, whichever one changed."""
+
+    def setUp(self):
+        chef = get_user_model().objects.create_user("chef", password="secret-pass-1")
+        self.item = IngredientItem.objects.create(
+            request=IngredientRequest.objects.create(chef=chef, note="Weekly"), name="Milk", quantity="2 l"
+        )
+
+    def stored(self):
+        return IngredientItem.objects.values_list("quantity", "amount", "unit", "base_amount", "base_unit").get()
+
+    def test_new_quantity_text_is_parsed(self):
+        item = IngredientItem.objects.get()
+        item.quantity = "500 ml"
+        item.save()
+        self.assertEqual(self.stored(), ("500 ml", Decimal("500"), "ml", Decimal("500"), "ml"))
+
+        item.quantity = "1 kg"  # a second edit on the same instance
+        item.save()
+        self.assertEqual(self.stored(), ("1 kg", Decimal("1"), "kg", Decimal("1000"), "g"))
+
+    def test_new_amount_rewrites_the_text(self):
+        self.item.amount, self.item.unit = Decimal("3"), "pcs"
+        self.item.save()
+        self.assertEqual(self.stored(), ("3 pcs", Decimal("3"), "pcs", Decimal("3"), "pcs"))
+
+    def test_unparseable_text_drops_the_amount(self):
+        self.item.quantity = "a few bottles"
+        self.item.save()
+        self.assertEqual(self.stored(), ("a few bottles", None, "", None, ""))
+
+
+@override_settings(REPLICA_DATABASE=None)
+class IngredientTotalsTests(APITestCase):
+    """/ingredient_requests/items/totals/ sums base amounts per ingredient and unit kind."""
+
+    def setUp(self):
+        users = get_user_model().objects
+        self.client.force_authenticate(users.create_user("boss", password="secret-pass-1", role="admin"))
+        chef = users.create_user("chef", password="secret-pass-1", role="chef")
+        weekly = IngredientRequest.objects.create(chef=chef, note="Weekly")
+        extra = IngredientRequest.objects.create(chef=chef, note="Extra")
+        for request, name, quantity, approved, purchased in (
+            (weekly, "Milk", "500 ml", True, False),
+            (extra, "Milk", "1 l", True, False),
+            (weekly, "Flour", "800 g", True, False),
+            (extra, "Flour", "2 kg", True, True),
+            (weekly, "Eggs", "2 dozen", False, False),
+            (extra, "Eggs", "a few", True, False),
+        ):
+            IngredientItem.objects.create(
+                request=request, name=name, quantity=quantity, is_approved=approved, is_purchased=purchased
+            )
+
+    def totals(self, **params):
+        response = self.client.get("/ingredient_requests/items/totals/", params)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        return [(row["name"], row["amount"], row["unit"], row["items"], row["requests"]) for row in data["results"]], data["unparsed_items"]
+
+    def test_to_purchase_totals(self):
+        self.assertEqual(
+            self.totals(),
+            ([("Flour", 800, "g", 1, 1), ("Milk", 1.5, "l", 2, 2)], 1),
+        )
+
+    def test_states_and_name_filter(self):
+        self.assertEqual(self.totals(state="pending"), ([("Eggs", 24, "pcs", 1, 1)], 0))
+        self.assertEqual(self.totals(state="approved", name="Flour"), ([("Flour", 2.8, "kg", 2, 2)], 0))
+        response = self.client.get("/ingredient_requests/items/totals/", {"state": "lost"})
+        self.assertEqual(response.status_code, 400)
+
+##################################################################################
+#                              Reorder drafts                                    #
+##################################################################################
+
+class DraftRequestTests(TestCase):
+    """draft_request() keys the chef's draft on draft_day, not on its note."""
+
+    def setUp(self):
+        self.chef = get_user_model().objects.create_user("chef", password="secret-pass-1")
+        self.day = date(2026, 10, 1)
+
+    def test_edited_note_keeps_the_draft(self):
+        draft = draft_request(self.chef, self.day)
+        draft.note = "Order from the usual supplier"
+        draft.save()
+
+        self.assertEqual(draft_request(self.chef, self.day), draft)
+        self.assertEqual(IngredientRequest.all_objects.filter(chef=self.chef).count(), 1)
+
+    def test_one_draft_per_day(self):
+        self.assertNotEqual(draft_request(self.chef, self.day), draft_request(self.chef, date(2026, 10, 2)))
+
+    def test_submitted_draft_is_not_recreated(self):
+        draft = draft_request(self.chef, self.day)
+        draft.is_draft = False
+        draft.note = "Submitted"
+        draft.save()
+
+        self.assertIsNone(draft_request(self.chef, self.day))
+        self.assertEqual(IngredientRequest.all_objects.filter(chef=self.chef).count(), 1)
+
+    def test_draft_lines_keep_every_kind_of_unit(self):
+        category = Category.objects.create(name="Cakes")
+        cake, omelette = (MenuItem.objects.create(category=category, name=name, price="5") for name in ("Cake", "Omelette"))
+        RecipeIngredient.objects.create(menu_item=cake, name="Eggs", quantity="2", unit="pcs")
+        RecipeIngredient.objects.create(menu_item=cake, name="Milk", quantity="200", unit="ml")
+        RecipeIngredient.objects.create(menu_item=omelette, name="Eggs", quantity="120", unit="g")
+        RecipeIngredient.objects.create(menu_item=omelette, name="Milk", quantity="0.1", unit="l")
+        draft = draft_request(self.chef, self.day)
+        ReorderSuggestion.objects.create(request=draft, menu_item=cake, units=3)
+        ReorderSuggestion.objects.create(request=draft, menu_item=omelette, units=5)
+
+        sync_draft_items(draft)
+
+        self.assertEqual(
+            sorted(draft.items.values_list("name", "quantity")),
+            [("Eggs (g)", "600 g"), ("Eggs (pcs)", "6 pcs"), ("Milk", "1.1 l")],
+        )
+
+##################################################################################
+#                           Nested request create                                #
+##################################################################################
+
+class NestedCreateTests(TestCase):
+    """IngredientRequestSerializer.create costs the same queries for 1 item or 25."""
+
+    def setUp(self):
+        self.chef = get_user_model().objects.create_user("chef", password="secret-pass-1", role="chef")
+
+    def create(self, note, count):
+        items = [{"name": f"Ingredient {number}", "quantity": f"{number + 1} kg"} for number in range(count)]
+        serializer = IngredientRequestSerializer(
+            data={"note": note, "items": items}, context={"request": SimpleNamespace(user=self.chef)}
+        )
+        serializer.is_valid(raise_exception=True)
+        return serializer.save()
+
+    def test_query_count_does_not_grow_with_items(self):
+        with CaptureQueriesContext(connection) as one_item:
+            self.create("Small", 1)
+        with self.assertNumQueries(len(one_item)):
+            request = self.create("Large", 25)
+
+        self.assertEqual(request.items.count(), 25)
+        # bulk_create skips save(): the base amount is still derived.
+        self.assertEqual(
+            request.items.values_list("base_amount", "base_unit").get(name="Ingredient 24"), (Decimal("25000"), "g")
+        )
+
+##################################################################################
+#                            Bulk item decisions                                 #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None)
+class BulkItemDecisionTests(APITestCase):
+    """/ingredient_requests/items/bulk/ writes every change or none of them."""
+
+    def setUp(self):
+        users = get_user_model().objects
+        self.client.force_authenticate(users.create_user("boss", password="secret-pass-1", role="admin"))
+        chef = users.create_user("chef", password="secret-pass-1", role="chef")
+        self.weekly = IngredientRequest.objects.create(chef=chef, note="Weekly")
+        self.extra = IngredientRequest.objects.create(chef=chef, note="Extra")
+        self.milk = IngredientItem.objects.create(request=self.weekly, name="Milk", quantity="2 l")
+        self.flour = IngredientItem.objects.create(request=self.weekly, name="Flour", quantity="5 kg")
+        self.eggs = IngredientItem.objects.create(request=self.extra, name="Eggs", quantity="30 pcs")
+
+    def decide(self, *changes):
+        return self.client.post(
+            "/ingredient_requests/items/bulk/",
+            {"changes": [{"id": item.pk, "action": action} for item, action in changes]},
+            format="json",
+        )
+
+    def decisions(self):
+        return list(IngredientItem.objects.order_by("pk").values_list("is_approved", "is_rejected", "is_purchased"))
+
+    def test_one_bad_change_writes_nothing(self):
+        self.flour.is_rejected = True
+        self.flour.save()
+        before = self.decisions()
+
+        for changes in (
+            [(self.milk, "approve"), (self.eggs, "purchase")],   # not approved yet
+            [(self.milk, "approve"), (self.flour, "approve")],   # approved and rejected
+            [(self.milk, "approve"), (self.milk, "reject")],     # the same item twice
+        ):
+            response = self.decide(*changes)
+            self.assertEqual(response.status_code, 400, changes)
+            self.assertEqual(self.decisions(), before)
+        self.assertFalse(ItemReviewBatch.objects.exists())
+        self.assertFalse(IngredientRequest.objects.filter(is_reviewed=True).exists())
+
+    def test_fully_decided_requests_are_reviewed(self):
+        response = self.decide((self.milk, "approve"), (self.flour, "reject"), (self.eggs, "approve"))
+        self.assertEqual(response.status_code, 200)
+
+        batch = ItemReviewBatch.objects.get()
+        self.assertEqual(response.json(), {
+            "batch": batch.pk, "updated": 3, "reviewed_requests": sorted([self.weekly.pk, self.extra.pk]),
+        })
+        self.assertEqual(sorted(batch.reviewed_requests), sorted([self.weekly.pk, self.extra.pk]))
+        self.weekly.refresh_from_db()
+        self.assertTrue(self.weekly.is_reviewed)
+        self.assertEqual(self.weekly.history.latest().history_change_reason, f"Item review batch #{batch.pk}")
+
+    def test_undecided_items_keep_the_request_open(self):
+        response = self.decide((self.milk, "approve"), (self.eggs, "reject"))
+
+        self.assertEqual(response.json()["reviewed_requests"], [self.extra.pk])
+        self.assertEqual(
+            list(IngredientRequest.objects.order_by("pk").values_list("is_reviewed", flat=True)), [False, True]
+        )
+        # Purchasing an approved item leaves the decision itself unchanged.
+        self.assertEqual(self.decide((self.milk, "purchase")).json()["reviewed_requests"], [])
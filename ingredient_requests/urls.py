@@ -9,9 +9,11 @@ from .views import (
     DeleteIngredientRequest,
     AllIngredientRequestsList,
     ApproveOrRejectIngredientItem,
+    BulkIngredientItemDecision,
     IngredientRequestByStatus,
     RecentIngredientRequests,
     IngredientItemByApprovalStatus,
+    IngredientTotals,
     IngredientRequestRestoreView,
     IngredientRequestHistoryList
 )
@@ -33,11 +35,13 @@ urlpatterns = [
     # Admin URLs
     path('requests/all/', AllIngredientRequestsList.as_view(), name='all-ingredient-requests'),
     path('items/<int:pk>/update/', ApproveOrRejectIngredientItem.as_view(), name='approve-reject-ingredient-item'),
+    path('items/bulk/', BulkIngredientItemDecision.as_view(), name='bulk-ingredient-item-decision'),
     path('requests/status/', IngredientRequestByStatus.as_view(), name='ingredient-requests-by-status'),
     path('requests/recent/', RecentIngredientRequests.as_view(), name='recent-ingredient-requests'),
 
     # Ingredient Item URLs (Admin only)
     path('items/filter/', IngredientItemByApprovalStatus.as_view(), name='ingredient-items-by-status'),
+    path('items/totals/', IngredientTotals.as_view(), name='ingredient-item-totals'),
 
     # Restore & History URLs
     path('requests/<int:pk>/restore/', IngredientRequestRestoreView.as_view(), name='ingredient-request-restore'),
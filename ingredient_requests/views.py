@@ -1,53 +1,45 @@
 # ------------------- Django imports ------------------------
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
-from django.core.cache import cache
 from django.conf import settings
+from django.db.models import Count, Sum
 
 # ------------------- DRF imports ------------------------
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework.exceptions import ValidationError
 
 # ------------------- App imports ------------------------
-from utility.views import BaseAPIView
-from utility.mixins import RestoreMixin
+from utility.views import BaseAPIView, HistoryListView
+from utility.mixins import RestoreMixin, AtomicWriteMixin, SoftDeleteMixin, UserCachedListMixin
+from utility.httpcache import UserScope, cache_per_user
 from .models import IngredientRequest, IngredientItem
-from .serializers import IngredientRequestSerializer, IngredientItemSerializer
+from .quantities import humanize
+from .serializers import IngredientRequestSerializer, IngredientItemSerializer, BulkItemDecisionSerializer
 from .permissions import IsChefOrAdmin, IsAdminOnly, IsChefAndNotApprovedOrAdmin
 
 # ------------------- Constants ------------------------
 CACHE_TTL = getattr(settings, 'CACHE_TTL', 60 * 5)
 
+# A chef's own requests, bumped in ingredient_requests.signals.
+USER_REQUESTS = UserScope("ingredient_requests")
+
 ##################################################################################
 #                               Base View                                        #
 ##################################################################################
 
-class IngredientBaseView(BaseAPIView):
+class IngredientBaseView(SoftDeleteMixin, BaseAPIView):
     """
     Base view for IngredientRequest app.
-    Handles:
-    - Cache invalidation on update and delete
-    - Provides common permission classes
+    Provides common permission classes and soft delete.
     """
     permission_classes = [IsChefOrAdmin]
 
-    def perform_update(self, serializer):
-        instance = serializer.save()
-        cache_key = f'views.decorators.cache.cache_page.{self.request.get_full_path()}'
-        cache.delete(cache_key)
-        return instance
-
-    def perform_destroy(self, instance):
-        instance.delete()
-        cache_key = f'views.decorators.cache.cache_page.{self.request.get_full_path()}'
-        cache.delete(cache_key)
-
 ##################################################################################
 #                        IngredientRequest Views                                  #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_per_user(IngredientRequest, IngredientItem, ttl=CACHE_TTL), name='get')
 class IngredientRequestListCreateView(IngredientBaseView, generics.ListCreateAPIView):
     queryset = IngredientRequest.objects.all()
     serializer_class = IngredientRequestSerializer
@@ -62,7 +54,7 @@ class IngredientRequestListCreateView(IngredientBaseView, generics.ListCreateAPI
     def perform_create(self, serializer):
         serializer.save(chef=self.request.user)
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_per_user(IngredientRequest, IngredientItem, ttl=CACHE_TTL), name='get')
 class IngredientRequestDetailView(IngredientBaseView, generics.RetrieveUpdateDestroyAPIView):
     queryset = IngredientRequest.objects.all()
     serializer_class = IngredientRequestSerializer
@@ -81,11 +73,11 @@ class IngredientItemUpdateView(IngredientBaseView, generics.UpdateAPIView):
 #                        My Requests / Chef Views                                 #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
-class MyIngredientRequestsList(IngredientBaseView, generics.ListAPIView):
+class MyIngredientRequestsList(UserCachedListMixin, IngredientBaseView, generics.ListAPIView):
     queryset = IngredientRequest.objects.all()
     serializer_class = IngredientRequestSerializer
     permission_classes = [IsChefOrAdmin]
+    user_cache = USER_REQUESTS
 
     def get_queryset(self):
         user = self.request.user
@@ -119,7 +111,7 @@ class DeleteIngredientRequest(IngredientBaseView, generics.DestroyAPIView):
 #                        Admin Views                                              #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_per_user(IngredientRequest, IngredientItem, ttl=CACHE_TTL), name='get')
 class AllIngredientRequestsList(IngredientBaseView, generics.ListAPIView):
     queryset = IngredientRequest.objects.all()
     serializer_class = IngredientRequestSerializer
@@ -130,6 +122,26 @@ class ApproveOrRejectIngredientItem(IngredientBaseView, generics.UpdateAPIView):
     serializer_class = IngredientItemSerializer
     permission_classes = [IsAdminOnly]
 
+class BulkIngredientItemDecision(AtomicWriteMixin, IngredientBaseView, generics.GenericAPIView):
+    """
+    Approve, reject or mark as purchased many items in one call:
+    {"changes": [{"id": 1, "action": "approve"}, {"id": 2, "action": "reject"}, ...]}
+    The whole batch is validated before a single bulk update; requests whose
+    items are all decided are marked as reviewed.
+    """
+    serializer_class = BulkItemDecisionSerializer
+    permission_classes = [IsAdminOnly]
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        batch = serializer.save()
+        return Response({
+            "batch": batch.pk,
+            "updated": len(batch.changes),
+            "reviewed_requests": batch.reviewed_requests,
+        }, status=status.HTTP_200_OK)
+
 class IngredientRequestByStatus(IngredientBaseView, generics.ListAPIView):
     serializer_class = IngredientRequestSerializer
     permission_classes = [IsAdminOnly]
@@ -165,6 +177,53 @@ class IngredientItemByApprovalStatus(IngredientBaseView, generics.ListAPIView):
             queryset = queryset.filter(is_purchased=purchased.lower() == 'true')
         return queryset
 
+class IngredientTotals(IngredientBaseView, generics.GenericAPIView):
+    """
+    Total quantity per ingredient, summed in SQL over the base amounts
+    (g / ml / pcs) and shown in the largest sensible unit.
+    `?state=to_purchase` (default: approved, not purchased), `pending`
+    (not decided yet), `approved` or `purchased`; `?name=` filters by name.
+    Items whose quantity text could not be parsed are counted separately.
+    """
+    permission_classes = [IsAdminOnly]
+    states = {
+        'to_purchase': {'is_approved': True, 'is_purchased': False},
+        'pending': {'is_approved': False, 'is_rejected': False},
+        'approved': {'is_approved': True},
+        'purchased': {'is_purchased': True},
+    }
+
+    def get(self, request):
+        state = request.query_params.get('state', 'to_purchase')
+        if state not in self.states:
+            raise ValidationError({'state': f"Choose one of: {', '.join(self.states)}."})
+        items = IngredientItem.objects.filter(is_deleted=False, **self.states[state])
+        name = request.query_params.get('name')
+        if name:
+            items = items.filter(name=name)
+
+        totals = (
+            items.exclude(base_amount=None)
+            .values('name', 'base_unit')
+            .annotate(total=Sum('base_amount'), items=Count('id'), requests=Count('request', distinct=True))
+            .order_by('name', 'base_unit')
+        )
+        results = []
+        for row in totals:
+            amount, unit = humanize(row['total'], row['base_unit'])
+            results.append({
+                'name': row['name'],
+                'amount': amount.normalize(),
+                'unit': unit,
+                'items': row['items'],
+                'requests': row['requests'],
+            })
+        return Response({
+            'state': state,
+            'results': results,
+            'unparsed_items': items.filter(base_amount=None).count(),
+        })
+
 ##################################################################################
 #                        Restore & History Views                                 #
 ##################################################################################
@@ -173,16 +232,11 @@ class IngredientRequestRestoreView(RestoreMixin, APIView):
     permission_classes = [IsAdminOnly]
 
     def post(self, request, pk):
-        instance = IngredientRequest.objects.get(pk=pk)
+        instance = self.get_restore_object(IngredientRequest, pk)
         instance.is_deleted = False
         instance.save()
-        cache_key = f'views.decorators.cache.cache_page.{request.get_full_path()}'
-        cache.delete(cache_key)
         return Response({"success": f"IngredientRequest '{instance.id}' restored"}, status=status.HTTP_200_OK)
 
-class IngredientRequestHistoryList(IngredientBaseView, generics.ListAPIView):
-    serializer_class = IngredientRequestSerializer
+class IngredientRequestHistoryList(IngredientBaseView, HistoryListView):
+    model = IngredientRequest
     permission_classes = [IsAdminOnly]
-
-    def get_queryset(self):
-        return IngredientRequest.history.all()
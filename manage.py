@@ -6,7 +6,9 @@ import sys
 
 def main():
     """Run administrative tasks."""
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "BCafe.settings")
+    # The test suite runs without Redis or a Celery broker (BCafe.test_settings).
+    default = "BCafe.test_settings" if sys.argv[1:2] == ["test"] else "BCafe.settings"
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", default)
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
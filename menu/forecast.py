@@ -0,0 +1,156 @@
+# -----------------  Django imports   ------------------------
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Sum
+from django.db.models.functions import ExtractHour, TruncDate
+from django.utils import timezone
+# -------------------   Apps imports ------------------------
+from orders.choices import OrderStatusChoices
+from utility.httpcache import get_or_compute, store_value
+# -------------------  Other imports   ------------------------
+from dataclasses import dataclass
+from datetime import timedelta
+import numpy as np
+import time
+
+FORECAST_CACHE_KEY = "menu:forecast:{as_of}"
+
+##################################################################################
+#                              Demand history                                    #
+##################################################################################
+
+def load_demand(start, end):
+    """
+    Units sold per (menu item, local day, hour) between two dates, as NumPy
+    columns. The database does the grouping, so Python only touches one
+    row per item-hour that actually had sales.
+    """
+    OrderItem = apps.get_model("orders", "OrderItem")
+    rows = list(
+        OrderItem.objects.filter(order__created_at__date__range=(start, end))
+        .exclude(order__status=OrderStatusChoices.CANCELLED)
+        .annotate(day=TruncDate("order__created_at"), hour=ExtractHour("order__created_at"))
+        .values_list("menu_item_id", "day", "hour")
+        .annotate(units=Sum("quantity"))
+        .order_by()
+    )
+    item_ids, days, hours, units = zip(*rows) if rows else ((), (), (), ())
+    return (
+        np.array(item_ids, dtype=np.int64),
+        np.array(days, dtype="datetime64[D]"),
+        np.array(hours, dtype=np.int64),
+        np.array(units, dtype=np.float64),
+    )
+
+##################################################################################
+#                              Vectorized model                                  #
+##################################################################################
+
+@dataclass
+class Forecast:
+    """
+    Fitted per-item demand model. Row i of every array belongs to item_ids[i].
+
+    level:       deseasonalized units per day (exponentially smoothed)
+    weekday:     (n, 7) day-of-week factors, Monday first, mean 1
+    hour_share:  (n, 24) share of a day's units sold in each hour
+    """
+    item_ids: np.ndarray
+    level: np.ndarray
+    weekday: np.ndarray
+    hour_share: np.ndarray
+    as_of: object  # last day of history (datetime.date)
+
+    def daily(self, days):
+        """(n, days) expected units for the `days` days after as_of."""
+        future = np.datetime64(self.as_of, "D") + np.arange(1, days + 1)
+        return self.level[:, None] * self.weekday[:, weekday_of(future)]
+
+
+def weekday_of(days):
+    """Monday=0 weekday of datetime64[D] values (1970-01-01 was a Thursday)."""
+    return (days.astype(np.int64) + 3) % 7
+
+
+def fit(item_ids, days, hours, units, start, end, alpha=0.3):
+    """
+    Fit seasonality and simple exponential smoothing for every item at once.
+
+    All steps are array operations over the (items x days) matrix: bincount
+    builds the matrices, a (days x 7) one-hot product gives weekday totals,
+    and the smoothed level is one matrix-vector product with the
+    exponential weights, so there is no per-item or per-day Python loop.
+    """
+    start, end = np.datetime64(start, "D"), np.datetime64(end, "D")
+    n_days = int((end - start).astype(np.int64)) + 1
+    ids, rows = np.unique(item_ids, return_inverse=True)
+    n_items = len(ids)
+    columns = (days - start).astype(np.int64)
+
+    daily = np.bincount(
+        rows * n_days + columns, weights=units, minlength=n_items * n_days
+    ).astype(np.float64).reshape(n_items, n_days)
+    hourly = np.bincount(
+        rows * 24 + hours, weights=units, minlength=n_items * 24
+    ).astype(np.float64).reshape(n_items, 24)
+
+    # Items only count from their first sale, so new items are not diluted
+    # by the empty days before they were on the menu.
+    active = np.arange(n_days) >= (daily > 0).argmax(axis=1)[:, None]
+
+    # Day-of-week factors: mean units on each weekday relative to the overall mean.
+    weekdays = weekday_of(start + np.arange(n_days))
+    one_hot = np.eye(7)[weekdays]
+    observed = active @ one_hot
+    weekday_mean = (daily @ one_hot) / np.maximum(observed, 1)
+    overall = daily.sum(axis=1, keepdims=True) / np.maximum(active.sum(axis=1, keepdims=True), 1)
+    # Weekdays not seen yet keep a neutral factor of 1.
+    factors = np.divide(
+        weekday_mean, overall, out=np.ones_like(weekday_mean), where=(overall > 0) & (observed > 0)
+    )
+
+    # Simple exponential smoothing on the deseasonalized series, in closed form:
+    # level = sum_t w_t * x_t / sum_t w_t over the active days, with
+    # w_t = alpha * (1 - alpha) ** (T - 1 - t).
+    seasonal = factors[:, weekdays]
+    deseasonalized = np.divide(daily, seasonal, out=np.zeros_like(daily), where=seasonal > 0)
+    weights = alpha * (1 - alpha) ** np.arange(n_days - 1, -1, -1, dtype=np.float64)
+    level = (deseasonalized @ weights) / np.maximum(active @ weights, np.finfo(float).tiny)
+
+    totals = hourly.sum(axis=1, keepdims=True)
+    hour_share = np.divide(hourly, totals, out=np.full_like(hourly, 1 / 24), where=totals > 0)
+    return Forecast(ids, level, factors, hour_share, end.astype(object))
+
+##################################################################################
+#                              Cached forecasts                                  #
+##################################################################################
+
+def forecast_key():
+    """Cache key of the forecast fitted on the history up to yesterday."""
+    return FORECAST_CACHE_KEY.format(as_of=timezone.localdate() - timedelta(days=1))
+
+
+def compute_forecast(history_days=None, alpha=None):
+    history_days = history_days or getattr(settings, "FORECAST_HISTORY_DAYS", 730)
+    alpha = alpha or getattr(settings, "FORECAST_SMOOTHING", 0.3)
+    end = timezone.localdate() - timedelta(days=1)
+    start = end - timedelta(days=history_days - 1)
+    return fit(*load_demand(start, end), start, end, alpha=alpha)
+
+
+def refresh_forecast():
+    """Refit and store the forecast (refresh_demand_forecast task, after midnight)."""
+    key, start = forecast_key(), time.time()
+    forecast = compute_forecast()
+    store_value(key, forecast, getattr(settings, "FORECAST_CACHE_TTL", 60 * 60 * 24), cost=time.time() - start)
+    return forecast
+
+
+def get_forecast():
+    """
+    Cached Forecast of yesterday's data. On a miss one worker fits it
+    (get_or_compute) while the others wait for it or keep the stale copy.
+    """
+    return get_or_compute(
+        forecast_key(), compute_forecast, getattr(settings, "FORECAST_CACHE_TTL", 60 * 60 * 24), "menu"
+    )
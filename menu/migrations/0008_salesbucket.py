@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0007_historicalmenuitem'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SalesBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], max_length=4)),
+                ('bucket_start', models.DateTimeField()),
+                ('quantity', models.PositiveIntegerField(default=0)),
+                ('menu_item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sales_buckets', to='menu.menuitem')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['granularity', 'bucket_start'], name='menu_salesb_granula_b06ab6_idx')],
+                'constraints': [models.UniqueConstraint(fields=('menu_item', 'granularity', 'bucket_start'), name='unique_sales_bucket')],
+            },
+        ),
+    ]
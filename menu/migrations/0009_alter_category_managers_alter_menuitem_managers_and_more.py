@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:09
+
+import django.db.models.manager
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0008_salesbucket'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='category',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='menuitem',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.RemoveIndex(
+            model_name='menuitem',
+            name='menu_menuit_categor_fa258f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='menuitem',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['category', 'status'], name='menuitem_live_category_status'),
+        ),
+    ]
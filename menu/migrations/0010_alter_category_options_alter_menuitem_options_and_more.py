@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:49
+
+import django.db.models.manager
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0009_alter_category_managers_alter_menuitem_managers_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='category',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects', 'ordering': ['name'], 'verbose_name': 'Category', 'verbose_name_plural': 'Categories'},
+        ),
+        migrations.AlterModelOptions(
+            name='menuitem',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects', 'ordering': ['-created_at'], 'verbose_name': 'Menu item', 'verbose_name_plural': 'Menu items'},
+        ),
+        migrations.AlterModelManagers(
+            name='category',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='menuitem',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
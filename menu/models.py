@@ -1,10 +1,12 @@
 # -------------------   Django imports ------------------------
 from django.db import models
+from django.db.models import Q
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 # -------------------   Apps imports ------------------------
 from utility.models import BaseModel
-from .choices import ItemStatus
+from utility.history import CompactHistoricalRecords
+from .choices import ItemStatus, SalesGranularity
 
 ##################################################################################
 #                             Category Model                                     #
@@ -17,7 +19,7 @@ class Category(BaseModel):
     def __str__(self):
         return self.name
     
-    class Meta:
+    class Meta(BaseModel.Meta):
         ordering = ['name']
         verbose_name = "Category"
         verbose_name_plural = "Categories"
@@ -43,21 +45,37 @@ class MenuItem(BaseModel):
         choices=ItemStatus.choices,
         default=ItemStatus.AVAILABLE
         )
+    # Stock / sales counter updates (see adjust_stock) are not recorded.
+    history = CompactHistoricalRecords(hot_fields=["stock", "sold_count", "status"])
 
-    @property
-    def is_discount_active(self):
+    @staticmethod
+    def discount_is_active(discount_percent, discount_start, discount_end):
         now = timezone.now()
         return (
-            self.discount_percent > 0
-            and self.discount_start and self.discount_end
-            and self.discount_start <= now <= self.discount_end
+            discount_percent > 0
+            and discount_start and discount_end
+            and discount_start <= now <= discount_end
         )
 
+    @staticmethod
+    def discounted_price(price, discount_percent, discount_start, discount_end):
+        if MenuItem.discount_is_active(discount_percent, discount_start, discount_end):
+            return price - (price * discount_percent / 100)
+        return price
+
+    @staticmethod
+    def discount_changes():
+        """Instants at which a discount opens or closes: final prices change without a write."""
+        windows = MenuItem.objects.filter(discount_percent__gt=0).values_list("discount_start", "discount_end")
+        return [moment for window in windows for moment in window if moment is not None]
+
+    @property
+    def is_discount_active(self):
+        return self.discount_is_active(self.discount_percent, self.discount_start, self.discount_end)
+
     @property
     def final_price(self):
-        if self.is_discount_active:
-            return self.price - (self.price * self.discount_percent / 100)
-        return self.price
+        return self.discounted_price(self.price, self.discount_percent, self.discount_start, self.discount_end)
     
     
     def clean(self):
@@ -84,6 +102,15 @@ class MenuItem(BaseModel):
             raise ValidationError("Discount percent must be between 0 and 100.")
     
     
+    def adjust_stock(self, delta):
+        """
+        Change stock by `delta` (never below zero) and save only the stock
+        columns, so the per-order counter update writes no history row.
+        """
+        self.stock = max(self.stock + delta, 0)
+        self.save(update_fields=["stock", "status", "updated_at"])
+
+
     def save(self, *args, **kwargs):
         self.status = (
             ItemStatus.OUT_OF_STOCK if self.stock == 0 else ItemStatus.AVAILABLE
@@ -96,7 +123,7 @@ class MenuItem(BaseModel):
         return f"{self.name} - ({self.price} Toman.)"
     
     
-    class Meta:
+    class Meta(BaseModel.Meta):
         ordering = ['-created_at']
         verbose_name = "Menu item"
         verbose_name_plural = "Menu items"
@@ -109,11 +136,40 @@ class MenuItem(BaseModel):
 
         - name: speeds up queries filtering by item name.
         - category + status: speeds up queries filtering by category and status.
+          Partial on live rows, so soft-deleted items do not grow it.
 
         Note: improves read performance; slight overhead on writes.
         """
         indexes = [
             models.Index(fields=['name']),  
-            models.Index(fields=['category', 'status']), 
-        ] 
-        
\ No newline at end of file
+            models.Index(
+                fields=['category', 'status'], condition=Q(is_deleted=False), name='menuitem_live_category_status'
+            ),
+        ]
+
+##################################################################################
+#                             SalesBucket Model                                  #
+##################################################################################
+
+class SalesBucket(models.Model):
+    """
+    Rollup of units sold per menu item per hour or per day.
+    Written once per paid order (see menu.sales), read by windowed top-sellers.
+    """
+    menu_item = models.ForeignKey(MenuItem, on_delete=models.CASCADE, related_name="sales_buckets")
+    granularity = models.CharField(max_length=4, choices=SalesGranularity.choices)
+    bucket_start = models.DateTimeField()
+    quantity = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.menu_item_id} @ {self.bucket_start:%Y-%m-%d %H:%M} ({self.granularity}): {self.quantity}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['menu_item', 'granularity', 'bucket_start'], name='unique_sales_bucket'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['granularity', 'bucket_start']),
+        ]
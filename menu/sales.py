@@ -0,0 +1,135 @@
+# -----------------  Django imports   ------------------------
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.db.models.functions import Now
+from django.utils import timezone
+# -------------------   Apps imports ------------------------
+from .models import MenuItem, SalesBucket
+from .choices import SalesGranularity
+from utility.httpcache import bump_data_version
+# -------------------  Other imports   ------------------------
+from collections import Counter
+from datetime import timedelta
+import heapq
+import re
+
+WINDOW_PATTERN = re.compile(r"^(?:(\d+)d)?(?:(\d+)h)?$")
+
+##################################################################################
+#                              Recording sales                                   #
+##################################################################################
+
+def bucket_starts(at):
+    """Hour and day bucket boundaries that contain `at`."""
+    hour = at.replace(minute=0, second=0, microsecond=0)
+    return {
+        SalesGranularity.HOUR: hour,
+        SalesGranularity.DAY: hour.replace(hour=0),
+    }
+
+
+def _add_to_bucket(menu_item_id, granularity, start, quantity):
+    bucket = SalesBucket.objects.filter(menu_item_id=menu_item_id, granularity=granularity, bucket_start=start)
+    if bucket.update(quantity=F("quantity") + quantity):
+        return
+    try:
+        with transaction.atomic():
+            SalesBucket.objects.create(
+                menu_item_id=menu_item_id, granularity=granularity, bucket_start=start, quantity=quantity
+            )
+    except IntegrityError:
+        # Another writer created the bucket in between.
+        bucket.update(quantity=F("quantity") + quantity)
+
+
+def record_sales(lines, at=None):
+    """
+    Add sold quantities to MenuItem.sold_count and to the hour/day buckets.
+
+    `lines` is an iterable of (menu_item_id, quantity). Counters are updated
+    with F() expressions, so concurrent payments never lose increments and no
+    model save (or history row) is triggered. updated_at is set too: it is
+    the Last-Modified of the cached menu responses.
+    """
+    totals = Counter()
+    for menu_item_id, quantity in lines:
+        totals[menu_item_id] += quantity
+    starts = bucket_starts(at or timezone.now())
+
+    with transaction.atomic():
+        for menu_item_id, quantity in totals.items():
+            MenuItem.objects.filter(pk=menu_item_id).update(sold_count=F("sold_count") + quantity, updated_at=Now())
+            for granularity, start in starts.items():
+                _add_to_bucket(menu_item_id, granularity, start, quantity)
+        # update() sends no post_save; cached menu responses are ordered by sold_count.
+        transaction.on_commit(lambda: bump_data_version(MenuItem))
+
+
+def prune_hourly_buckets(older_than_days):
+    """Drop hour buckets past the retention window; day buckets are kept."""
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    return SalesBucket.objects.filter(
+        granularity=SalesGranularity.HOUR, bucket_start__lt=cutoff
+    ).delete()[0]
+
+##################################################################################
+#                              Top sellers                                       #
+##################################################################################
+
+def parse_window(value):
+    """
+    Parse "7d", "12h" or "1d6h" into a timedelta of at most
+    SALES_MAX_WINDOW_DAYS. Raises ValueError for anything else.
+    """
+    match = WINDOW_PATTERN.match(value or "")
+    if not match or not any(match.groups()):
+        raise ValueError(f"Invalid window '{value}'. Use e.g. 24h, 7d or 1d12h.")
+    days, hours = (int(part or 0) for part in match.groups())
+    if not days and not hours:
+        raise ValueError("Window must be longer than zero.")
+    max_days = settings.SALES_MAX_WINDOW_DAYS
+    if days * 24 + hours > max_days * 24:
+        raise ValueError(f"Window can be at most {max_days}d.")
+    return timedelta(days=days, hours=hours)
+
+
+def _bucket_totals(granularity, start, end=None):
+    buckets = SalesBucket.objects.filter(granularity=granularity, bucket_start__gte=start)
+    if end is not None:
+        buckets = buckets.filter(bucket_start__lt=end)
+    return Counter(dict(buckets.values_list("menu_item").annotate(total=Sum("quantity"))))
+
+
+def top_seller_ids(window, limit=10, now=None):
+    """
+    Menu item ids with the most units sold in the last `window`, best first.
+
+    Whole days come from day buckets and the partial first day from hour
+    buckets, so the cost depends on the number of buckets in the window,
+    never on the number of orders. The two partial sums are merged and the
+    top `limit` picked with a heap.
+
+    Hour buckets older than SALES_HOURLY_RETENTION_DAYS are pruned, so a
+    window reaching past them counts its whole first day from the day bucket.
+    """
+    now = now or timezone.now()
+    start = bucket_starts(now - window)[SalesGranularity.HOUR]
+    if start < now - timedelta(days=settings.SALES_HOURLY_RETENTION_DAYS):
+        start = bucket_starts(start)[SalesGranularity.DAY]
+    first_full_day = bucket_starts(start)[SalesGranularity.DAY]
+    if first_full_day < start:
+        first_full_day += timedelta(days=1)
+
+    totals = _bucket_totals(SalesGranularity.DAY, first_full_day)
+    if start < first_full_day:
+        totals.update(_bucket_totals(SalesGranularity.HOUR, start, first_full_day))
+    best = heapq.nlargest(limit, totals.items(), key=lambda pair: (pair[1], -pair[0]))
+    return [menu_item_id for menu_item_id, _ in best]
+
+
+def top_sellers(window, limit=10):
+    """MenuItem instances for top_seller_ids(), in rank order."""
+    ids = top_seller_ids(window, limit)
+    items = MenuItem.objects.select_related("category").in_bulk(ids)
+    return [items[pk] for pk in ids if pk in items]
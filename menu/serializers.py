@@ -55,4 +55,11 @@ class MenuItemSerializer(BaseSerializer):
         return obj.final_price
     
     def get_is_discount_active(self, obj):
-        return obj.is_discount_active
\ No newline at end of file
+        return obj.is_discount_active
+
+    # The method fields as functions of column values, for the compiled
+    # reader (utility.readers).
+    row_methods = {
+        'final_price': (('price', 'discount_percent', 'discount_start', 'discount_end'), MenuItem.discounted_price),
+        'is_discount_active': (('discount_percent', 'discount_start', 'discount_end'), MenuItem.discount_is_active),
+    }
\ No newline at end of file
@@ -1,9 +1,11 @@
 # -----------------  Django imports   ------------------------
-from django.db.models.signals import pre_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 # -------------------   Apps imports ------------------------
-from .models import MenuItem
+from .models import Category, MenuItem
 from .choices import ItemStatus
+from utility.httpcache import bump_data_version
 
 @receiver(pre_save, sender=MenuItem)
 def menu_item_change_handler(sender, instance, **kwargs):
@@ -21,4 +23,13 @@ def menu_item_change_handler(sender, instance, **kwargs):
     if instance.stock == 0:
         instance.status = ItemStatus.OUT_OF_STOCK
     else:
-        instance.status = ItemStatus.AVAILABLE
\ No newline at end of file
+        instance.status = ItemStatus.AVAILABLE
+
+
+@receiver(post_save, sender=MenuItem)
+@receiver(post_delete, sender=MenuItem)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_menu_responses(sender, **kwargs):
+    """Cached menu responses (utility.httpcache) get a new ETag."""
+    transaction.on_commit(lambda: bump_data_version(sender))
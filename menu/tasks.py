@@ -0,0 +1,17 @@
+from celery import shared_task
+from django.conf import settings
+from .sales import prune_hourly_buckets
+from .forecast import refresh_forecast
+
+@shared_task
+def prune_sales_buckets():
+    # Hour buckets only feed the partial first day of a window; day buckets stay.
+    days = getattr(settings, 'SALES_HOURLY_RETENTION_DAYS', 8)
+    return prune_hourly_buckets(days)
+
+
+@shared_task
+def refresh_demand_forecast():
+    # Refit after midnight so the forecast includes yesterday's sales.
+    forecast = refresh_forecast()
+    return len(forecast.item_ids)
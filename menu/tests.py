@@ -0,0 +1,192 @@
+# -------------------  Django imports   ------------------------
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django.utils.http import parse_http_date
+# -------------------  DRF imports   ------------------------
+from rest_framework.test import APITestCase
+# -------------------   Apps imports ------------------------
+from orders.choices import OrderStatusChoices
+from orders.models import Order, OrderItem
+from .forecast import get_forecast, load_demand
+from .models import Category, MenuItem, SalesBucket
+from .sales import parse_window, record_sales, top_seller_ids
+# -------------------  Other imports   ------------------------
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+##################################################################################
+#                     Compiled readers vs MenuItemSerializer                     #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None)
+class MenuItemReaderTests(APITestCase):
+    """The compiled list endpoints render the same JSON as the serializer."""
+
+    def setUp(self):
+        admin = get_user_model().objects.create_user("admin", password="secret-pass-1", is_staff=True)
+        self.client.force_authenticate(admin)
+        coffee = Category.objects.create(name="Coffee", is_cofe=True)
+        cakes = Category.objects.create(name="Cakes")
+        now = timezone.now()
+        MenuItem.objects.create(
+            category=coffee, name="Espresso", price="3.50", stock=10,
+            preparation_time=timedelta(minutes=3, seconds=30),
+            discount_percent=20, discount_start=now - timedelta(days=1), discount_end=now + timedelta(days=1),
+        )
+        MenuItem.objects.create(
+            category=coffee, name="Latte", price="4.25", stock=0, status="out_of_stock",
+            discount_percent=10,
+            discount_start=datetime(2020, 1, 1, 8, tzinfo=dt_timezone.utc),
+            discount_end=datetime(2020, 1, 2, 8, tzinfo=dt_timezone.utc),
+        )
+        MenuItem.objects.create(category=cakes, name="Cheesecake", description="New York", price="6", is_special=True)
+        # Whole seconds: the serializer prints no microseconds for them.
+        MenuItem.objects.filter(name="Latte").update(created_at=datetime(2024, 5, 1, 12, tzinfo=dt_timezone.utc))
+
+    def get(self, path, compiled):
+        cache.clear()
+        with override_settings(COMPILED_READERS=compiled):
+            response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def assertSameAsSerializer(self, path):
+        expected = self.get(path, compiled=False)
+        self.assertTrue(expected["results"] if isinstance(expected, dict) else expected)
+        self.assertEqual(self.get(path, compiled=True), expected)
+
+    def test_menu_item_list(self):
+        self.assertSameAsSerializer("/menu/menu-items/")
+
+    def test_menu_item_list_filtered_and_ordered(self):
+        self.assertSameAsSerializer("/menu/menu-items/?ordering=price&min_price=4")
+
+    def test_active_menu_items(self):
+        self.assertSameAsSerializer("/menu/menu-items/active/")
+
+    def test_menu_item_list_in_other_time_zone(self):
+        with timezone.override("Asia/Tehran"):
+            self.assertSameAsSerializer("/menu/menu-items/")
+
+##################################################################################
+#                          Sales buckets & top sellers                           #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None, SALES_HOURLY_RETENTION_DAYS=8)
+class SalesTests(APITestCase):
+    """Hour/day buckets written by record_sales() and the windows read from them."""
+
+    def setUp(self):
+        cache.clear()
+        category = Category.objects.create(name="Coffee")
+        self.tea, self.mocha, self.latte = (
+            MenuItem.objects.create(category=category, name=name, price="3") for name in ("Tea", "Mocha", "Latte")
+        )
+        self.now = datetime(2026, 3, 10, 15, 30, tzinfo=dt_timezone.utc)
+
+    def at(self, day, hour):
+        return datetime(2026, 3, day, hour, 20, tzinfo=dt_timezone.utc)
+
+    def test_record_sales_adds_to_hour_and_day_buckets(self):
+        record_sales([(self.tea.pk, 2), (self.tea.pk, 1), (self.mocha.pk, 1)], at=self.at(10, 9))
+        record_sales([(self.tea.pk, 4)], at=self.at(10, 11))
+
+        buckets = SalesBucket.objects.filter(menu_item=self.tea).order_by("granularity", "bucket_start")
+        self.assertEqual(
+            [(bucket.granularity, bucket.bucket_start.hour, bucket.quantity) for bucket in buckets],
+            [("day", 0, 7), ("hour", 9, 3), ("hour", 11, 4)],
+        )
+        self.tea.refresh_from_db()
+        self.assertEqual(self.tea.sold_count, 7)
+
+    def test_parse_window(self):
+        self.assertEqual(parse_window("7d"), timedelta(days=7))
+        self.assertEqual(parse_window("12h"), timedelta(hours=12))
+        self.assertEqual(parse_window("1d6h"), timedelta(days=1, hours=6))
+        for value in ("", "0d", "6h1d", "2w", "367d"):
+            with self.assertRaises(ValueError, msg=value):
+                parse_window(value)
+
+    def test_window_counts_partial_first_day_from_hour_buckets(self):
+        record_sales([(self.tea.pk, 5)], at=self.at(9, 8))      # before the window
+        record_sales([(self.mocha.pk, 2)], at=self.at(9, 10))   # partial first day
+        record_sales([(self.latte.pk, 1)], at=self.at(10, 14))  # today's day bucket
+        record_sales([(self.tea.pk, 1)], at=self.at(10, 15))
+
+        # 1d6h before 15:30 is 09:30 yesterday: the 09:00 hour bucket is the first counted.
+        self.assertEqual(top_seller_ids(parse_window("1d6h"), now=self.now), [self.mocha.pk, self.tea.pk, self.latte.pk])
+        self.assertEqual(top_seller_ids(parse_window("2d"), now=self.now), [self.tea.pk, self.mocha.pk, self.latte.pk])
+        self.assertEqual(top_seller_ids(parse_window("2d"), limit=1, now=self.now), [self.tea.pk])
+
+    def test_window_past_hourly_retention_counts_whole_first_day(self):
+        record_sales([(self.tea.pk, 1)], at=self.at(1, 2))
+        record_sales([(self.mocha.pk, 2)], at=self.at(1, 20))
+        SalesBucket.objects.filter(granularity="hour").delete()  # pruned
+
+        # 9d6h reaches 09:30 on March 1st, older than the retention: that day counts whole.
+        self.assertEqual(top_seller_ids(parse_window("9d6h"), now=self.now), [self.mocha.pk, self.tea.pk])
+
+    def test_ties_rank_lower_ids_first(self):
+        record_sales([(self.latte.pk, 2), (self.tea.pk, 2)], at=self.at(10, 9))
+
+        self.assertEqual(top_seller_ids(parse_window("1d"), now=self.now), [self.tea.pk, self.latte.pk])
+
+    def test_sale_moves_last_modified_of_the_menu(self):
+        yesterday = timezone.now() - timedelta(days=1)
+        MenuItem.objects.update(updated_at=yesterday)
+        Category.objects.update(updated_at=yesterday)
+        since = self.client.get("/menu/menu-items/")["Last-Modified"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            record_sales([(self.tea.pk, 1)])
+
+        response = self.client.get("/menu/menu-items/", headers={"if-modified-since": since})
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(parse_http_date(response["Last-Modified"]), parse_http_date(since))
+
+##################################################################################
+#                               Demand forecast                                  #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None, FORECAST_HISTORY_DAYS=28)
+class ForecastTests(TestCase):
+    """The demand history the forecast is fitted on, the fit and its cache."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user("guest", password="secret-pass-1")
+        category = Category.objects.create(name="Coffee")
+        self.tea = MenuItem.objects.create(category=category, name="Tea", price="3", stock=1000)
+        yesterday = timezone.localdate() - timedelta(days=1)
+        self.days = [yesterday - timedelta(days=offset) for offset in range(28)]
+
+    def sell(self, day, quantity, status=OrderStatusChoices.CONFIRMED):
+        order = Order.objects.create(user=self.user, status=status)
+        OrderItem.objects.create(order=order, menu_item=self.tea, quantity=quantity)
+        at = timezone.make_aware(datetime.combine(day, time(12, 15)))
+        Order.all_objects.filter(pk=order.pk).update(created_at=at)
+
+    def test_cancelled_orders_are_not_demand(self):
+        self.sell(self.days[0], 2)
+        self.sell(self.days[0], 50, status=OrderStatusChoices.CANCELLED)
+
+        item_ids, _, hours, units = load_demand(self.days[-1], self.days[0])
+        self.assertEqual((item_ids.tolist(), hours.tolist(), units.tolist()), ([self.tea.pk], [12], [2.0]))
+
+    def test_steady_demand_is_forecast_as_is(self):
+        for day in self.days:
+            self.sell(day, 2)
+
+        forecast = get_forecast()
+        self.assertEqual(forecast.item_ids.tolist(), [self.tea.pk])
+        self.assertEqual(forecast.as_of, self.days[0])
+        self.assertEqual(forecast.daily(7).round(6).tolist(), [[2.0] * 7])
+        self.assertEqual(forecast.hour_share[0].argmax(), 12)
+
+    def test_forecast_is_fitted_once(self):
+        self.sell(self.days[0], 2)
+        get_forecast()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_forecast().item_ids.tolist(), [self.tea.pk])
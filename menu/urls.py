@@ -12,7 +12,8 @@ from .views import (
     ActiveMenuItems, 
     OutOfStockMenuItems,
     MenuItemsByCategory, 
-    MenuItemRestoreView, MenuItemHistoryList
+    MenuItemRestoreView, MenuItemHistoryList,
+    MenuItemForecast
     )
 
 urlpatterns = [
@@ -52,4 +53,7 @@ urlpatterns = [
 
     # List historical changes of menu items
     path("menu-items/history/", MenuItemHistoryList.as_view(), name="menuitem-history"),
+
+    # Demand forecast per menu item
+    path("forecast/", MenuItemForecast.as_view(), name="menu-forecast"),
 ]
@@ -1,7 +1,5 @@
 # -----------------  Django imports   ------------------------
 from django.utils import timezone
-from django.core.cache import cache
-from django.views.decorators.cache import cache_page
 from django.utils.decorators import method_decorator
 
 # -------------------  DRF imports   ------------------------
@@ -9,6 +7,7 @@ from rest_framework import generics, filters, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser
+from rest_framework.exceptions import ValidationError
 
 from django_filters.rest_framework import DjangoFilterBackend
 
@@ -18,11 +17,18 @@ from .serializers import CategorySerializer, MenuItemSerializer
 from .permissions import IsAdminOrReadOnly
 from .filters import MenuItemFilter, MenuItemPrepTimeFilter
 from .throttles import MenuItemListThrottle
-from utility.views import BaseAPIView
-from utility.mixins import RestoreMixin
+from .sales import parse_window, top_sellers
+from .forecast import get_forecast
+from utility.httpcache import cache_response
+from utility.views import BaseAPIView, HistoryListView
+from utility.mixins import CompiledListMixin, RestoreMixin, SoftDeleteMixin
+# -------------------  Other imports   ------------------------
+from datetime import timedelta
+import numpy as np
 
-# ----------------- Cache TTL -----------------
-CACHE_TTL = 60 * 5  # 5 minutes
+# ----------------- Response caching -----------------
+# Final prices (and the special offers) change when discount windows open or close.
+cache_menu = cache_response(MenuItem, Category, changes_at=MenuItem.discount_changes)
 
 
 ##################################################################################
@@ -37,30 +43,19 @@ class BaseListCreateView(BaseAPIView, generics.ListCreateAPIView):
     permission_classes = [IsAdminOrReadOnly]
 
 
-class BaseRetrieveUpdateDestroyView(BaseAPIView, generics.RetrieveUpdateDestroyAPIView):
+class BaseRetrieveUpdateDestroyView(SoftDeleteMixin, BaseAPIView, generics.RetrieveUpdateDestroyAPIView):
     """
     Base class for retrieve, update, and destroy endpoints.
-    Provides default permission and behavior.
+    Provides default permission and soft delete.
     """
     permission_classes = [IsAdminOrReadOnly]
 
-    def perform_update(self, serializer):
-        instance = serializer.save()
-        cache_key = f'views.decorators.cache.cache_page.{self.request.get_full_path()}'
-        cache.delete(cache_key)
-        return instance
-
-    def perform_destroy(self, instance):
-        instance.delete() 
-        cache_key = f'views.decorators.cache.cache_page.{self.request.get_full_path()}'
-        cache.delete(cache_key)
-
 
 ##################################################################################
 #                             Category Views                                     #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_response(Category), name='dispatch')
 class CategoryList(BaseListCreateView):
     """
     List all categories or create a new one (admin only).
@@ -69,7 +64,7 @@ class CategoryList(BaseListCreateView):
     serializer_class = CategorySerializer
 
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_response(Category), name='dispatch')
 class CategoryDetail(BaseRetrieveUpdateDestroyView):
     """
     Retrieve, update or delete a category (admin only for write ops).
@@ -82,8 +77,8 @@ class CategoryDetail(BaseRetrieveUpdateDestroyView):
 #                             MenuItem Views                                     #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
-class MenuItemList(BaseListCreateView):
+@method_decorator(cache_menu, name='dispatch')
+class MenuItemList(CompiledListMixin, BaseListCreateView):
     """
     List all menu items or create a new one (admin only).
     """
@@ -97,7 +92,7 @@ class MenuItemList(BaseListCreateView):
     throttle_classes = [MenuItemListThrottle]
 
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_menu, name='dispatch')
 class MenuItemDetail(BaseRetrieveUpdateDestroyView):
     """
     Retrieve, update or delete a menu item (admin only for write ops).
@@ -110,7 +105,7 @@ class MenuItemDetail(BaseRetrieveUpdateDestroyView):
 #                             SpecialOffer Views                                 #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_menu, name='dispatch')
 class SpecialOfferBaseView(BaseAPIView):
     """
     Base queryset logic for active special offers.
@@ -143,16 +138,26 @@ class SpecialOfferDetail(SpecialOfferBaseView, generics.RetrieveUpdateDestroyAPI
 #                         TopSellingMenuItems Views                              #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(
+    cache_response(MenuItem, Category, changes_at=MenuItem.discount_changes, clock=True), name='dispatch'
+)
 class TopSellingMenuItems(BaseAPIView, generics.ListAPIView):
     """
     Returns the top 10 best-selling menu items.
+    All-time by default; `?window=7d` (or 24h, 1d12h, ...) ranks by units
+    sold in that window using the sales buckets.
     """
     serializer_class = MenuItemSerializer
     permission_classes = [IsAdminOrReadOnly]
     throttle_classes = [MenuItemListThrottle]
 
     def get_queryset(self):
+        window = self.request.query_params.get("window")
+        if window:
+            try:
+                return top_sellers(parse_window(window), limit=10)
+            except ValueError as exc:
+                raise ValidationError({"window": str(exc)})
         return MenuItem.objects.order_by("-sold_count")[:10]
 
 
@@ -160,7 +165,7 @@ class TopSellingMenuItems(BaseAPIView, generics.ListAPIView):
 #                           RecentMenuItems Views                                #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_menu, name='dispatch')
 class RecentMenuItems(BaseAPIView, generics.ListAPIView):
     """
     Returns the 10 most recently added menu items.
@@ -177,7 +182,7 @@ class RecentMenuItems(BaseAPIView, generics.ListAPIView):
 #                         MenuItemsByPrepTime Views                              #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_menu, name='dispatch')
 class MenuItemsByPrepTime(BaseAPIView, generics.ListAPIView):
     """
     Filters menu items based on preparation time (max_minutes).
@@ -195,8 +200,8 @@ class MenuItemsByPrepTime(BaseAPIView, generics.ListAPIView):
 #                         ActiveMenuItems Views                                  #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
-class ActiveMenuItems(BaseAPIView, generics.ListAPIView):
+@method_decorator(cache_menu, name='dispatch')
+class ActiveMenuItems(CompiledListMixin, BaseAPIView, generics.ListAPIView):
     """
     Lists all available (in-stock) menu items.
     """
@@ -212,7 +217,7 @@ class ActiveMenuItems(BaseAPIView, generics.ListAPIView):
 #                         OutOfStockMenuItems Views                              #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_menu, name='dispatch')
 class OutOfStockMenuItems(BaseAPIView, generics.ListAPIView):
     """
     Lists all out-of-stock menu items.
@@ -229,7 +234,7 @@ class OutOfStockMenuItems(BaseAPIView, generics.ListAPIView):
 #                         MenuItemsByCategory Views                              #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_menu, name='dispatch')
 class MenuItemsByCategory(BaseAPIView, generics.ListAPIView):
     """
     Returns menu items filtered by category ID.
@@ -253,17 +258,68 @@ class MenuItemRestoreView(RestoreMixin, APIView):
     permission_classes = [IsAdminUser]
 
     def post(self, request, pk):
-        instance = MenuItem.objects.get(pk=pk)
+        instance = self.get_restore_object(MenuItem, pk)
         instance.is_deleted = False
         instance.save()
         return Response({"success": f"MenuItem '{instance.name}' restored"}, status=status.HTTP_200_OK)
 
 
-class MenuItemHistoryList(generics.ListAPIView):
+class MenuItemHistoryList(HistoryListView):
     """
     List all historical changes for menu items (admin only).
     """
+    model = MenuItem
     permission_classes = [IsAdminUser]
 
-    def get_queryset(self):
-        return MenuItem.history.all()  
+
+##################################################################################
+#                           Demand Forecast Views                                #
+##################################################################################
+
+class MenuItemForecast(BaseAPIView, generics.GenericAPIView):
+    """
+    Expected units per menu item for the next `?days=` days (default 7, max 28),
+    with day-of-week seasonality and the busiest hours, highest demand first.
+    `?menu_item=1,2` limits the response to some items. Admin only.
+    """
+    permission_classes = [IsAdminUser]
+    max_days = 28
+
+    def get(self, request):
+        try:
+            days = int(request.query_params.get("days", 7))
+        except ValueError:
+            raise ValidationError({"days": "Must be an integer."})
+        if not 1 <= days <= self.max_days:
+            raise ValidationError({"days": f"Must be between 1 and {self.max_days}."})
+
+        forecast = get_forecast()
+        daily = forecast.daily(days)
+        rows = np.argsort(-daily.sum(axis=1), kind="stable")
+        wanted = request.query_params.get("menu_item")
+        if wanted:
+            try:
+                ids = [int(pk) for pk in wanted.split(",")]
+            except ValueError:
+                raise ValidationError({"menu_item": "Comma separated ids expected."})
+            rows = rows[np.isin(forecast.item_ids[rows], ids)]
+
+        page = self.paginate_queryset(rows.tolist())
+        items = MenuItem.objects.in_bulk(forecast.item_ids[page].tolist())
+        dates = [forecast.as_of + timedelta(days=offset) for offset in range(1, days + 1)]
+        results = []
+        for row in page:
+            item = items.get(int(forecast.item_ids[row]))
+            if item is None:
+                continue
+            results.append({
+                "menu_item": item.id,
+                "name": item.name,
+                "stock": item.stock,
+                "expected_units": round(float(daily[row].sum()), 2),
+                "daily": [
+                    {"date": date, "units": round(float(units), 2)} for date, units in zip(dates, daily[row])
+                ],
+                "peak_hours": np.argsort(-forecast.hour_share[row], kind="stable")[:3].tolist(),
+            })
+        return self.get_paginated_response(results)
@@ -0,0 +1,66 @@
+# -------------------  Django imports   ------------------------
+from django.db import connections
+# -------------------   Apps imports ------------------------
+from .registry import THROTTLED, VIEW_LATENCY, VIEW_QUERIES, VIEW_SQL_SECONDS
+# -------------------  Other imports   ------------------------
+from contextlib import ExitStack
+import time
+
+##################################################################################
+#                              MetricsMiddleware                                 #
+##################################################################################
+
+class QueryCounter:
+    """execute_wrapper that counts statements and their total time."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - start
+
+
+class MetricsMiddleware:
+    """
+    Records per view (the resolved view class name): latency, SQL statements
+    and SQL time, and throttle rejections. Response cache lookups are counted
+    by utility.httpcache, per namespace (see `namespace`).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = QueryCounter()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(queries))
+            response = self.get_response(request)
+        seconds = time.perf_counter() - start
+
+        view = self.view_name(request)
+        VIEW_LATENCY.labels(view, request.method, str(response.status_code)).observe(seconds)
+        VIEW_QUERIES.labels(view).observe(queries.count)
+        VIEW_SQL_SECONDS.labels(view).inc(queries.seconds)
+        if response.status_code == 429:
+            THROTTLED.labels(view).inc()
+        return response
+
+    @staticmethod
+    def view_name(request):
+        match = request.resolver_match
+        if match is None:
+            return "<unresolved>"
+        return getattr(match.func, "view_class", match.func).__name__
+
+    @staticmethod
+    def namespace(request):
+        """The first URL segment: menu, info, orders..."""
+        return request.path_info.strip("/").split("/", 1)[0] or "<root>"
@@ -0,0 +1,19 @@
+# -------------------  Django imports   ------------------------
+from django.conf import settings
+from django.utils.crypto import constant_time_compare
+# -------------------  DRF imports   ------------------------
+from rest_framework.permissions import BasePermission
+
+
+class HasMetricsToken(BasePermission):
+    """
+    "Authorization: Bearer <METRICS_TOKEN>", as sent by a Prometheus scrape
+    config. Closed when METRICS_TOKEN is empty, unless METRICS_PUBLIC is set
+    (e.g. scraped on a private port).
+    """
+
+    def has_permission(self, request, view):
+        token = getattr(settings, "METRICS_TOKEN", "")
+        if not token:
+            return getattr(settings, "METRICS_PUBLIC", False)
+        return constant_time_compare(request.META.get("HTTP_AUTHORIZATION", ""), f"Bearer {token}")
@@ -0,0 +1,99 @@
+# Prometheus metrics. Updates are in-process (one small lock per labelled
+# value). With PROMETHEUS_MULTIPROC_DIR set in the environment of every
+# gunicorn and Celery worker, values are kept in per-process mmap files
+# and summed over all processes at scrape time.
+
+# -------------------  Django imports   ------------------------
+from django.conf import settings
+# -------------------  Other imports   ------------------------
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess
+from prometheus_client.core import GaugeMetricFamily
+import os
+import redis
+
+REGISTRY = CollectorRegistry()
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+TASK_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300)
+
+##################################################################################
+#                                   Metrics                                      #
+##################################################################################
+
+# ------------------------------- Views ---------------------------------
+VIEW_LATENCY = Histogram(
+    "bcafe_view_latency_seconds", "Request latency per view.",
+    ["view", "method", "status"], buckets=LATENCY_BUCKETS, registry=REGISTRY,
+)
+VIEW_QUERIES = Histogram(
+    "bcafe_view_sql_queries", "SQL statements per request.",
+    ["view"], buckets=QUERY_BUCKETS, registry=REGISTRY,
+)
+VIEW_SQL_SECONDS = Counter(
+    "bcafe_view_sql_seconds", "Time spent in SQL per view.", ["view"], registry=REGISTRY,
+)
+THROTTLED = Counter(
+    "bcafe_throttled_requests", "Requests rejected by a throttle (429).", ["view"], registry=REGISTRY,
+)
+
+# ------------------------------- Cache ---------------------------------
+CACHE_REQUESTS = Counter(
+    "bcafe_cache_requests", "Cache lookups per namespace (hit, stale or miss).", ["namespace", "result"], registry=REGISTRY,
+)
+
+# ------------------------------- Celery --------------------------------
+TASK_QUEUE_SECONDS = Histogram(
+    "bcafe_celery_task_queue_seconds", "Time from publishing a task to a worker starting it.",
+    ["task"], buckets=TASK_BUCKETS, registry=REGISTRY,
+)
+TASK_RUN_SECONDS = Histogram(
+    "bcafe_celery_task_run_seconds", "Task run time by final state.",
+    ["task", "state"], buckets=TASK_BUCKETS, registry=REGISTRY,
+)
+
+# ------------------------------- Business ------------------------------
+ORDERS = Counter("bcafe_orders_created", "Orders placed.", registry=REGISTRY)
+PAYMENTS = Counter("bcafe_payments_created", "Payments recorded.", ["method"], registry=REGISTRY)
+PAYMENTS_PAID = Counter("bcafe_payments_paid", "Payments that became paid.", ["method"], registry=REGISTRY)
+PAYMENTS_PAID_AMOUNT = Counter(
+    "bcafe_payments_paid_amount", "Amount of the payments that became paid.", ["method"], registry=REGISTRY,
+)
+
+
+def count_cache(namespace, hit, stale=False):
+    CACHE_REQUESTS.labels(namespace, "stale" if stale else "hit" if hit else "miss").inc()
+
+##################################################################################
+#                                  Exposition                                    #
+##################################################################################
+
+class CeleryQueueCollector:
+    """Length of each Celery queue in the Redis broker, read at scrape time."""
+
+    def collect(self):
+        broker = getattr(settings, "CELERY_BROKER_URL", "")
+        if not broker.startswith(("redis://", "rediss://")):
+            return
+        depth = GaugeMetricFamily("bcafe_celery_queue_depth", "Messages waiting in a Celery queue.", labels=["queue"])
+        try:
+            client = redis.Redis.from_url(broker, socket_timeout=0.5, socket_connect_timeout=0.5)
+            for queue in getattr(settings, "METRICS_CELERY_QUEUES", ("celery",)):
+                depth.add_metric([queue], client.llen(queue))
+        except redis.RedisError:
+            return
+        yield depth
+
+
+REGISTRY.register(CeleryQueueCollector())
+
+
+def exposition():
+    """(body, content type) of the text exposition format."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        registry.register(CeleryQueueCollector())
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,72 @@
+# -------------------  Django imports   ------------------------
+from django.db import transaction
+from django.db.models.signals import post_init, post_save, pre_save
+from django.dispatch import receiver
+# -------------------   Apps imports ------------------------
+from orders.choices import PaymentStatusChoices
+from orders.models import Order, Payment
+from .registry import ORDERS, PAYMENTS, PAYMENTS_PAID, PAYMENTS_PAID_AMOUNT, TASK_QUEUE_SECONDS, TASK_RUN_SECONDS
+# -------------------  Other imports   ------------------------
+from celery.signals import before_task_publish, task_postrun, task_prerun
+import time
+
+# ----------------------- Order / Payment Signals -----------------
+
+@receiver(post_save, sender=Order)
+def count_order(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        transaction.on_commit(ORDERS.inc)
+
+
+@receiver(post_init, sender=Payment)
+def remember_loaded_status(sender, instance, **kwargs):
+    # Deferred (.only()) statuses are not loaded just for this.
+    instance._metrics_saved_status = instance.__dict__.get("status")
+
+
+@receiver(pre_save, sender=Payment)
+def flag_newly_paid(sender, instance, raw=False, **kwargs):
+    """Note whether this save is the one that makes the payment paid (no query: the status as loaded)."""
+    instance._metrics_newly_paid = not raw and instance.status == PaymentStatusChoices.PAID and (
+        instance._state.adding or getattr(instance, "_metrics_saved_status", None) != PaymentStatusChoices.PAID
+    )
+
+
+@receiver(post_save, sender=Payment)
+def count_payment(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    method, amount = instance.method, float(instance.amount)
+    if created:
+        transaction.on_commit(PAYMENTS.labels(method).inc)
+    if getattr(instance, "_metrics_newly_paid", False):
+        transaction.on_commit(lambda: count_paid(method, amount))
+    instance._metrics_saved_status = instance.status
+
+
+def count_paid(method, amount):
+    PAYMENTS_PAID.labels(method).inc()
+    PAYMENTS_PAID_AMOUNT.labels(method).inc(amount)
+
+# ----------------------- Celery Signals --------------------------
+
+@before_task_publish.connect
+def stamp_published_at(headers=None, **kwargs):
+    """Custom message headers show up as attributes of `task.request`."""
+    if headers is not None:
+        headers["published_at"] = time.time()
+
+
+@task_prerun.connect
+def observe_queue_time(task=None, **kwargs):
+    published_at = getattr(task.request, "published_at", None)
+    if published_at is not None:
+        TASK_QUEUE_SECONDS.labels(task.name).observe(max(0.0, time.time() - published_at))
+    task.request.metrics_started = time.perf_counter()
+
+
+@task_postrun.connect
+def observe_run_time(task=None, state=None, **kwargs):
+    started = getattr(task.request, "metrics_started", None)
+    if started is not None:
+        TASK_RUN_SECONDS.labels(task.name, state or "UNKNOWN").observe(time.perf_counter() - started)
@@ -0,0 +1,71 @@
+# -------------------  Django imports   ------------------------
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+# -------------------   Apps imports ------------------------
+from orders.models import Order, Payment
+from .permissions import HasMetricsToken
+from .registry import REGISTRY
+from .signals import flag_newly_paid
+
+##################################################################################
+#                               Metrics access                                   #
+##################################################################################
+
+class HasMetricsTokenTests(SimpleTestCase):
+    def allowed(self, **headers):
+        return HasMetricsToken().has_permission(RequestFactory().get("/metrics/", **headers), None)
+
+    @override_settings(METRICS_TOKEN="")
+    def test_closed_without_token(self):
+        self.assertFalse(self.allowed())
+        self.assertEqual(self.client.get("/metrics/").status_code, 403)
+
+    @override_settings(METRICS_TOKEN="", METRICS_PUBLIC=True)
+    def test_public_opens_it_without_token(self):
+        self.assertTrue(self.allowed())
+
+    @override_settings(METRICS_TOKEN="s3cret", METRICS_PUBLIC=True)
+    def test_token_is_required_once_set(self):
+        self.assertTrue(self.allowed(HTTP_AUTHORIZATION="Bearer s3cret"))
+        self.assertFalse(self.allowed(HTTP_AUTHORIZATION="Bearer other"))
+        self.assertFalse(self.allowed())
+
+##################################################################################
+#                               Payment counters                                 #
+##################################################################################
+
+class PaidPaymentCounterTests(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user("customer", password="secret-pass-1")
+        self.order = Order.objects.create(user=user)
+
+    def paid(self):
+        return REGISTRY.get_sample_value("bcafe_payments_paid_total", {"method": "cash"}) or 0
+
+    def test_counted_once_when_it_becomes_paid(self):
+        before = self.paid()
+        with self.captureOnCommitCallbacks(execute=True):
+            payment = Payment.objects.create(order=self.order, amount="12.50")
+        with self.captureOnCommitCallbacks(execute=True):
+            payment.mark_as_paid()
+        with self.captureOnCommitCallbacks(execute=True):
+            payment.mark_as_paid()
+            Payment.objects.get(pk=payment.pk).save()
+
+        self.assertEqual(self.paid() - before, 1)
+
+    def test_created_paid_is_counted(self):
+        before = self.paid()
+        with self.captureOnCommitCallbacks(execute=True):
+            Payment.objects.create(order=self.order, amount="3", status="paid")
+
+        self.assertEqual(self.paid() - before, 1)
+
+    def test_flagging_reads_nothing(self):
+        payment = Payment.objects.create(order=self.order, amount="12.50")
+        payment = Payment.objects.get(pk=payment.pk)
+        payment.status = "paid"
+
+        with self.assertNumQueries(0):
+            flag_newly_paid(Payment, payment)
+        self.assertTrue(payment._metrics_newly_paid)
@@ -0,0 +1,8 @@
+# -------------------  Django imports   ------------------------
+from django.urls import path
+# -------------------   Apps imports ------------------------
+from .views import MetricsView
+
+urlpatterns = [
+    path('', MetricsView.as_view(), name='metrics'),
+]
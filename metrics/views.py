@@ -0,0 +1,21 @@
+# -------------------  Django imports   ------------------------
+from django.http import HttpResponse
+# -------------------  DRF imports   ------------------------
+from rest_framework.views import APIView
+# -------------------   Apps imports ------------------------
+from .permissions import HasMetricsToken
+from .registry import exposition
+
+##################################################################################
+#                                 Metrics Views                                  #
+##################################################################################
+
+class MetricsView(APIView):
+    """Prometheus text exposition. No JWT authentication and no throttling."""
+    authentication_classes = []
+    throttle_classes = []
+    permission_classes = [HasMetricsToken]
+
+    def get(self, request):
+        body, content_type = exposition()
+        return HttpResponse(body, content_type=content_type)
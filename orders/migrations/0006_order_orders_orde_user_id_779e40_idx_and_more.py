@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0005_invoice_orders_invo_is_paid_816fea_idx_and_more'),
+        ('reservation', '0006_reservation_reservation_date_69bfbb_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='orders_orde_user_id_779e40_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['created_at', 'id'], name='orders_paym_created_f514e4_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0007_historicalinvoice'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderSales',
+            fields=[
+                ('order', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='sales_record', serialize=False, to='orders.order')),
+                ('recorded_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
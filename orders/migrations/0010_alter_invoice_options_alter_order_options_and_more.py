@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:49
+
+import django.db.models.manager
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0009_alter_invoice_managers_alter_order_managers_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='invoice',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='order',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='orderitem',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects'},
+        ),
+        migrations.AlterModelOptions(
+            name='payment',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects'},
+        ),
+        migrations.AlterModelManagers(
+            name='invoice',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='order',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='orderitem',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='payment',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
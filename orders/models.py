@@ -2,11 +2,13 @@
 from django.db import models
 from django.conf import settings
 from django.db.models import Q, CheckConstraint, Index
+from django.utils import timezone
 # ------------------- Apps imports ------------------------
 from menu.models import MenuItem
 from reservation.models import Table
 from .choices import OrderStatusChoices, PaymentMethodChoices, PaymentStatusChoices
 from utility.models import BaseModel
+from simple_history.models import HistoricalRecords
 
 ##################################################################################
 #                             Order Model                                        #
@@ -36,7 +38,7 @@ class Order(BaseModel):
     def __str__(self):
         return f"Order #{self.id} - {self.status.title()} by {self.user.username}"
     
-    class Meta:
+    class Meta(BaseModel.Meta):
         constraints = [
             CheckConstraint(
                 check=Q(status__in=[choice.value for choice in OrderStatusChoices]),
@@ -44,7 +46,10 @@ class Order(BaseModel):
             )
         ]
         indexes = [
-            models.Index(fields=['status']), 
+            # Live orders by status; tombstones stay out of the index.
+            models.Index(fields=['status'], condition=Q(is_deleted=False), name='order_live_status'),
+            # Keyset pagination of a user's order history (created_at, id)
+            models.Index(fields=['user', 'created_at', 'id']),
         ]
 
     def total_price(self):
@@ -68,7 +73,7 @@ class OrderItem(BaseModel):
     def __str__(self):
         return f"{self.menu_item.name} x {self.quantity}"
     
-    class Meta:
+    class Meta(BaseModel.Meta):
         indexes = [
             Index(fields=['order', 'menu_item']),
         ]
@@ -81,6 +86,21 @@ class OrderItem(BaseModel):
     def total_item_price(self):
         return self.final_price * self.quantity
 
+##################################################################################
+#                           OrderSales Model                                     #
+##################################################################################
+
+class OrderSales(models.Model):
+    """
+    Marks an order whose lines were added to the sales counters.
+    One row per order: creating it is the claim that stops double counting.
+    """
+    order = models.OneToOneField(Order, on_delete=models.CASCADE, primary_key=True, related_name="sales_record")
+    recorded_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Sales of Order #{self.order_id}"
+
 ##################################################################################
 #                           Payment Model                                        #
 ##################################################################################
@@ -103,11 +123,20 @@ class Payment(BaseModel):
 
     def __str__(self):
         return f"Payment #{self.id} - {self.amount} ({self.status}) for Order #{self.order.id}"
-    
-    class Meta:
+
+    def mark_as_paid(self):
+        """Set the status to paid and stamp paid_at (kept if already set)."""
+        self.status = PaymentStatusChoices.PAID
+        if self.paid_at is None:
+            self.paid_at = timezone.now()
+        self.save(update_fields=['status', 'paid_at', 'updated_at'])
+
+    class Meta(BaseModel.Meta):
         indexes = [
             Index(fields=['status']), 
             Index(fields=['order', 'status']), 
+            # Keyset pagination of the payment list (created_at, id)
+            Index(fields=['created_at', 'id']),
         ]
 
 ##################################################################################
@@ -121,11 +150,12 @@ class Invoice(BaseModel):
     created_at = models.DateTimeField(auto_now_add=True)
     due_date = models.DateTimeField(null=True, blank=True)
     is_paid = models.BooleanField(default=False)
+    history = HistoricalRecords()
 
     def __str__(self):
         return f"Invoice #{self.invoice_number} for Order #{self.order.id}"
     
-    class Meta:
+    class Meta(BaseModel.Meta):
         indexes = [
             Index(fields=['is_paid']), 
         ]
@@ -4,6 +4,7 @@ from rest_framework import serializers
 from .models import Order, OrderItem, Payment, Invoice
 from menu.serializers import MenuItemSerializer
 from menu.models import MenuItem
+from info.schedule import get_schedule
 from utility.serializers import BaseSerializer
 ##################################################################################
 #                          OrderItem serializers                                 #
@@ -53,6 +54,17 @@ class OrderSerializer(BaseSerializer):
         return None
 
     def validate(self, data):
+        # New orders are only accepted during the configured opening hours;
+        # without WorkingHours rows the cafe takes orders at any time.
+        if self.instance is None:
+            schedule = get_schedule()
+            if schedule.has_hours and not schedule.is_open():
+                next_open = schedule.next_open()
+                message = "The cafe is closed and is not accepting orders."
+                if next_open:
+                    message += f" It opens next on {next_open:%Y-%m-%d at %H:%M}."
+                raise serializers.ValidationError(message)
+
         items_data = data.get('items', [])
         for item_data in items_data:
             menu_item = item_data['menu_item']
@@ -67,9 +79,7 @@ class OrderSerializer(BaseSerializer):
         for item_data in items_data:
             OrderItem.objects.create(order=order, **item_data)
             # Decrease menu item stock
-            menu_item = item_data['menu_item']
-            menu_item.stock -= item_data['quantity']
-            menu_item.save()
+            item_data['menu_item'].adjust_stock(-item_data['quantity'])
         return order
 
     def update(self, instance, validated_data):
@@ -82,9 +92,7 @@ class OrderSerializer(BaseSerializer):
         if items_data:
             # Restore stock for previous items
             for old_item in instance.items.all():
-                menu_item = old_item.menu_item
-                menu_item.stock += old_item.quantity
-                menu_item.save()
+                old_item.menu_item.adjust_stock(old_item.quantity)
             # Delete old items
             instance.items.all().delete()
             # Add new items
@@ -92,9 +100,7 @@ class OrderSerializer(BaseSerializer):
                 if item_data['menu_item'].stock < item_data['quantity']:
                     raise serializers.ValidationError(f"Not enough stock for {item_data['menu_item'].name}.")
                 OrderItem.objects.create(order=instance, **item_data)
-                menu_item = item_data['menu_item']
-                menu_item.stock -= item_data['quantity']
-                menu_item.save()
+                item_data['menu_item'].adjust_stock(-item_data['quantity'])
         return instance
 
 ##################################################################################
@@ -3,10 +3,32 @@ from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.core.mail import send_mail
 from django.utils import timezone
+from django.db import transaction
+from django.conf import settings
 
 # -------------------   Apps imports ------------------------
-from .models import Order, OrderItem, Payment
+from .models import Invoice, Order, OrderItem, OrderSales, Payment
 from .choices import OrderStatusChoices
+from menu.sales import record_sales
+from reservation.models import Table
+from utility.httpcache import bump_data_version, bump_user_version
+# -------------------  Other imports   ------------------------
+from functools import partial
+
+# ----------------------- Sales facts -----------------------------
+
+def record_order_sales(order):
+    """
+    Feed the order's lines into sold_count and the sales buckets, once.
+    The OrderSales row is the claim, so a payment and a status change on
+    the same order (or two racing workers) count it only one time.
+    """
+    if not order.items.exists():
+        return
+    with transaction.atomic():
+        _, claimed = OrderSales.objects.get_or_create(order_id=order.pk)
+        if claimed:
+            record_sales(order.items.values_list('menu_item_id', 'quantity'))
 
 # ----------------------- OrderItem Signals -----------------------
 
@@ -17,11 +39,7 @@ def decrease_stock_on_orderitem_save(sender, instance, created, **kwargs):
     Prevent stock from going below zero.
     """
     if created:
-        menu_item = instance.menu_item
-        menu_item.stock -= instance.quantity
-        if menu_item.stock < 0:
-            menu_item.stock = 0
-        menu_item.save()
+        instance.menu_item.adjust_stock(-instance.quantity)
 
 
 @receiver(post_delete, sender=OrderItem)
@@ -29,9 +47,7 @@ def increase_stock_on_orderitem_delete(sender, instance, **kwargs):
     """
     Increase the stock of a menu item when an OrderItem is deleted.
     """
-    menu_item = instance.menu_item
-    menu_item.stock += instance.quantity
-    menu_item.save()
+    instance.menu_item.adjust_stock(instance.quantity)
 
 
 # ----------------------- Order Signals ---------------------------
@@ -42,6 +58,7 @@ def notify_when_order_paid(sender, instance, **kwargs):
     Send an email notification to the user when the order is marked as paid.
     """
     if instance.status == OrderStatusChoices.PAID:
+        record_order_sales(instance)
         send_mail(
             subject="Your order has been paid for.",
             message=f"Your order number {instance.id} has been successfully paid. Thank you for your purchase!",
@@ -58,9 +75,68 @@ def update_invoice_on_payment(sender, instance, created, **kwargs):
     """
     Automatically mark the related invoice as paid when the payment status is 'paid'.
     """
+    if instance.status == 'paid':
+        record_order_sales(instance.order)
     if instance.status == 'paid' and hasattr(instance.order, 'invoice'):
         invoice = instance.order.invoice
         if not invoice.is_paid:
             invoice.is_paid = True
             invoice.paid_at = timezone.now()
             invoice.save(update_fields=['is_paid', 'paid_at'])
+
+
+# ----------------------- Per-user caches -------------------------
+# OrderByUserView, OrderHistoryView and InvoicesByUserView (see views.USER_ORDERS).
+
+def bump_order_caches(user_id):
+    bump_user_version("orders", user_id)
+    # Invoices show their order as "Order #id - Status by username".
+    bump_user_version("invoices", user_id)
+
+
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+def invalidate_user_orders(sender, instance, **kwargs):
+    transaction.on_commit(partial(bump_order_caches, instance.user_id))
+
+
+@receiver(post_save, sender=OrderItem)
+@receiver(post_delete, sender=OrderItem)
+def invalidate_user_order_items(sender, instance, **kwargs):
+    transaction.on_commit(partial(bump_user_version, "orders", instance.order.user_id))
+
+
+@receiver(post_save, sender=Invoice)
+@receiver(post_delete, sender=Invoice)
+def invalidate_user_invoices(sender, instance, **kwargs):
+    transaction.on_commit(partial(bump_user_version, "invoices", instance.order.user_id))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_renamed_user(sender, instance, created, update_fields=None, **kwargs):
+    if not created:
+        transaction.on_commit(partial(bump_order_caches, instance.pk))
+    # Orders, payments and invoices all show "... by username".
+    if not created and (update_fields is None or "username" in update_fields):
+        transaction.on_commit(partial(bump_data_version, Order))
+
+
+@receiver(post_save, sender=Table)
+@receiver(post_delete, sender=Table)
+def invalidate_table_numbers(sender, **kwargs):
+    transaction.on_commit(partial(bump_data_version, Table))
+
+
+# ----------------------- Shared caches ---------------------------
+# Data versions of the order, payment and invoice lists (views.cache_per_user).
+
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+@receiver(post_save, sender=OrderItem)
+@receiver(post_delete, sender=OrderItem)
+@receiver(post_save, sender=Payment)
+@receiver(post_delete, sender=Payment)
+@receiver(post_save, sender=Invoice)
+@receiver(post_delete, sender=Invoice)
+def bump_order_data(sender, **kwargs):
+    transaction.on_commit(partial(bump_data_version, sender))
@@ -0,0 +1,106 @@
+# -------------------  Django imports   ------------------------
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+# -------------------  DRF imports   ------------------------
+from rest_framework.test import APITestCase
+# -------------------   Apps imports ------------------------
+from info.models import HolidayOverride, WorkingHours
+from menu.models import Category, MenuItem
+from .models import Order, OrderItem
+# -------------------  Other imports   ------------------------
+from datetime import time, timedelta
+
+##################################################################################
+#                          Order lists cached per user                           #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None)
+class PerUserCacheTests(APITestCase):
+    """
+    Cached order lists are never served to another user, and a user's write
+    shows in their next request: /orders/orders/user/ (UserCachedListMixin)
+    and /orders/orders/ (cache_per_user).
+    """
+    PATHS = ("/orders/orders/user/", "/orders/orders/")
+
+    def setUp(self):
+        cache.clear()
+        users = get_user_model().objects
+        self.alice = users.create_user("alice", password="secret-pass-1", role="customer")
+        self.bob = users.create_user("bob", password="secret-pass-1", role="customer")
+        category = Category.objects.create(name="Coffee")
+        self.espresso = MenuItem.objects.create(category=category, name="Espresso", price="3.00", stock=100)
+
+    def order(self, user):
+        with self.captureOnCommitCallbacks(execute=True):
+            order = Order.objects.create(user=user)
+            OrderItem.objects.create(order=order, menu_item=self.espresso, quantity=1)
+        return order.pk
+
+    def get(self, user, path, **headers):
+        self.client.force_authenticate(user)
+        return self.client.get(path, headers=headers)
+
+    def ids(self, user, path):
+        response = self.get(user, path)
+        self.assertEqual(response.status_code, 200)
+        return sorted(row["id"] for row in response.json()["results"])
+
+    def test_users_never_get_each_others_list(self):
+        alice_order, bob_order = self.order(self.alice), self.order(self.bob)
+        for path in self.PATHS:
+            for _ in range(2):  # the second round is served from the cache
+                self.assertEqual(self.ids(self.alice, path), [alice_order], path)
+                self.assertEqual(self.ids(self.bob, path), [bob_order], path)
+
+    def test_etag_of_one_user_is_not_valid_for_another(self):
+        self.order(self.alice)
+        etag = self.get(self.alice, self.PATHS[0])["ETag"]
+
+        self.assertEqual(self.get(self.alice, self.PATHS[0], if_none_match=etag).status_code, 304)
+        self.assertEqual(self.get(self.bob, self.PATHS[0], if_none_match=etag).status_code, 200)
+
+    def test_own_write_is_seen_at_once(self):
+        first = self.order(self.alice)
+        for path in self.PATHS:
+            self.ids(self.alice, path)
+        second = self.order(self.alice)
+        for path in self.PATHS:
+            self.assertEqual(self.ids(self.alice, path), [first, second], path)
+
+##################################################################################
+#                          Orders and opening hours                              #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None, DEFAULT_OPENING_HOURS=("00:00", "00:00"))
+class OrderOpeningHoursTests(APITestCase):
+    """New orders respect the configured WorkingHours, and only those."""
+
+    def setUp(self):
+        cache.clear()
+        customer = get_user_model().objects.create_user("alice", password="secret-pass-1", role="customer")
+        self.client.force_authenticate(customer)
+        category = Category.objects.create(name="Coffee")
+        self.espresso = MenuItem.objects.create(category=category, name="Espresso", price="3.00", stock=100)
+
+    def post_order(self):
+        return self.client.post(
+            "/orders/orders/", {"items": [{"menu_item_id": self.espresso.pk, "quantity": 1}]}, format="json"
+        )
+
+    def test_orders_are_taken_at_any_time_without_working_hours(self):
+        # The fallback hours (never open here) only apply to reservations.
+        self.assertEqual(self.post_order().status_code, 201)
+
+    def test_orders_are_refused_outside_the_working_hours(self):
+        today = timezone.localdate()
+        with self.captureOnCommitCallbacks(execute=True):
+            WorkingHours.objects.create(day="mon", open_time=time(10), close_time=time(22))
+            for offset in (-1, 0, 1):
+                HolidayOverride.objects.create(date=today + timedelta(days=offset), is_closed=True)
+
+        response = self.post_order()
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("closed", str(response.json()))
@@ -6,7 +6,6 @@ from django.core.mail import send_mail
 from django.utils.decorators import method_decorator
 from django.conf import settings
 from django.core.cache import cache
-from django.views.decorators.cache import cache_page
 
 # -------------------  DRF imports   ------------------------
 from rest_framework import generics
@@ -16,22 +15,34 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 # -------------------   Apps imports ------------------------
-from .models import Order, Payment, Invoice
+from .models import Order, OrderItem, Payment, Invoice
 from .serializers import OrderSerializer, PaymentSerializer, InvoiceSerializer
 from .permissions import IsAdminUser, IsCashierUser, IsWaiterUser, IsCustomerUser
-from utility.views import BaseAPIView
+from utility.views import BaseAPIView, HistoryListView
 from .choices import OrderStatusChoices
-from utility.mixins import RestoreMixin
+from utility.mixins import RestoreMixin, AtomicWriteMixin, UserCachedListMixin
+from utility.httpcache import UserScope, cache_per_user
+from utility.routers import read_database
+from utility.pagination import KeysetPagination
+from menu.models import Category, MenuItem
+from reservation.models import Table
 
 # ------------------- Constants ------------------------
 CACHE_TTL = getattr(settings, 'CACHE_TTL', 60 * 5)
 
+# Per-user caches, bumped in orders.signals. Orders embed menu items (with
+# discounted prices) and table numbers.
+USER_ORDERS = UserScope("orders", MenuItem, Category, Table, changes_at=MenuItem.discount_changes)
+USER_INVOICES = UserScope("invoices")
+# What the shared order lists (cache_per_user) are built from.
+ORDER_DATA = (Order, OrderItem, MenuItem, Category, Table)
+
 ##################################################################################
 #                             Order Views                                        #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
-class OrderListCreateView(BaseAPIView, generics.ListCreateAPIView):
+@method_decorator(cache_per_user(*ORDER_DATA, ttl=CACHE_TTL, changes_at=MenuItem.discount_changes), name='get')
+class OrderListCreateView(AtomicWriteMixin, BaseAPIView, generics.ListCreateAPIView):
     serializer_class = OrderSerializer
 
     def get_queryset(self):
@@ -76,7 +87,7 @@ class OrderListCreateView(BaseAPIView, generics.ListCreateAPIView):
         return [permission() for permission in permission_classes]
 
 
-class OrderRetrieveUpdateDestroyView(BaseAPIView, generics.RetrieveUpdateDestroyAPIView):
+class OrderRetrieveUpdateDestroyView(AtomicWriteMixin, BaseAPIView, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = OrderSerializer
     queryset = Order.objects.all()
 
@@ -115,13 +126,13 @@ class OrderRetrieveUpdateDestroyView(BaseAPIView, generics.RetrieveUpdateDestroy
 #                             OrderByUser Views                                  #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
-class OrderByUserView(BaseAPIView, generics.ListAPIView):
+class OrderByUserView(UserCachedListMixin, BaseAPIView, generics.ListAPIView):
     """
     Returns orders for the current authenticated user.
     """
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated]
+    user_cache = USER_ORDERS
 
     def get_queryset(self):
         return Order.objects.filter(user=self.request.user)
@@ -130,7 +141,7 @@ class OrderByUserView(BaseAPIView, generics.ListAPIView):
 #                           OrdersByStatus Views                                 #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_per_user(*ORDER_DATA, ttl=CACHE_TTL, changes_at=MenuItem.discount_changes), name='get')
 class OrdersByStatusView(BaseAPIView, generics.ListAPIView):
     """
     Returns orders filtered by a given status query parameter.
@@ -148,7 +159,7 @@ class OrdersByStatusView(BaseAPIView, generics.ListAPIView):
 #                             TopOrders Views                                    #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_per_user(*ORDER_DATA, ttl=CACHE_TTL, changes_at=MenuItem.discount_changes), name='get')
 class TopOrdersView(BaseAPIView, generics.ListAPIView):
     """
     Returns top 10 orders by total price.
@@ -163,13 +174,14 @@ class TopOrdersView(BaseAPIView, generics.ListAPIView):
 #                           OrderHistory Views                                   #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
-class OrderHistoryView(BaseAPIView, generics.ListAPIView):
+class OrderHistoryView(UserCachedListMixin, BaseAPIView, generics.ListAPIView):
     """
     Returns all orders of the current user sorted by creation time.
     """
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    user_cache = USER_ORDERS
 
     def get_queryset(self):
         return Order.objects.filter(user=self.request.user).order_by('-created_at')
@@ -178,7 +190,7 @@ class OrderHistoryView(BaseAPIView, generics.ListAPIView):
 #                       ChangeOrderStatus Views                                  #
 ##################################################################################
 
-class ChangeOrderStatusView(BaseAPIView, generics.UpdateAPIView):
+class ChangeOrderStatusView(AtomicWriteMixin, BaseAPIView, generics.UpdateAPIView):
     """
     Allows Admin or Cashier to change the status of an order.
     """
@@ -198,9 +210,10 @@ class ChangeOrderStatusView(BaseAPIView, generics.UpdateAPIView):
 #                             Payment Views                                        #
 ##################################################################################
 
-class PaymentListCreateView(generics.ListCreateAPIView):
+class PaymentListCreateView(AtomicWriteMixin, generics.ListCreateAPIView):
     serializer_class = PaymentSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         user = self.request.user
@@ -218,7 +231,7 @@ class PaymentListCreateView(generics.ListCreateAPIView):
                 invoice.save(update_fields=['is_paid'])
 
 
-class PaymentRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class PaymentRetrieveUpdateDestroyView(AtomicWriteMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = PaymentSerializer
     queryset = Payment.objects.all()
     permission_classes = [IsAuthenticated]
@@ -236,7 +249,7 @@ class PaymentRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
 #                         PaymentsByOrder Views                                  #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_per_user(Payment, Order, ttl=CACHE_TTL), name='get')
 class PaymentsByOrderView(BaseAPIView, generics.ListAPIView):
     """
     Returns all payments associated with a specific order.
@@ -252,7 +265,7 @@ class PaymentsByOrderView(BaseAPIView, generics.ListAPIView):
 #                         PaymentsByStatus Views                                 #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_per_user(Payment, Order, ttl=CACHE_TTL), name='get')
 class PaymentsByStatusView(BaseAPIView, generics.ListAPIView):
     """
     Returns payments filtered by their status (Paid/Pending).
@@ -270,7 +283,7 @@ class PaymentsByStatusView(BaseAPIView, generics.ListAPIView):
 #                           RecentPayments Views                                 #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_per_user(Payment, Order, ttl=CACHE_TTL), name='get')
 class RecentPaymentsView(BaseAPIView, generics.ListAPIView):
     """
     Returns the last 10 payments by creation date.
@@ -279,13 +292,13 @@ class RecentPaymentsView(BaseAPIView, generics.ListAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Payment.objects.all().order_by('-created_at')[:10]
+        return Payment.objects.using(read_database()).order_by('-created_at')[:10]
 
 ##################################################################################
 #                           TotalCollected Views                                 #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_per_user(Payment, ttl=CACHE_TTL), name='get')
 class TotalCollectedView(BaseAPIView, generics.GenericAPIView):
     """
     Returns the total amount of all successful payments.
@@ -294,14 +307,15 @@ class TotalCollectedView(BaseAPIView, generics.GenericAPIView):
     permission_classes = [IsAdminUser]
 
     def get(self, request):
-        total = Payment.objects.filter(status='paid').aggregate(total=models.Sum('amount'))['total'] or 0
+        payments = Payment.objects.using(read_database()).filter(status='paid')
+        total = payments.aggregate(total=models.Sum('amount'))['total'] or 0
         return Response({'total_collected': total})
 
 ##################################################################################
 #                           MarkPaymentAsPaid Views                              #
 ##################################################################################
 
-class MarkPaymentAsPaidView(BaseAPIView, generics.UpdateAPIView):
+class MarkPaymentAsPaidView(AtomicWriteMixin, BaseAPIView, generics.UpdateAPIView):
     """
     Allows Admin or Cashier to mark a payment as 'Paid'.
     """
@@ -322,7 +336,7 @@ class MarkPaymentAsPaidView(BaseAPIView, generics.UpdateAPIView):
 #                             Invoice Views                                        #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_per_user(Invoice, Order, ttl=CACHE_TTL), name='get')
 class InvoiceListCreateView(generics.ListCreateAPIView):
     serializer_class = InvoiceSerializer
     permission_classes = [IsAuthenticated]
@@ -347,13 +361,13 @@ class InvoiceRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
 #                           InvoicesByUser Views                                 #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
-class InvoicesByUserView(BaseAPIView, generics.ListAPIView):
+class InvoicesByUserView(UserCachedListMixin, BaseAPIView, generics.ListAPIView):
     """
     Returns all invoices for the current user.
     """
     serializer_class = InvoiceSerializer
     permission_classes = [IsAuthenticated]
+    user_cache = USER_INVOICES
 
     def get_queryset(self):
         return Invoice.objects.filter(order__user=self.request.user)
@@ -362,7 +376,7 @@ class InvoicesByUserView(BaseAPIView, generics.ListAPIView):
 #                           UnpaidInvoices Views                                 #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_per_user(Invoice, Order, ttl=CACHE_TTL), name='get')
 class UnpaidInvoicesView(BaseAPIView, generics.ListAPIView):
     """
     Returns all unpaid invoices.
@@ -377,7 +391,7 @@ class UnpaidInvoicesView(BaseAPIView, generics.ListAPIView):
 #                            InvoiceDetail Views                                 #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
+@method_decorator(cache_per_user(Invoice, Order, ttl=CACHE_TTL), name='get')
 class InvoiceDetailView(BaseAPIView, generics.RetrieveAPIView):
     """
     Returns detailed information of a specific invoice.
@@ -431,13 +445,10 @@ class InvoiceRestoreView(RestoreMixin, APIView):
     permission_classes = [IsAdminUser]
 
     def post(self, request, pk):
-        instance = Invoice.objects.get(pk=pk)
+        instance = self.get_restore_object(Invoice, pk)
         self.perform_restore(instance)
         return Response({"success": f"Invoice '{instance.id}' restored"}, status=200)
 
-class InvoiceHistoryView(generics.ListAPIView):
-    serializer_class = InvoiceSerializer
-    permission_classes = [IsAdminUser]
-
-    def get_queryset(self):
-        return Invoice.history.all()
\ No newline at end of file
+class InvoiceHistoryView(HistoryListView):
+    model = Invoice
+    permission_classes = [IsAdminUser]
\ No newline at end of file
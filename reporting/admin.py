@@ -0,0 +1,18 @@
+# -------------------   Django imports ------------------------
+from django.contrib import admin
+# -------------------   Apps imports ------------------------
+from .models import RevenueRollup
+
+#############################################
+#            RevenueRollup Admin            #
+#############################################
+
+class RevenueRollupAdmin(admin.ModelAdmin):
+    list_display = ["day", "dimension", "key", "amount", "count"]
+    list_filter = ["dimension"]
+    date_hierarchy = "day"
+    list_per_page = 50
+    readonly_fields = ["day", "dimension", "key", "amount", "count"]
+
+
+admin.site.register(RevenueRollup, RevenueRollupAdmin)
@@ -0,0 +1,8 @@
+from django.db.models import TextChoices
+
+class ReportDimension(TextChoices):
+    TOTAL = 'total', 'Total'
+    HOUR = 'hour', 'Hour of day'
+    METHOD = 'method', 'Payment method'
+    CATEGORY = 'category', 'Menu category'
+    TABLE = 'table', 'Table'
@@ -0,0 +1,28 @@
+# -------------------  Django imports   ------------------------
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+# -------------------   Apps imports ------------------------
+from reporting.rollups import rebuild
+
+##################################################################################
+#                           backfill_reports command                             #
+##################################################################################
+
+def date_argument(value):
+    day = parse_date(value)
+    if day is None:
+        raise CommandError(f"Invalid date '{value}', expected YYYY-MM-DD.")
+    return day
+
+
+class Command(BaseCommand):
+    help = "Rebuild the revenue rollups from the payments table (all days, or --start/--end)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", type=date_argument, help="First day to rebuild (YYYY-MM-DD).")
+        parser.add_argument("--end", type=date_argument, help="Last day to rebuild (YYYY-MM-DD).")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild(options["start"], options["end"], batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt revenue rollups from {rebuilt} payments."))
@@ -0,0 +1,34 @@
+# -------------------  Django imports   ------------------------
+from django.core.management.base import BaseCommand
+# -------------------   Apps imports ------------------------
+from reporting.rollups import inconsistent_days, rebuild
+from .backfill_reports import date_argument
+
+##################################################################################
+#                            check_reports command                               #
+##################################################################################
+
+class Command(BaseCommand):
+    help = (
+        "Compare the revenue rollups with the payments table day by day; "
+        "with --fix, rebuild the days that disagree."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", type=date_argument)
+        parser.add_argument("--end", type=date_argument)
+        parser.add_argument("--fix", action="store_true", help="Rebuild inconsistent days.")
+
+    def handle(self, *args, **options):
+        problems = inconsistent_days(options["start"], options["end"])
+        if not problems:
+            self.stdout.write(self.style.SUCCESS("Revenue rollups are consistent."))
+            return
+        for day, reasons in problems.items():
+            for reason in reasons:
+                self.stdout.write(self.style.WARNING(f"{day}: {reason}"))
+            if options["fix"]:
+                rebuild(day, day)
+                self.stdout.write(f"{day}: rebuilt")
+        if not options["fix"]:
+            self.stderr.write(f"{len(problems)} inconsistent day(s); run with --fix to rebuild them.")
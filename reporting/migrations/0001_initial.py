@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('orders', '0008_ordersales'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaymentFact',
+            fields=[
+                ('payment', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='report_fact', serialize=False, to='orders.payment')),
+                ('day', models.DateField()),
+                ('contributions', models.JSONField(default=list)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['day'], name='reporting_p_day_2c386b_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='RevenueRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('dimension', models.CharField(choices=[('total', 'Total'), ('hour', 'Hour of day'), ('method', 'Payment method'), ('category', 'Menu category'), ('table', 'Table')], max_length=10)),
+                ('key', models.CharField(blank=True, max_length=50)),
+                ('amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['day', 'dimension', 'key'],
+                'indexes': [models.Index(fields=['dimension', 'day'], name='reporting_r_dimensi_faae5f_idx')],
+                'constraints': [models.UniqueConstraint(fields=('day', 'dimension', 'key'), name='unique_revenue_rollup')],
+            },
+        ),
+    ]
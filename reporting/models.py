@@ -0,0 +1,54 @@
+# -------------------   Django imports ------------------------
+from django.db import models
+# -------------------   Apps imports ------------------------
+from orders.models import Payment
+from .choices import ReportDimension
+
+##################################################################################
+#                           RevenueRollup Model                                  #
+##################################################################################
+
+class RevenueRollup(models.Model):
+    """
+    Paid revenue of one day, split along one dimension.
+    `key` is "" for the total, "00".."23" for hours, the payment method,
+    or the category / table id.
+    """
+    day = models.DateField()
+    dimension = models.CharField(max_length=10, choices=ReportDimension.choices)
+    key = models.CharField(max_length=50, blank=True)
+    amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.day} {self.dimension}:{self.key} = {self.amount} ({self.count})"
+
+    class Meta:
+        ordering = ['day', 'dimension', 'key']
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'dimension', 'key'], name='unique_revenue_rollup')
+        ]
+        indexes = [
+            models.Index(fields=['dimension', 'day']),
+        ]
+
+##################################################################################
+#                           PaymentFact Model                                    #
+##################################################################################
+
+class PaymentFact(models.Model):
+    """
+    What one paid payment currently contributes to the rollups.
+    Kept so a later change (or deletion) can be applied as an exact delta.
+    """
+    payment = models.OneToOneField(Payment, on_delete=models.CASCADE, primary_key=True, related_name="report_fact")
+    day = models.DateField()
+    contributions = models.JSONField(default=list)  # [[dimension, key, "amount", count], ...]
+
+    def __str__(self):
+        return f"Fact of Payment #{self.payment_id} on {self.day}"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['day']),
+        ]
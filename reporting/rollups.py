@@ -0,0 +1,232 @@
+# -------------------  Django imports   ------------------------
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+# -------------------   Apps imports ------------------------
+from orders.choices import PaymentStatusChoices
+from orders.models import Payment
+from .choices import ReportDimension
+from .models import RevenueRollup, PaymentFact
+# -------------------  Other imports   ------------------------
+from collections import defaultdict
+from decimal import Decimal
+
+CENT = Decimal("0.01")
+
+##################################################################################
+#                          Contribution of a payment                             #
+##################################################################################
+
+def _money(value):
+    return Decimal(value).quantize(CENT)
+
+
+def _category_split(amount, lines):
+    """
+    Split a payment across menu categories in proportion to the value of
+    the order lines; the last category takes the rounding remainder.
+    `lines` is an iterable of (category_id, line_value, quantity).
+    """
+    values, units = defaultdict(Decimal), defaultdict(int)
+    for category_id, value, quantity in lines:
+        values[category_id] += value
+        units[category_id] += quantity
+    order_value = sum(values.values())
+    if not order_value:
+        return []
+
+    rows, allocated = [], Decimal(0)
+    categories = sorted(values)
+    for category_id in categories:
+        if category_id == categories[-1]:
+            share = amount - allocated
+        else:
+            share = _money(amount * values[category_id] / order_value)
+        allocated += share
+        rows.append([ReportDimension.CATEGORY, str(category_id), str(share), units[category_id]])
+    return rows
+
+
+def order_lines(order):
+    return [
+        (item.menu_item.category_id, item.total_item_price, item.quantity)
+        for item in order.items.all()
+    ]
+
+
+def payment_contributions(payment):
+    """
+    (day, contributions) of a payment, or (None, []) if it is not paid.
+    A soft-deleted payment counts as unpaid, as in _paid_payments().
+    Each contribution is [dimension, key, amount as str, count].
+    """
+    if payment.status != PaymentStatusChoices.PAID or payment.is_deleted:
+        return None, []
+    paid_at = timezone.localtime(payment.paid_at or payment.created_at)
+    amount = _money(payment.amount)
+    order = payment.order
+    rows = [
+        [ReportDimension.TOTAL, "", str(amount), 1],
+        [ReportDimension.HOUR, f"{paid_at.hour:02d}", str(amount), 1],
+        [ReportDimension.METHOD, payment.method, str(amount), 1],
+    ]
+    if order.table_id:
+        rows.append([ReportDimension.TABLE, str(order.table_id), str(amount), 1])
+    rows += _category_split(amount, order_lines(order))
+    return paid_at.date(), rows
+
+##################################################################################
+#                          Incremental maintenance                               #
+##################################################################################
+
+def _add(day, dimension, key, amount, count):
+    rollup = RevenueRollup.objects.filter(day=day, dimension=dimension, key=key)
+    if rollup.update(amount=F("amount") + amount, count=F("count") + count):
+        return
+    try:
+        with transaction.atomic():
+            RevenueRollup.objects.create(day=day, dimension=dimension, key=key, amount=amount, count=count)
+    except IntegrityError:
+        rollup.update(amount=F("amount") + amount, count=F("count") + count)
+
+
+def _apply(day, contributions, sign):
+    for dimension, key, amount, count in contributions:
+        _add(day, dimension, key, sign * Decimal(amount), sign * count)
+
+
+def refresh_payment(payment):
+    """
+    Bring the rollups in line with the payment's current state by removing
+    its previous contribution (if any) and adding the new one.
+    """
+    with transaction.atomic():
+        fact = PaymentFact.objects.select_for_update().filter(payment_id=payment.pk).first()
+        day, contributions = payment_contributions(payment)
+        if fact and fact.day == day and fact.contributions == contributions:
+            return
+        if fact:
+            _apply(fact.day, fact.contributions, -1)
+        if contributions:
+            _apply(day, contributions, 1)
+            PaymentFact.objects.update_or_create(
+                payment_id=payment.pk, defaults={"day": day, "contributions": contributions}
+            )
+        elif fact:
+            fact.delete()
+
+
+def retract_payment(payment_id):
+    """Remove a payment's contribution (used right before it is deleted)."""
+    with transaction.atomic():
+        fact = PaymentFact.objects.select_for_update().filter(payment_id=payment_id).first()
+        if fact:
+            _apply(fact.day, fact.contributions, -1)
+            fact.delete()
+
+
+def refresh_order(order_id):
+    """Re-derive the payments of an order after its lines or table changed."""
+    payments = Payment.all_objects.filter(order_id=order_id).filter(
+        Q(status=PaymentStatusChoices.PAID) | Q(report_fact__isnull=False)
+    ).select_related("order")
+    for payment in payments:
+        refresh_payment(payment)
+
+##################################################################################
+#                          Backfill & consistency                                #
+##################################################################################
+
+def _paid_payments(start=None, end=None):
+    payments = Payment.objects.filter(status=PaymentStatusChoices.PAID).annotate(
+        paid_day=TruncDate(Coalesce("paid_at", "created_at"))
+    )
+    if start:
+        payments = payments.filter(paid_day__gte=start)
+    if end:
+        payments = payments.filter(paid_day__lte=end)
+    return payments
+
+
+def rebuild(start=None, end=None, batch_size=1000):
+    """
+    Recompute rollups and facts for the given day range (everything if no
+    range) from Payment / Order / OrderItem. Returns the number of payments.
+    Facts of payments that are no longer paid are dropped with their days.
+    """
+    payments = _paid_payments(start, end).select_related("order").prefetch_related(
+        "order__items__menu_item"
+    )
+    days = Q()
+    if start:
+        days &= Q(day__gte=start)
+    if end:
+        days &= Q(day__lte=end)
+
+    with transaction.atomic():
+        RevenueRollup.objects.filter(days).delete()
+        stale = PaymentFact.objects.all()
+        if start or end:
+            stale = stale.filter(days | Q(payment__in=payments.values("pk")))
+            # A rebuilt payment's fact from a day outside the range is still
+            # counted in that day's rollups: take it out there.
+            for fact in stale.exclude(days):
+                _apply(fact.day, fact.contributions, -1)
+        stale.delete()
+
+        totals = defaultdict(lambda: [Decimal(0), 0])
+        facts = []
+        rebuilt = 0
+        for payment in payments.iterator(chunk_size=batch_size):
+            rebuilt += 1
+            day, contributions = payment_contributions(payment)
+            facts.append(PaymentFact(payment_id=payment.pk, day=day, contributions=contributions))
+            for dimension, key, amount, count in contributions:
+                bucket = totals[(day, dimension, key)]
+                bucket[0] += Decimal(amount)
+                bucket[1] += count
+            if len(facts) >= batch_size:
+                PaymentFact.objects.bulk_create(facts)
+                facts = []
+        PaymentFact.objects.bulk_create(facts)
+        RevenueRollup.objects.bulk_create(
+            [
+                RevenueRollup(day=day, dimension=dimension, key=key, amount=amount, count=count)
+                for (day, dimension, key), (amount, count) in totals.items()
+            ],
+            batch_size=batch_size,
+        )
+    return rebuilt
+
+
+def inconsistent_days(start=None, end=None):
+    """
+    Days whose rollups disagree with the payments table, or whose hour and
+    method splits do not add up to the day total.
+    Returns {day: [reason, ...]}.
+    """
+    problems = defaultdict(list)
+    live = {
+        row["paid_day"]: (row["amount"], row["count"])
+        for row in _paid_payments(start, end).values("paid_day").annotate(amount=Sum("amount"), count=Count("pk"))
+    }
+    rollups = RevenueRollup.objects.all()
+    if start:
+        rollups = rollups.filter(day__gte=start)
+    if end:
+        rollups = rollups.filter(day__lte=end)
+    split = defaultdict(lambda: (Decimal(0), 0))
+    for row in rollups.values("day", "dimension").annotate(amount=Sum("amount"), count=Sum("count")):
+        split[(row["day"], row["dimension"])] = (row["amount"], row["count"])
+
+    days = set(live) | {day for day, _ in split}
+    for day in sorted(days):
+        total = split[(day, ReportDimension.TOTAL)]
+        expected = live.get(day, (Decimal(0), 0))
+        if (_money(total[0]), total[1]) != (_money(expected[0]), expected[1]):
+            problems[day].append(f"total {total} != payments {expected}")
+        for dimension in (ReportDimension.HOUR, ReportDimension.METHOD):
+            if split[(day, dimension)] != total:
+                problems[day].append(f"{dimension} split {split[(day, dimension)]} != total {total}")
+    return dict(problems)
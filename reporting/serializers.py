@@ -0,0 +1,28 @@
+# -------------------  DRF imports   ------------------------
+from rest_framework import serializers
+# -------------------  Django imports   ------------------------
+from django.utils import timezone
+# -------------------  Other imports   ------------------------
+from datetime import timedelta
+
+GROUP_BY_CHOICES = ("day", "hour", "method", "category", "table")
+
+##################################################################################
+#                         RevenueReportQuery Serializer                          #
+##################################################################################
+
+class RevenueReportQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the revenue report.
+    Defaults to the last 30 days grouped by day.
+    """
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    group_by = serializers.ChoiceField(choices=GROUP_BY_CHOICES, default="day")
+
+    def validate(self, data):
+        data.setdefault("end", timezone.localdate())
+        data.setdefault("start", data["end"] - timedelta(days=29))
+        if data["start"] > data["end"]:
+            raise serializers.ValidationError("start must be before end.")
+        return data
@@ -0,0 +1,39 @@
+# -------------------  Django imports   ------------------------
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+# -------------------   Apps imports ------------------------
+from orders.models import Order, OrderItem, Payment
+from .rollups import refresh_payment, refresh_order, retract_payment
+
+# ----------------------- Payment Signals -------------------------
+
+@receiver(post_save, sender=Payment)
+def refresh_rollups_on_payment_save(sender, instance, **kwargs):
+    """
+    Apply the payment's change (paid, refunded, amount or method edited)
+    to the revenue rollups as a delta.
+    """
+    refresh_payment(instance)
+
+
+@receiver(pre_delete, sender=Payment)
+def retract_rollups_on_payment_delete(sender, instance, **kwargs):
+    """
+    Remove the payment from the rollups. Done before the delete, because the
+    PaymentFact row goes away with the payment.
+    """
+    retract_payment(instance.pk)
+
+# ----------------------- Order / OrderItem Signals ----------------
+
+@receiver(post_save, sender=Order)
+def refresh_rollups_on_order_save(sender, instance, **kwargs):
+    """The table of a paid order may have changed."""
+    refresh_order(instance.pk)
+
+
+@receiver(post_save, sender=OrderItem)
+@receiver(post_delete, sender=OrderItem)
+def refresh_rollups_on_orderitem_change(sender, instance, **kwargs):
+    """Category split of the order's paid payments depends on its lines."""
+    refresh_order(instance.order_id)
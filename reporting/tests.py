@@ -0,0 +1,98 @@
+# -------------------  Django imports   ------------------------
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+# -------------------   Apps imports ------------------------
+from menu.models import Category, MenuItem
+from orders.choices import PaymentMethodChoices, PaymentStatusChoices
+from orders.models import Order, OrderItem, Payment
+from reservation.models import Table
+from .models import PaymentFact, RevenueRollup
+from .rollups import inconsistent_days, rebuild
+# -------------------  Other imports   ------------------------
+from datetime import date, datetime, timezone as dt_timezone
+
+##################################################################################
+#                       Delta refresh vs full rebuild                            #
+##################################################################################
+
+class RollupRebuildTests(TestCase):
+    """The rollups kept up by the signals equal a rebuild from the payments."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user("guest", password="secret-pass-1")
+        self.table = Table.objects.create(number=1, capacity="4")
+        coffee = Category.objects.create(name="Coffee")
+        cakes = Category.objects.create(name="Cakes")
+        self.espresso = MenuItem.objects.create(category=coffee, name="Espresso", price="3.00", stock=100)
+        self.cake = MenuItem.objects.create(category=cakes, name="Cheesecake", price="6.00", stock=100)
+
+    def pay(self, amount, day=1, method=PaymentMethodChoices.CASH):
+        order = Order.objects.create(user=self.user, table=self.table)
+        OrderItem.objects.create(order=order, menu_item=self.espresso, quantity=2)
+        OrderItem.objects.create(order=order, menu_item=self.cake, quantity=1)
+        return Payment.objects.create(
+            order=order, amount=amount, method=method, status=PaymentStatusChoices.PAID,
+            paid_at=datetime(2026, 3, day, 12, tzinfo=dt_timezone.utc),
+        )
+
+    def rollups(self):
+        """{(day, dimension, key): (amount, count)}, without rows a delta took back to zero."""
+        return {
+            (row.day, row.dimension, row.key): (row.amount, row.count)
+            for row in RevenueRollup.objects.exclude(amount=0, count=0)
+        }
+
+    def assertRebuildKeeps(self, expected, **days):
+        rebuild(**days)
+        self.assertEqual(self.rollups(), expected)
+        self.assertEqual(inconsistent_days(), {})
+
+    def test_rebuild_matches_delta_refresh(self):
+        self.pay("12.00")
+        online = self.pay("30.00", day=2, method=PaymentMethodChoices.ONLINE)
+        failed = self.pay("5.00")
+        line = online.order.items.get(menu_item=self.cake)
+        line.quantity = 3
+        line.save()
+        failed.status = PaymentStatusChoices.FAILED
+        failed.save()
+
+        refreshed = self.rollups()
+        self.assertEqual(refreshed[(date(2026, 3, 1), "total", "")], (12, 1))
+        self.assertRebuildKeeps(refreshed)
+
+    def test_full_rebuild_drops_facts_of_unpaid_payments(self):
+        self.pay("12.00")
+        payment = self.pay("8.00")
+        # A status change that skipped the signals: the fact is stale.
+        Payment.objects.filter(pk=payment.pk).update(status=PaymentStatusChoices.FAILED)
+
+        rebuild()
+        self.assertFalse(PaymentFact.objects.filter(payment_id=payment.pk).exists())
+
+        payment.refresh_from_db()
+        payment.save()
+        self.assertEqual(self.rollups()[(date(2026, 3, 1), "total", "")], (12, 1))
+        self.assertFalse(RevenueRollup.objects.filter(amount__lt=0).exists())
+        self.assertEqual(inconsistent_days(), {})
+
+    def test_soft_deleted_payment_counts_as_unpaid(self):
+        self.pay("12.00")
+        payment = self.pay("8.00")
+        payment.is_deleted = True
+        payment.save()
+
+        refreshed = self.rollups()
+        self.assertEqual(refreshed[(date(2026, 3, 1), "total", "")], (12, 1))
+        self.assertRebuildKeeps(refreshed)
+
+    def test_range_rebuild_takes_moved_payments_out_of_their_old_day(self):
+        self.pay("12.00", day=1)
+        moved = self.pay("8.00", day=1)
+        Payment.objects.filter(pk=moved.pk).update(paid_at=datetime(2026, 3, 2, 9, tzinfo=dt_timezone.utc))
+
+        rebuild(start=date(2026, 3, 2), end=date(2026, 3, 2))
+        rollups = self.rollups()
+        self.assertEqual(rollups[(date(2026, 3, 1), "total", "")], (12, 1))
+        self.assertEqual(rollups[(date(2026, 3, 2), "total", "")], (8, 1))
+        self.assertEqual(inconsistent_days(), {})
@@ -0,0 +1,8 @@
+# -------------------  Django imports   ------------------------
+from django.urls import path
+# -------------------   Apps imports ------------------------
+from .views import RevenueReportView
+
+urlpatterns = [
+    path('revenue/', RevenueReportView.as_view(), name='revenue-report'),
+]
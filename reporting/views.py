@@ -0,0 +1,76 @@
+# -------------------  DRF imports   ------------------------
+from rest_framework import generics
+from rest_framework.response import Response
+# -------------------  Django imports   ------------------------
+from django.db.models import Sum
+# -------------------   Apps imports ------------------------
+from menu.models import Category
+from orders.choices import PaymentMethodChoices
+from orders.permissions import IsAdminUser
+from reservation.models import Table
+from utility.routers import read_database
+from utility.views import BaseAPIView
+from .choices import ReportDimension
+from .models import RevenueRollup
+from .serializers import RevenueReportQuerySerializer
+# -------------------  Other imports   ------------------------
+from decimal import Decimal
+
+##################################################################################
+#                             RevenueReport Views                                #
+##################################################################################
+
+class RevenueReportView(BaseAPIView, generics.GenericAPIView):
+    """
+    Paid revenue between `start` and `end` (inclusive), grouped by day,
+    hour of day, payment method, menu category or table, with the average
+    ticket size. Answered from the daily rollups, so the cost grows with
+    the number of days in the range, not with the number of payments.
+    """
+    permission_classes = [IsAdminUser]
+    serializer_class = RevenueReportQuerySerializer
+
+    def get(self, request):
+        query = self.get_serializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        start, end, group_by = (query.validated_data[name] for name in ("start", "end", "group_by"))
+
+        rollups = RevenueRollup.objects.using(read_database()).filter(day__range=(start, end))
+        summary = rollups.filter(dimension=ReportDimension.TOTAL).aggregate(
+            total=Sum("amount"), count=Sum("count")
+        )
+        total, count = summary["total"] or Decimal("0.00"), summary["count"] or 0
+
+        dimension, field = (ReportDimension.TOTAL, "day") if group_by == "day" else (group_by, "key")
+        grouped = (
+            rollups.filter(dimension=dimension).values_list(field)
+            .annotate(amount=Sum("amount"), count=Sum("count")).order_by(field)
+        )
+
+        labels = self.get_labels(group_by, [row[0] for row in grouped])
+        return Response({
+            "start": start,
+            "end": end,
+            "group_by": group_by,
+            "total": total,
+            "count": count,
+            "average_ticket": (total / count).quantize(Decimal("0.01")) if count else None,
+            "rows": [
+                {"key": key, "label": labels.get(key, key), "amount": amount, "count": row_count}
+                for key, amount, row_count in grouped if row_count or amount
+            ],
+        })
+
+    def get_labels(self, group_by, keys):
+        """Readable names for method / category / table keys."""
+        if group_by == "method":
+            return dict(PaymentMethodChoices.choices)
+        if group_by == "category":
+            names = Category.objects.using(read_database()).in_bulk([int(key) for key in keys])
+            return {str(pk): category.name for pk, category in names.items()}
+        if group_by == "table":
+            tables = Table.objects.using(read_database()).in_bulk([int(key) for key in keys])
+            return {str(pk): f"Table {table.number}" for pk, table in tables.items()}
+        if group_by == "hour":
+            return {key: f"{key}:00" for key in keys}
+        return {}
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:09
+
+import django.db.models.manager
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservation', '0006_reservation_reservation_date_69bfbb_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='reservation',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -60,7 +60,7 @@ class Reservation(BaseModel):
     def __str__(self):
         return f"{self.full_name} - {self.date} {self.time}"
 
-    class Meta:
+    class Meta(BaseModel.Meta):
         ordering = ["-created_at"]
         verbose_name = "Reservation"
         verbose_name_plural = "Reservations"
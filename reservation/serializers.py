@@ -2,9 +2,10 @@
 from rest_framework import serializers
 # -------------------   Apps imports ------------------------
 from .models import Reservation, Table
+from info.schedule import get_schedule
 from utility.serializers import BaseSerializer
 # -------------------   Other imports ------------------------
-from datetime import datetime, timedelta, time as djangotime
+from datetime import datetime, timedelta
 
 ##################################################################################
 #                             Table Serializer                                   #
@@ -47,9 +48,15 @@ class ReservationSerializer(BaseSerializer):
         # Calculate reservation end time based on duration
         res_end = res_start + timedelta(minutes=duration_minutes)
 
-        # Validate reservation time is within allowed hours (10:00 - 22:00)
-        if not djangotime(10, 0) <= res_time <= djangotime(22, 0):
-            raise serializers.ValidationError("Reservation time must be between 10:00 and 22:00.")
+        # Validate reservation time is within the opening hours (working hours + holidays);
+        # a reservation may start at closing time itself, as with the fixed 10:00-22:00 rule
+        schedule = get_schedule()
+        if not (schedule.is_open(res_start) or schedule.closes_at(res_start)):
+            next_open = schedule.next_open(res_start)
+            message = "The cafe is closed at the requested time."
+            if next_open:
+                message += f" It opens next on {next_open:%Y-%m-%d at %H:%M}."
+            raise serializers.ValidationError(message)
 
         # Check if table is provided
         if not table:
@@ -1,6 +1,9 @@
-from django.db.models.signals import post_save, pre_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from functools import partial
 from .models import Reservation
+from utility.httpcache import bump_data_version
 from users.models import CustomUser
 from django.core.mail import send_mail
 from .tasks import send_reservation_email
@@ -66,3 +69,9 @@ def reservation_status_handler(sender, instance, created, **kwargs):
             send_reservation_email.delay(
                 "Reservation Approved", staff_msg, staff.email
             )
+
+# ---------------------- Data version of the cached reservation lists ----------------------
+@receiver(post_save, sender=Reservation)
+@receiver(post_delete, sender=Reservation)
+def bump_reservation_data(sender, **kwargs):
+    transaction.on_commit(partial(bump_data_version, Reservation))
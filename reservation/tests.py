@@ -0,0 +1,125 @@
+# -------------------  Django imports   ------------------------
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+# -------------------  DRF imports   ------------------------
+from rest_framework.test import APITestCase
+# -------------------   Apps imports ------------------------
+from .models import Reservation, Table
+from .serializers import ReservationSerializer
+# -------------------  Other imports   ------------------------
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+
+##################################################################################
+#                    Compiled reader vs ReservationSerializer                    #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None)
+class ReservationReaderTests(APITestCase):
+    """ReservationList renders the same JSON through the compiled reader as through the serializer."""
+
+    def setUp(self):
+        admin = get_user_model().objects.create_user("admin", password="secret-pass-1", is_staff=True)
+        self.client.force_authenticate(admin)
+        table = Table.objects.create(number=1, capacity="4")
+        Reservation.objects.create(
+            full_name="Sara", phone_number="09120000001", date=date(2025, 3, 1), time=time(18, 30),
+            number_of_guests=3, table_type="4", table=table, is_approved=True,
+        )
+        Reservation.objects.create(
+            full_name="Reza", phone_number="09120000002", date=date(2025, 3, 2), time=time(20, 0, 15),
+            number_of_guests=4, table_type="4", table=table, extra_notes="Window seat",
+            reservation_type="birthday", birthday_design=True, birthday_cake=True, duration=90,
+        )
+        # Whole seconds: the serializer prints no microseconds for them.
+        Reservation.objects.filter(full_name="Reza").update(
+            created_at=datetime(2025, 2, 1, 9, tzinfo=dt_timezone.utc), deleted_at=datetime(2025, 2, 2, tzinfo=dt_timezone.utc)
+        )
+
+    def get(self, compiled):
+        cache.clear()
+        with override_settings(COMPILED_READERS=compiled):
+            response = self.client.get("/reservation/reservations/")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_reservation_list(self):
+        expected = self.get(compiled=False)
+        self.assertEqual(expected["count"], 2)
+        self.assertEqual(self.get(compiled=True), expected)
+
+    def test_reservation_list_in_other_time_zone(self):
+        with timezone.override("Asia/Tehran"):
+            self.assertEqual(self.get(compiled=True), self.get(compiled=False))
+
+##################################################################################
+#                           Cached reservation lists                             #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None)
+class ReservationCacheTests(APITestCase):
+    """The per-caller cache of the lists is keyed by the Reservation data version."""
+
+    def setUp(self):
+        cache.clear()
+        admin = get_user_model().objects.create_user("admin", password="secret-pass-1", is_staff=True)
+        self.client.force_authenticate(admin)
+        self.table = Table.objects.create(number=1, capacity="4")
+
+    def reserve(self, name):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Reservation.objects.create(
+                full_name=name, phone_number="09120000001", date=date(2025, 3, 1), time=time(18, 30),
+                number_of_guests=2, table_type="4", table=self.table,
+            )
+
+    def names(self):
+        return [row["full_name"] for row in self.client.get("/reservation/reservations/").json()["results"]]
+
+    def test_writes_are_seen_by_the_next_request(self):
+        self.reserve("Sara")
+        self.assertEqual(self.names(), ["Sara"])
+
+        reservation = self.reserve("Reza")
+        self.assertEqual(sorted(self.names()), ["Reza", "Sara"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            reservation.delete()
+        self.assertEqual(self.names(), ["Sara"])
+
+    def test_unchanged_data_is_served_from_the_cache(self):
+        self.reserve("Sara")
+        self.names()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.names(), ["Sara"])
+
+##################################################################################
+#                          Opening hours of reservations                         #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None, DEFAULT_OPENING_HOURS=("10:00", "22:00"))
+class ReservationOpeningHoursTests(APITestCase):
+    """Reservations may start from opening time up to and including closing time."""
+
+    def setUp(self):
+        cache.clear()
+        self.table = Table.objects.create(number=1, capacity="4")
+        self.day = timezone.localdate() + timedelta(days=2)
+
+    def errors(self, at):
+        serializer = ReservationSerializer(data={
+            "full_name": "Sara", "phone_number": "09120000001", "date": self.day.isoformat(),
+            "time": at, "number_of_guests": 2, "table_type": "4", "table": self.table.pk,
+        })
+        serializer.is_valid()
+        return serializer.errors
+
+    def test_opening_and_closing_times_are_accepted(self):
+        for at in ("10:00", "15:30", "22:00"):
+            self.assertEqual(self.errors(at), {}, at)
+
+    def test_times_outside_the_hours_are_rejected(self):
+        for at in ("09:59", "22:00:30", "22:01"):
+            self.assertIn("closed", str(self.errors(at)), at)
@@ -1,7 +1,6 @@
 # -------------------  Django imports   ------------------------
 from django.utils import timezone
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from django.core.cache import cache
 from django.conf import settings
 
@@ -15,8 +14,9 @@ from rest_framework.response import Response
 from .models import Reservation , Table
 from .serializers import ReservationSerializer, TableSerializer
 from .permissions import IsAdminOrCreateOnly
-from utility.views import BaseAPIView 
-from utility.mixins import RestoreMixin
+from utility.views import BaseAPIView, HistoryListView
+from utility.mixins import CompiledListMixin, RestoreMixin
+from utility.httpcache import cache_per_user
 from menu.models import MenuItem
 
 
@@ -28,8 +28,8 @@ CACHE_TTL = getattr(settings, 'CACHE_TTL', 60 * 5)
 #                             Reservation Views                                  #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='get')
-class ReservationList(BaseAPIView, generics.ListCreateAPIView):
+@method_decorator(cache_per_user(Reservation, ttl=CACHE_TTL), name='get')
+class ReservationList(CompiledListMixin, BaseAPIView, generics.ListCreateAPIView):
     queryset = Reservation.objects.all()
     serializer_class = ReservationSerializer
     permission_classes = [IsAdminOrCreateOnly]
@@ -86,7 +86,7 @@ class ReservationDetail(BaseAPIView, generics.RetrieveUpdateDestroyAPIView):
 #                         ReservationsByDate Views                                #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='get')
+@method_decorator(cache_per_user(Reservation, ttl=CACHE_TTL), name='get')
 class ReservationsByDate(BaseAPIView, generics.ListAPIView):
     """
     API endpoint to list all reservations for a specific date.
@@ -103,7 +103,7 @@ class ReservationsByDate(BaseAPIView, generics.ListAPIView):
 #                         ReservationsByTable Views                               #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='get')
+@method_decorator(cache_per_user(Reservation, ttl=CACHE_TTL), name='get')
 class ReservationsByTable(BaseAPIView, generics.ListAPIView):
     """
     API endpoint to list all reservations for a specific table.
@@ -120,7 +120,7 @@ class ReservationsByTable(BaseAPIView, generics.ListAPIView):
 #                         UpcomingReservations Views                              #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='get')
+@method_decorator(cache_per_user(Reservation, ttl=CACHE_TTL), name='get')
 class UpcomingReservations(BaseAPIView, generics.ListAPIView):
     """
     API endpoint to list all upcoming reservations.
@@ -142,7 +142,7 @@ class UpcomingReservations(BaseAPIView, generics.ListAPIView):
 #                         ApprovedReservations Views                              #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='get')
+@method_decorator(cache_per_user(Reservation, ttl=CACHE_TTL), name='get')
 class ApprovedReservations(BaseAPIView, generics.ListAPIView):
     """
     API endpoint to list all approved reservations.
@@ -158,7 +158,7 @@ class ApprovedReservations(BaseAPIView, generics.ListAPIView):
 #                         PendingReservations Views                               #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='get')
+@method_decorator(cache_per_user(Reservation, ttl=CACHE_TTL), name='get')
 class PendingReservations(BaseAPIView, generics.ListAPIView):
     """
     API endpoint to list all pending reservations.
@@ -174,7 +174,7 @@ class PendingReservations(BaseAPIView, generics.ListAPIView):
 #                         AvailableTables Views                                   #
 ##################################################################################
 
-@method_decorator(cache_page(CACHE_TTL), name='get')
+@method_decorator(cache_per_user(Reservation, Table, ttl=CACHE_TTL), name='get')
 class AvailableTables(BaseAPIView, generics.ListAPIView):
     """
     API endpoint to list all available tables for a given date and time.
@@ -205,17 +205,15 @@ class MenuItemRestoreView(RestoreMixin, APIView):
     permission_classes = [IsAdminUser]
 
     def post(self, request, pk):
-        instance = MenuItem.objects.get(pk=pk)
+        instance = self.get_restore_object(MenuItem, pk)
         instance.is_deleted = False
         instance.save()
         return Response({"success": f"MenuItem '{instance.name}' restored"}, status=status.HTTP_200_OK)
 
 
-class MenuItemHistoryList(BaseAPIView, generics.ListAPIView):
+class MenuItemHistoryList(HistoryListView):
     """
     List all historical changes for menu items (admin only).
     """
-    permission_classes = [IsAdminUser]
-
-    def get_queryset(self):
-        return MenuItem.history.all()
\ No newline at end of file
+    model = MenuItem
+    permission_classes = [IsAdminUser]
\ No newline at end of file
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:49
+
+import django.db.models.manager
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_alter_purchasehistory_managers'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='purchasehistory',
+            options={'base_manager_name': 'all_objects', 'default_manager_name': 'objects'},
+        ),
+        migrations.AlterModelManagers(
+            name='purchasehistory',
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,339 @@
+# Two-tier cache: a bounded in-process LRU (L1) holding decoded objects, in
+# front of another cache alias (L2, Redis). Only keys under LOCAL_PREFIXES
+# go through L1: data versions and the values whose keys embed one
+# (utility.httpcache, info.venue), so a hot read needs no round-trip and
+# no unpickling. Everything else goes straight to L2.
+#
+# L1 values are shared by every thread of the process, not copied: callers
+# must treat them as read-only.
+#
+# Writes through this backend update L1 and, with INVALIDATION = "pubsub",
+# publish the key on a Redis channel; each process drops it from its L1.
+# While a process is not subscribed (starting, or after a lost connection)
+# its L1 is empty and unused, so no invalidation can be missed.
+
+# -------------------  Django imports   ------------------------
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.exceptions import ImproperlyConfigured
+# -------------------  Other imports   ------------------------
+from collections import Counter, OrderedDict
+import logging
+import os
+import pickle
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+##################################################################################
+#                                 Local tier                                     #
+##################################################################################
+
+class LocalLRU:
+    """An LRU of (value, size, expires) limited both in entries and in bytes."""
+
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        # Bumped by every invalidation: an L2 read that started before one
+        # may have fetched the old value and must not be kept.
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.stats = Counter()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                value, _, expires = entry
+                if expires is None or expires > time.time():
+                    self.entries.move_to_end(key)
+                    self.stats["local_hits"] += 1
+                    return value
+                self._pop(key)
+            self.stats["local_misses"] += 1
+            return MISSING
+
+    def put(self, key, value, expires, generation=None):
+        try:
+            size = len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._pop(key)
+            self.entries[key] = (value, size, expires)
+            self.bytes += size
+            while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+                self._pop(next(iter(self.entries)))
+                self.stats["evictions"] += 1
+
+    def discard(self, key):
+        with self.lock:
+            self.generation += 1
+            self._pop(key)
+
+    def clear(self):
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
+            self.bytes = 0
+
+    def _pop(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+
+class Tier:
+    """The L1 of one process plus its invalidation listener."""
+
+    def __init__(self, max_entries, max_bytes):
+        self.pid = os.getpid()
+        self.origin = uuid.uuid4().hex
+        self.local = LocalLRU(max_entries, max_bytes)
+        self.listening = False
+        self.listener = None
+
+
+# One Tier per process and cache alias; Django creates backends per thread.
+TIERS = {}
+TIERS_LOCK = threading.Lock()
+
+##################################################################################
+#                                  Backend                                       #
+##################################################################################
+
+class TwoTierCache(BaseCache):
+    """
+    CACHES entry:
+
+        "BACKEND": "utility.cache_backends.TwoTierCache",
+        "LOCATION": "<alias of the L2 cache>",
+        "OPTIONS": {
+            "LOCAL_PREFIXES": ("httpcache:version:", ...),
+            "LOCAL_MAX_ENTRIES": 2000,
+            "LOCAL_MAX_BYTES": 64 * 1024 * 1024,
+            "LOCAL_TIMEOUT": 300,  # upper bound of an L1 entry's life
+            "INVALIDATION": "pubsub",  # or "local" when L2 is per-process too
+            "CHANNEL": "cache:invalidate",
+        }
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.remote_alias = location
+        self.prefixes = tuple(options.get("LOCAL_PREFIXES", ()))
+        self.max_entries = options.get("LOCAL_MAX_ENTRIES", 2000)
+        self.max_bytes = options.get("LOCAL_MAX_BYTES", 64 * 1024 * 1024)
+        self.local_timeout = options.get("LOCAL_TIMEOUT", 300)
+        self.invalidation = options.get("INVALIDATION", "pubsub")
+        self.channel = options.get("CHANNEL", "cache:invalidate")
+        if self.invalidation not in ("pubsub", "local"):
+            raise ImproperlyConfigured("TwoTierCache INVALIDATION must be 'pubsub' or 'local'.")
+
+    @property
+    def remote(self):
+        return caches[self.remote_alias]
+
+    # ------------------------------ L1 state -------------------------------
+
+    @property
+    def tier(self):
+        key = (self.remote_alias, self.channel)
+        tier = TIERS.get(key)
+        if tier is None or tier.pid != os.getpid():
+            with TIERS_LOCK:
+                tier = TIERS.get(key)
+                if tier is None or tier.pid != os.getpid():
+                    tier = TIERS[key] = Tier(self.max_entries, self.max_bytes)
+        if self.invalidation == "pubsub" and tier.listener is None:
+            with TIERS_LOCK:
+                if tier.listener is None:
+                    tier.listener = threading.Thread(target=self.listen, args=(tier,), daemon=True)
+                    tier.listener.start()
+        return tier
+
+    def local_for(self, key):
+        """The L1 to use for `key`, or None."""
+        if not key.startswith(self.prefixes):
+            return None
+        tier = self.tier
+        if self.invalidation == "pubsub" and not tier.listening:
+            return None
+        return tier.local
+
+    def local_expiry(self, timeout):
+        expires = self.get_backend_timeout(timeout)
+        limit = time.time() + self.local_timeout
+        return limit if expires is None else min(expires, limit)
+
+    # ---------------------------- Invalidation -----------------------------
+
+    def redis(self):
+        try:
+            return self.remote.client.get_client(write=True)
+        except AttributeError:
+            raise ImproperlyConfigured(
+                f"TwoTierCache pub/sub needs a django_redis cache as L2, not '{self.remote_alias}'."
+            )
+
+    def forget(self, key, version=None):
+        """Drop `key` from this process's L1 and from every other one."""
+        made = self.make_key(key, version)
+        self.tier.local.discard(made)
+        self.publish(made)
+
+    def publish(self, made_key):
+        if self.invalidation != "pubsub":
+            return
+        try:
+            self.redis().publish(self.channel, f"{self.tier.origin}:{made_key}")
+        except Exception:
+            # The other processes may keep the old value for LOCAL_TIMEOUT.
+            logger.exception("Cache invalidation of %s not published", made_key)
+
+    def listen(self, tier):
+        while tier.pid == os.getpid():
+            try:
+                pubsub = self.redis().pubsub()
+                pubsub.subscribe(self.channel)
+                for message in pubsub.listen():
+                    if message["type"] == "subscribe":
+                        tier.local.clear()
+                        tier.listening = True
+                    elif message["type"] == "message":
+                        origin, _, made_key = message["data"].decode().partition(":")
+                        if made_key == "*":
+                            tier.local.clear()
+                        elif origin != tier.origin:
+                            tier.local.discard(made_key)
+            except Exception:
+                logger.exception("Cache invalidation channel lost; local tier disabled")
+            tier.listening = False
+            tier.local.clear()
+            time.sleep(1)
+
+    # ------------------------------ Reads ----------------------------------
+
+    def get(self, key, default=None, version=None):
+        local = self.local_for(key)
+        if local is None:
+            return self.remote.get(key, default, version=version)
+        made = self.make_key(key, version)
+        value = local.get(made)
+        if value is not MISSING:
+            return value
+        generation = local.generation
+        local.stats["remote_reads"] += 1
+        value = self.remote.get(key, MISSING, version=version)
+        if value is MISSING:
+            return default
+        local.put(made, value, self.local_expiry(None), generation)
+        return value
+
+    def get_many(self, keys, version=None):
+        found, remote_keys = {}, []
+        for key in keys:
+            local = self.local_for(key)
+            value = MISSING if local is None else local.get(self.make_key(key, version))
+            if value is MISSING:
+                remote_keys.append(key)
+            else:
+                found[key] = value
+        if remote_keys:
+            tier = self.tier
+            generation = tier.local.generation
+            tier.local.stats["remote_reads"] += 1
+            fetched = self.remote.get_many(remote_keys, version=version)
+            for key, value in fetched.items():
+                local = self.local_for(key)
+                if local is not None:
+                    local.put(self.make_key(key, version), value, self.local_expiry(None), generation)
+            found.update(fetched)
+        return found
+
+    def has_key(self, key, version=None):
+        local = self.local_for(key)
+        if local is not None and local.get(self.make_key(key, version)) is not MISSING:
+            return True
+        return self.remote.has_key(key, version=version)
+
+    # ------------------------------ Writes ---------------------------------
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.remote.set(key, value, timeout=self.remote_timeout(timeout), version=version)
+        if key.startswith(self.prefixes):
+            self.forget(key, version)
+            local = self.local_for(key)
+            if local is not None:
+                local.put(self.make_key(key, version), value, self.local_expiry(timeout))
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.remote.add(key, value, timeout=self.remote_timeout(timeout), version=version)
+        if added and key.startswith(self.prefixes):
+            self.forget(key, version)
+        return added
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.remote.set_many(data, timeout=self.remote_timeout(timeout), version=version)
+        for key in data:
+            if key.startswith(self.prefixes):
+                self.forget(key, version)
+        return failed
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.remote.touch(key, timeout=self.remote_timeout(timeout), version=version)
+
+    # L2 is written before L1s are told to forget: a process that misses
+    # right after its discard must read the new value, not the old one.
+
+    def delete(self, key, version=None):
+        deleted = self.remote.delete(key, version=version)
+        if key.startswith(self.prefixes):
+            self.forget(key, version)
+        return deleted
+
+    def delete_many(self, keys, version=None):
+        deleted = self.remote.delete_many(keys, version=version)
+        for key in keys:
+            if key.startswith(self.prefixes):
+                self.forget(key, version)
+        return deleted
+
+    def incr(self, key, delta=1, version=None):
+        value = self.remote.incr(key, delta, version=version)
+        if key.startswith(self.prefixes):
+            self.forget(key, version)
+        return value
+
+    def decr(self, key, delta=1, version=None):
+        return self.incr(key, -delta, version=version)
+
+    def clear(self):
+        self.tier.local.clear()
+        self.publish("*")
+        return self.remote.clear()
+
+    def close(self, **kwargs):
+        self.remote.close(**kwargs)
+
+    def remote_timeout(self, timeout):
+        """This backend's default timeout, passed on explicitly."""
+        return self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+    def __getattr__(self, name):
+        # Backend extras (django_redis lock(), ttl(), delete_pattern()...) go to L2 as is.
+        if name.startswith("__") or name == "remote_alias":
+            raise AttributeError(name)
+        return getattr(self.remote, name)
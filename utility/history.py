@@ -0,0 +1,230 @@
+# -------------------  Django imports   ------------------------
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+# -------------------  DRF imports   ------------------------
+from rest_framework.utils.encoders import JSONEncoder
+# -------------------  Other imports   ------------------------
+from pathlib import Path
+from simple_history.models import HistoricalRecords
+import gzip
+import json
+import os
+# -------------------   Apps imports ------------------------
+from .serializers import HistoricalRecordSerializer
+
+# Fields that change on every save and never matter on their own in history.
+BOOKKEEPING_FIELDS = {"updated_at"}
+# Rows per month file, next to the files, so counting never decompresses them.
+ARCHIVE_MANIFEST = "counts.json"
+
+##################################################################################
+#                          CompactHistoricalRecords                              #
+##################################################################################
+
+class CompactHistoricalRecords(HistoricalRecords):
+    """
+    HistoricalRecords that does not record "hot" counter-only updates.
+
+    A save whose `update_fields` only touches `hot_fields` (e.g. stock
+    decrements on every order) writes no historical row. Full saves and
+    saves that touch any other field are recorded as usual.
+    """
+
+    def __init__(self, *args, hot_fields=(), **kwargs):
+        self.hot_fields = frozenset(hot_fields)
+        super().__init__(*args, **kwargs)
+
+    def contribute_to_class(self, cls, name):
+        super().contribute_to_class(cls, name)
+        cls._history_hot_fields = self.hot_fields
+
+    def post_save(self, instance, created, using=None, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if not created and update_fields and set(update_fields) <= self.hot_fields | BOOKKEEPING_FIELDS:
+            return
+        super().post_save(instance, created, using=using, **kwargs)
+
+
+def history_models():
+    """All models that have a simple_history manager."""
+    return [
+        model for model in apps.get_models()
+        if hasattr(model._meta, "simple_history_manager_attribute")
+    ]
+
+
+def history_manager(model):
+    return getattr(model, model._meta.simple_history_manager_attribute)
+
+##################################################################################
+#                                Compaction                                      #
+##################################################################################
+
+def compact_history(model, batch_size=1000):
+    """
+    Delete historical rows that only changed hot counters or bookkeeping
+    fields compared to the previous row of the same object, unless they are
+    the latest row of that object. Returns the number of deleted rows.
+
+    Rows are read in keyset pages of `batch_size` (object, date, id), so no
+    cursor is open on the table while the doomed rows are deleted.
+    """
+    manager = history_manager(model)
+    ignored = set(getattr(model, "_history_hot_fields", ())) | BOOKKEEPING_FIELDS
+    pk_name = model._meta.pk.attname
+    compared = [pk_name] + [
+        field.attname for field in model._meta.concrete_fields
+        if field.name not in ignored and field.attname != pk_name
+    ]
+    rows = manager.order_by(pk_name, "history_date", "history_id").values_list(
+        "history_id", "history_type", "history_date", *compared
+    )
+
+    deleted = 0
+    previous = pending = after = None
+    while True:
+        page = rows
+        if after is not None:
+            object_pk, date, history_id = after
+            page = rows.filter(
+                Q(**{f"{pk_name}__gt": object_pk})
+                | Q(**{pk_name: object_pk, "history_date__gt": date})
+                | Q(**{pk_name: object_pk, "history_date": date, "history_id__gt": history_id})
+            )
+        page = list(page[:batch_size])
+        if not page:
+            return deleted
+        doomed = []
+        for row in page:
+            history_id, history_type, values = row[0], row[1], row[3:]
+            same_object = previous is not None and previous[0] == values[0]
+            if pending is not None and same_object:
+                doomed.append(pending)
+            pending = None
+            if same_object and history_type == "~" and values == previous:
+                # Counter-only change: superseded once a newer row exists.
+                pending = history_id
+            previous = values
+        last = page[-1]
+        after = (last[3], last[2], last[0])
+        if doomed:
+            deleted += manager.filter(history_id__in=doomed).delete()[0]
+
+##################################################################################
+#                                Archiving                                       #
+##################################################################################
+
+def archive_root():
+    return Path(getattr(settings, "HISTORY_ARCHIVE_DIR", settings.BASE_DIR / "history_archive"))
+
+
+def archive_dir(model):
+    """Directory holding the monthly `YYYY-MM.jsonl.gz` files of one model."""
+    return archive_root() / model._meta.label_lower
+
+
+def count_rows(path):
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        return sum(1 for line in handle if line.strip())
+
+
+def read_counts(directory):
+    """{file name: rows} of the archive manifest ({} before the first one)."""
+    try:
+        return json.loads((directory / ARCHIVE_MANIFEST).read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def write_counts(directory, counts):
+    temporary = directory / f".{ARCHIVE_MANIFEST}.tmp"
+    temporary.write_text(json.dumps(counts, sort_keys=True))
+    os.replace(temporary, directory / ARCHIVE_MANIFEST)
+
+
+def serialize_history_row(record):
+    """
+    Plain dict of a historical row, encoded the same way the API renders it,
+    so archived and live rows are indistinguishable to clients.
+    """
+    return json.loads(json.dumps(HistoricalRecordSerializer(record).data, cls=JSONEncoder))
+
+
+def archive_history(model, before, batch_size=1000):
+    """
+    Move historical rows older than `before` into monthly gzip JSONL files.
+    Each batch is written and flushed before it is deleted from the table.
+    Returns the number of archived rows.
+    """
+    manager = history_manager(model)
+    directory = archive_dir(model)
+    directory.mkdir(parents=True, exist_ok=True)
+    # Only this function writes the manifest; files from before it are counted once here.
+    counts = read_counts(directory)
+    for path in directory.glob("*.jsonl.gz"):
+        if path.name not in counts:
+            counts[path.name] = count_rows(path)
+    write_counts(directory, counts)
+    archived = 0
+    while True:
+        batch = list(manager.filter(history_date__lt=before).order_by("history_date", "history_id")[:batch_size])
+        if not batch:
+            return archived
+        by_month = {}
+        for record in batch:
+            by_month.setdefault(record.history_date.strftime("%Y-%m"), []).append(serialize_history_row(record))
+        for month, rows in by_month.items():
+            # gzip members can be appended; readers see one continuous stream.
+            with gzip.open(directory / f"{month}.jsonl.gz", "at", encoding="utf-8") as handle:
+                handle.writelines(json.dumps(row) + "\n" for row in rows)
+            counts[f"{month}.jsonl.gz"] = counts.get(f"{month}.jsonl.gz", 0) + len(rows)
+        write_counts(directory, counts)
+        manager.filter(history_id__in=[record.history_id for record in batch]).delete()
+        archived += len(batch)
+
+
+def _load_month(path):
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        rows = [json.loads(line) for line in handle if line.strip()]
+    return [((parse_datetime(row["history_date"]), row["history_id"]), row) for row in rows]
+
+
+def read_archive(model, direction="next", position=None, limit=None):
+    """
+    Archived rows of `model` past `position` (a (history_date, history_id) pair),
+    newest first for "next" and oldest first for "previous".
+    Only month files that can contain matching rows are opened.
+    """
+    directory = archive_dir(model)
+    if not directory.exists():
+        return []
+    newest_first = direction == "next"
+    months = sorted(directory.glob("*.jsonl.gz"), reverse=newest_first)
+    if position is not None:
+        bound = position[0].strftime("%Y-%m")
+        months = [m for m in months if (m.name[:7] <= bound if newest_first else m.name[:7] >= bound)]
+
+    found = []
+    for path in months:
+        rows = _load_month(path)
+        if position is not None:
+            rows = [r for r in rows if (r[0] < position if newest_first else r[0] > position)]
+        rows.sort(key=lambda r: r[0], reverse=newest_first)
+        found.extend(row for _, row in rows)
+        if limit is not None and len(found) >= limit:
+            return found[:limit]
+    return found
+
+
+def count_archive(model):
+    """Archived rows of `model`, from the manifest (files it misses are decompressed)."""
+    directory = archive_dir(model)
+    if not directory.exists():
+        return 0
+    counts = read_counts(directory)
+    return sum(
+        counts[path.name] if path.name in counts else count_rows(path)
+        for path in directory.glob("*.jsonl.gz")
+    )
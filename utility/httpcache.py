@@ -0,0 +1,413 @@
+# HTTP caching for public GET endpoints. A response is rendered once,
+# compressed once (gzip and brotli) and stored under a digest of the data
+# versions of the models it is built from, the URL and the Accept header.
+# That digest is also the ETag, so conditional requests are answered 304
+# from the versions alone, before the view (and any serializer) runs.
+#
+# Versions are bumped from post_save / post_delete receivers (menu.signals,
+# info.signals) and by writes that bypass signals (menu.sales). Per-user
+# lists (UserScope) keep one version per user and scope instead, and the
+# private per-caller caches (cache_per_user) are keyed by the versions of
+# the models their handler reads (orders, reservation, feedback and
+# ingredient_requests signals).
+#
+# Versions are bumped on commit, before a replica may have the write: a
+# value built from a version younger than REPLICA_PIN_SECONDS is computed
+# from the primary (fresh_read_scope), so it is not stored stale under the
+# new version.
+#
+# Every stored value goes through get_or_compute(): one worker recomputes
+# an expiring entry (a cache.add lock: SET NX on Redis, the backend's own
+# lock on locmem) while the others keep serving the stale copy, and
+# entries are refreshed a little early at random so they do not all
+# expire at once.
+
+# -------------------  Django imports   ------------------------
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+# -------------------  DRF imports   ------------------------
+from rest_framework.response import Response
+# -------------------   Apps imports ------------------------
+from metrics.middleware import MetricsMiddleware
+from metrics.registry import count_cache
+from .routers import pin_scope
+# -------------------  Other imports   ------------------------
+from bisect import bisect_right
+from contextlib import nullcontext
+from functools import wraps
+import brotli
+import gzip
+import hashlib
+import math
+import random
+import time
+import uuid
+
+DATA_VERSION_KEY = "httpcache:version:{label}"
+TIMELINE_KEY = "httpcache:timeline:{function}:{state}"
+LAST_MODIFIED_KEY = "httpcache:modified:{state}"
+RESPONSE_KEY = "httpcache:response:{digest}"
+USER_VERSION_KEY = "httpcache:user:{scope}:{user}"
+USER_RESPONSE_KEY = "httpcache:user:{scope}:{user}:{digest}"
+GET_RESPONSE_KEY = "httpcache:get:{digest}"
+LOCK_KEY = "lock:{key}"  # outside the two-tier cache's local prefixes
+DERIVED_TTL = 60 * 60 * 24  # keys that embed a data version never go stale
+
+# Preferred first. Bodies shorter than HTTP_CACHE_MIN_COMPRESS are stored as is.
+COMPRESSORS = {
+    "br": lambda body: brotli.compress(body, quality=9),
+    "gzip": lambda body: gzip.compress(body, compresslevel=9, mtime=0),
+}
+# Headers of the view's response kept with the stored copy; middleware adds the rest.
+STORED_HEADERS = ("Allow", "Content-Language", "Vary")
+
+##################################################################################
+#                             Stampede protection                                #
+##################################################################################
+
+def is_fresh(entry, now):
+    """
+    Probabilistic early expiration ("XFetch"): the closer to expiry and the
+    slower the value was to compute, the likelier a reader refreshes it.
+    """
+    beta = getattr(settings, "CACHE_EARLY_REFRESH", 1.0)
+    return now - entry["cost"] * beta * math.log(1.0 - random.random()) < entry["expires"]
+
+
+def get_or_compute(key, compute, ttl, namespace):
+    """
+    The value cached under `key`, computed by `compute()` on a miss (a None
+    result is returned but not stored). Expired entries stay readable for
+    CACHE_STALE_TTL more seconds: the worker holding the lock recomputes,
+    the others get the stale value. Without any copy, the others wait for
+    the lock holder for up to CACHE_LOCK_WAIT seconds.
+    """
+    now = time.time()
+    entry = cache.get(key)
+    if entry is not None and is_fresh(entry, now):
+        count_cache(namespace, hit=True)
+        return entry["value"]
+
+    lock_key, token = LOCK_KEY.format(key=key), uuid.uuid4().hex
+    if not cache.add(lock_key, token, getattr(settings, "CACHE_LOCK_TIMEOUT", 30)):
+        if entry is not None:
+            count_cache(namespace, hit=True, stale=True)
+            return entry["value"]
+        deadline = now + getattr(settings, "CACHE_LOCK_WAIT", 5)
+        while time.time() < deadline:
+            time.sleep(0.05)
+            entry = cache.get(key)
+            if entry is not None:
+                count_cache(namespace, hit=True)
+                return entry["value"]
+        lock_key = None  # the holder is stuck; compute without the lock
+
+    count_cache(namespace, hit=False)
+    try:
+        start = time.time()
+        value = compute()
+        if value is not None:
+            store_value(key, value, ttl, cost=time.time() - start)
+        return value
+    finally:
+        if lock_key is not None and cache.get(lock_key) == token:
+            cache.delete(lock_key)
+
+
+def store_value(key, value, ttl, cost=0.0):
+    """Store `value` as get_or_compute() does, e.g. from a task refreshing it ahead of readers."""
+    entry = {"value": value, "expires": time.time() + ttl, "cost": cost}
+    cache.set(key, entry, ttl + getattr(settings, "CACHE_STALE_TTL", 60))
+
+##################################################################################
+#                                Data versions                                   #
+##################################################################################
+
+def new_version():
+    """A random version ending in the time it was made, in ms since the epoch."""
+    return f"{uuid.uuid4().hex}.{time.time_ns() // 1_000_000}"
+
+
+def fresh_read_scope(versions):
+    """
+    Context for computing a value cached under `versions`: reads go to the
+    primary while one of them is younger than REPLICA_PIN_SECONDS.
+    """
+    since = (time.time() - getattr(settings, "REPLICA_PIN_SECONDS", 5)) * 1000
+    for version in versions:
+        _, dot, made = version.rpartition(".")
+        if dot and made.isdigit() and int(made) > since:
+            return pin_scope(True)
+    return nullcontext()
+
+
+def version_key(model):
+    return DATA_VERSION_KEY.format(label=model._meta.label_lower)
+
+
+def data_versions(models):
+    keys = [version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, new_version(), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_data_version(model):
+    """Called when rows of `model` change; responses built from it get a new ETag."""
+    cache.set(version_key(model), new_version(), None)
+
+
+def last_modified(models, state):
+    """Latest updated_at over `models`, tombstones included, as a timestamp (or None)."""
+    key = LAST_MODIFIED_KEY.format(state=state)
+    stamp = cache.get(key)
+    if stamp is None:
+        latest = [model._base_manager.aggregate(latest=Max("updated_at"))["latest"] for model in models]
+        stamp = max((int(moment.timestamp()) for moment in latest if moment is not None), default=0)
+        cache.set(key, stamp, DERIVED_TTL)
+    return stamp or None
+
+
+def timeline(changes_at, state):
+    """Sorted timestamps of `changes_at()`, computed once per data version."""
+    key = TIMELINE_KEY.format(function=f"{changes_at.__module__}.{changes_at.__qualname__}", state=state)
+    stamps = cache.get(key)
+    if stamps is None:
+        stamps = sorted(moment.timestamp() for moment in changes_at())
+        cache.set(key, stamps, DERIVED_TTL)
+    return stamps
+
+def data_state(models, changes_at=None):
+    """
+    (state, token, moment): a digest of the data versions of `models`; the
+    same plus how many `changes_at` moments have passed; the last of those.
+    """
+    state = hashlib.sha1("\n".join(data_versions(models)).encode()).hexdigest()
+    if changes_at is None:
+        return state, state, None
+    stamps = timeline(changes_at, state)
+    passed = bisect_right(stamps, time.time())
+    return state, f"{state}.{passed}", stamps[passed - 1] if passed else None
+
+##################################################################################
+#                                 User scopes                                    #
+##################################################################################
+
+class UserScope:
+    """
+    Data cached per user (UserCachedListMixin): each user has their own
+    version of the scope, bumped when their rows change, combined with the
+    data versions of shared `models` the responses embed.
+    """
+
+    def __init__(self, name, *models, changes_at=None):
+        self.name = name
+        self.models = models
+        self.changes_at = changes_at
+
+    def version(self, user_id):
+        key = USER_VERSION_KEY.format(scope=self.name, user=user_id)
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, new_version(), None)
+            version = cache.get(key)
+        return version
+
+    def token(self, user_id):
+        version = self.version(user_id)
+        if not self.models:
+            return version
+        return f"{version}.{data_state(self.models, self.changes_at)[1]}"
+
+    def versions(self, user_id):
+        """The user's version of the scope and the data versions of `models`."""
+        return [self.version(user_id), *data_versions(self.models)]
+
+
+def bump_user_version(scope, user_id):
+    """Called when rows of `user_id` in `scope` change; their cached responses are left behind."""
+    if user_id is not None:
+        cache.set(USER_VERSION_KEY.format(scope=scope, user=user_id), new_version(), None)
+
+##################################################################################
+#                              Stored responses                                  #
+##################################################################################
+
+def negotiates_html(request):
+    """The browsable API is rendered per user and is never stored."""
+    requested = request.GET.get("format")
+    if requested:
+        return requested == "api"
+    return "text/html" in request.headers.get("Accept", "")
+
+
+def accepted_encodings(request):
+    accepted = set()
+    for part in request.headers.get("Accept-Encoding", "").split(","):
+        coding, _, parameters = part.partition(";")
+        parameters = parameters.replace(" ", "")
+        if parameters.startswith("q="):
+            try:
+                if float(parameters[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def add_validators(response, etag, modified, weak=False):
+    response["ETag"] = f"W/{etag}" if weak else etag
+    if modified:
+        response["Last-Modified"] = http_date(modified)
+    response["Cache-Control"] = f"public, max-age={getattr(settings, 'HTTP_CACHE_MAX_AGE', 0)}, must-revalidate"
+    patch_vary_headers(response, ("Accept", "Accept-Encoding"))
+    return response
+
+
+def store_entry(response, etag, modified):
+    """The storable parts of `response`, or None when it must not be shared."""
+    if hasattr(response, "render") and callable(response.render):
+        response = response.render()
+    if (
+        response.status_code != 200 or response.streaming or response.cookies
+        or response.get("Content-Type", "").startswith("text/html")
+        or "private" in response.get("Cache-Control", "")
+    ):
+        return None
+    body = response.content
+    bodies = {"identity": body}
+    if len(body) >= getattr(settings, "HTTP_CACHE_MIN_COMPRESS", 256):
+        for coding, compress in COMPRESSORS.items():
+            compressed = compress(body)
+            if len(compressed) < len(body):
+                bodies[coding] = compressed
+    return {
+        "content_type": response["Content-Type"],
+        "headers": [(header, response[header]) for header in STORED_HEADERS if response.has_header(header)],
+        "bodies": bodies,
+        "etag": etag,
+        "modified": modified,
+    }
+
+
+def entry_response(request, entry):
+    """The stored response in the best encoding the client accepts."""
+    accepted = accepted_encodings(request)
+    coding = next(
+        (coding for coding in COMPRESSORS if coding in entry["bodies"] and (coding in accepted or "*" in accepted)),
+        "identity",
+    )
+    response = HttpResponse(entry["bodies"][coding], content_type=entry["content_type"])
+    for header, value in entry["headers"]:
+        response[header] = value
+    if coding != "identity":
+        response["Content-Encoding"] = coding
+    # Compressed bodies are byte-different representations of the same data.
+    return add_validators(response, entry["etag"], entry["modified"], weak=coding != "identity")
+
+##################################################################################
+#                                 Decorator                                      #
+##################################################################################
+
+def cache_response(*models, ttl=None, changes_at=None, clock=False):
+    """
+    Cache GET/HEAD responses of a view built from `models`, like cache_page
+    (apply with method_decorator on dispatch) but invalidated by data
+    versions and answering conditional requests.
+
+    changes_at: callable returning the datetimes at which responses change
+        without a write (e.g. discount windows opening and closing).
+    clock: the response depends on the current time in general (rolling
+        windows); the ETag also changes every `ttl` seconds.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD") or negotiates_html(request):
+                return view(request, *args, **kwargs)
+            timeout = getattr(settings, "CACHE_TTL", 60 * 5) if ttl is None else ttl
+            state, token, moment = data_state(models, changes_at)
+            parts = [token]
+            if clock:
+                parts.append(str(int(time.time() // timeout)))
+            digest = hashlib.sha1(
+                "\n".join([*parts, request.get_full_path(), request.headers.get("Accept", "")]).encode()
+            ).hexdigest()
+            etag = f'"{digest[:32]}"'
+            namespace = MetricsMiddleware.namespace(request)
+
+            def modified():
+                if clock:
+                    return None
+                return max(filter(None, [last_modified(models, state), moment]), default=None)
+
+            if "If-None-Match" in request.headers or "If-Modified-Since" in request.headers:
+                response = get_conditional_response(
+                    request, etag=etag, last_modified=None if "If-None-Match" in request.headers else modified()
+                )
+                if response is not None:
+                    count_cache(namespace, hit=True)
+                    return add_validators(response, etag, None)
+
+            uncached = []
+
+            def compute():
+                with fresh_read_scope(data_versions(models)):
+                    response = view(request, *args, **kwargs)
+                entry = store_entry(response, etag, modified())
+                if entry is None:
+                    uncached.append(response)
+                return entry
+
+            entry = get_or_compute(RESPONSE_KEY.format(digest=digest), compute, timeout, namespace)
+            return uncached[0] if entry is None else entry_response(request, entry)
+        return wrapper
+    return decorator
+
+
+def cache_per_user(*models, ttl=None, changes_at=None):
+    """
+    Cache the data of a DRF handler's 200 responses (apply with
+    method_decorator on `get`, so authentication, permissions and throttles
+    have run) per user, URL and Accept header, for views whose results
+    depend on the caller's role. Keyed by the data versions of `models`
+    (and `changes_at`, as in cache_response), so a write is seen by the
+    next request; expires after `ttl` (CACHE_TTL).
+    """
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(request, *args, **kwargs):
+            timeout = getattr(settings, "CACHE_TTL", 60 * 5) if ttl is None else ttl
+            token = data_state(models, changes_at)[1] if models else ""
+            digest = hashlib.sha1(
+                f"{token}\n{request.user.pk}\n{request.build_absolute_uri()}\n{request.headers.get('Accept', '')}".encode()
+            ).hexdigest()
+            uncached = []
+
+            def compute():
+                with fresh_read_scope(data_versions(models)):
+                    response = handler(request, *args, **kwargs)
+                if response.status_code != 200 or not hasattr(response, "data"):
+                    uncached.append(response)
+                    return None
+                return response.data
+
+            data = get_or_compute(
+                GET_RESPONSE_KEY.format(digest=digest), compute, timeout, MetricsMiddleware.namespace(request)
+            )
+            if data is None:
+                return uncached[0]
+            response = Response(data)
+            response["Cache-Control"] = "private"
+            patch_vary_headers(response, ("Authorization",))
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,141 @@
+# -------------------  Django imports   ------------------------
+from django.core.management.base import BaseCommand
+# -------------------   Apps imports ------------------------
+from utility.sqlite import get_pragmas, apply_pragmas
+# -------------------  Other imports   ------------------------
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+##################################################################################
+#                              Worker processes                                  #
+##################################################################################
+
+def _connect(path, pragmas):
+    conn = sqlite3.connect(path, isolation_level=None)
+    apply_pragmas(conn.cursor(), pragmas)
+    return conn
+
+
+def _writer(path, pragmas, items, deadline, results):
+    """
+    Mimics order placement: read the stock, decrement it, insert an order line.
+    Without the profile the deferred BEGIN upgrades to a write lock mid-way,
+    which is where "database is locked" comes from under contention.
+    """
+    conn = _connect(path, pragmas)
+    begin = "BEGIN IMMEDIATE" if pragmas else "BEGIN"
+    ops = errors = 0
+    while time.monotonic() < deadline:
+        item_id = random.randint(1, items)
+        try:
+            conn.execute(begin)
+            conn.execute("SELECT stock FROM item WHERE id = ?", (item_id,)).fetchone()
+            conn.execute("UPDATE item SET stock = stock - 1, sold = sold + 1 WHERE id = ?", (item_id,))
+            conn.execute("INSERT INTO order_line (item_id, quantity, created_at) VALUES (?, 1, ?)", (item_id, time.time()))
+            conn.execute("COMMIT")
+            ops += 1
+        except sqlite3.OperationalError:
+            errors += 1
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+    conn.close()
+    results.put(("write", ops, errors))
+
+
+def _reader(path, pragmas, items, deadline, results):
+    """Mimics menu browsing plus a small per-item report."""
+    conn = _connect(path, pragmas)
+    ops = errors = 0
+    while time.monotonic() < deadline:
+        try:
+            conn.execute(
+                "SELECT id, name, price, stock FROM item WHERE category = ? ORDER BY id LIMIT 50",
+                (random.randint(1, 20),),
+            ).fetchall()
+            conn.execute(
+                "SELECT COUNT(*), SUM(quantity) FROM order_line WHERE item_id = ?",
+                (random.randint(1, items),),
+            ).fetchone()
+            ops += 1
+        except sqlite3.OperationalError:
+            errors += 1
+    conn.close()
+    results.put(("read", ops, errors))
+
+##################################################################################
+#                              bench_sqlite command                              #
+##################################################################################
+
+class Command(BaseCommand):
+    help = "Multi-process SQLite write/read benchmark with and without settings.SQLITE_PRAGMAS."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--writers", type=int, default=4)
+        parser.add_argument("--readers", type=int, default=4)
+        parser.add_argument("--seconds", type=float, default=5.0)
+        parser.add_argument("--items", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'profile':<10}{'writes/s':>12}{'reads/s':>12}{'write errors':>14}{'read errors':>13}"
+        )
+        for tuned in (False, True):
+            row = self.run_round(tuned, **options)
+            self.stdout.write(
+                f"{'tuned' if tuned else 'default':<10}"
+                f"{row['write'] / options['seconds']:>12.0f}{row['read'] / options['seconds']:>12.0f}"
+                f"{row['write_errors']:>14}{row['read_errors']:>13}"
+            )
+
+    def run_round(self, tuned, writers, readers, seconds, items, **kwargs):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.sqlite3")
+            self.create_schema(path, items)
+            pragmas = get_pragmas() if tuned else {}  # settings.SQLITE_PRAGMAS
+
+            results = multiprocessing.Queue()
+            deadline = time.monotonic() + seconds
+            procs = [
+                multiprocessing.Process(target=_writer, args=(path, pragmas, items, deadline, results))
+                for _ in range(writers)
+            ] + [
+                multiprocessing.Process(target=_reader, args=(path, pragmas, items, deadline, results))
+                for _ in range(readers)
+            ]
+            for proc in procs:
+                proc.start()
+
+            row = {"write": 0, "read": 0, "write_errors": 0, "read_errors": 0}
+            for _ in procs:
+                kind, ops, errors = results.get()
+                row[kind] += ops
+                row[f"{kind}_errors"] += errors
+            for proc in procs:
+                proc.join()
+        return row
+
+    def create_schema(self, path, items):
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            """
+            CREATE TABLE item (
+                id INTEGER PRIMARY KEY, category INTEGER, name TEXT,
+                price REAL, stock INTEGER, sold INTEGER
+            );
+            CREATE INDEX item_category ON item (category);
+            CREATE TABLE order_line (
+                id INTEGER PRIMARY KEY, item_id INTEGER, quantity INTEGER, created_at REAL
+            );
+            CREATE INDEX order_line_item ON order_line (item_id);
+            """
+        )
+        conn.executemany(
+            "INSERT INTO item VALUES (?, ?, ?, ?, ?, 0)",
+            ((i, i % 20 + 1, f"item {i}", 10 + i % 50, 10 ** 6) for i in range(1, items + 1)),
+        )
+        conn.commit()
+        conn.close()
@@ -0,0 +1,48 @@
+# -------------------  Django imports   ------------------------
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+# -------------------   Apps imports ------------------------
+from utility.history import history_models, compact_history, archive_history
+# -------------------  Other imports   ------------------------
+from datetime import timedelta
+
+##################################################################################
+#                           history_retention command                            #
+##################################################################################
+
+class Command(BaseCommand):
+    help = (
+        "Compact counter-only history rows and move history older than N days "
+        "into monthly gzip JSONL archives."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=getattr(settings, "HISTORY_RETENTION_DAYS", 90),
+            help="Archive historical rows older than this many days.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--model", action="append", help="Limit to app_label.Model (repeatable).")
+        parser.add_argument("--skip-compact", action="store_true")
+        parser.add_argument("--skip-archive", action="store_true")
+
+    def handle(self, *args, **options):
+        models = history_models()
+        if options["model"]:
+            try:
+                wanted = {apps.get_model(label) for label in options["model"]}
+            except (LookupError, ValueError) as exc:
+                raise CommandError(exc)
+            models = [model for model in models if model in wanted]
+
+        before = timezone.now() - timedelta(days=options["days"])
+        for model in models:
+            label = model._meta.label
+            if not options["skip_compact"]:
+                deleted = compact_history(model, batch_size=options["batch_size"])
+                self.stdout.write(f"{label}: compacted {deleted} rows")
+            if not options["skip_archive"]:
+                archived = archive_history(model, before, batch_size=options["batch_size"])
+                self.stdout.write(f"{label}: archived {archived} rows older than {before:%Y-%m-%d}")
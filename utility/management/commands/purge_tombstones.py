@@ -0,0 +1,54 @@
+# -------------------  Django imports   ------------------------
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+# -------------------   Apps imports ------------------------
+from utility.tombstones import PURGEABLE, purge_tombstones
+# -------------------  Other imports   ------------------------
+from datetime import timedelta
+
+##################################################################################
+#                           purge_tombstones command                             #
+##################################################################################
+
+class Command(BaseCommand):
+    help = (
+        "Move rows soft-deleted more than N days ago, with their cascade and "
+        "history, into monthly gzip JSONL archives. Restore views bring them back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=getattr(settings, "TOMBSTONE_RETENTION_DAYS", 30),
+            help="Purge rows deleted more than this many days ago.",
+        )
+        parser.add_argument("--batch-size", type=int, default=getattr(settings, "TOMBSTONE_BATCH_SIZE", 500))
+        parser.add_argument(
+            "--pause", type=float, default=getattr(settings, "TOMBSTONE_BATCH_PAUSE", 0.5),
+            help="Seconds to sleep between batches.",
+        )
+        parser.add_argument("--model", action="append", help="Limit to app_label.Model (repeatable).")
+        parser.add_argument("--dry-run", action="store_true", help="Only count what would be purged.")
+
+    def handle(self, *args, **options):
+        labels = options["model"] or list(PURGEABLE)
+        try:
+            models = [apps.get_model(label) for label in labels]
+        except (LookupError, ValueError) as exc:
+            raise CommandError(exc)
+        unknown = [model._meta.label for model in models if model._meta.label not in PURGEABLE]
+        if unknown:
+            raise CommandError(f"Not purgeable: {', '.join(unknown)}")
+
+        before = timezone.now() - timedelta(days=options["days"])
+        for model in models:
+            purged, blocked = purge_tombstones(
+                model, before,
+                batch_size=options["batch_size"], pause=options["pause"], dry_run=options["dry_run"],
+            )
+            verb = "would purge" if options["dry_run"] else "purged"
+            self.stdout.write(
+                f"{model._meta.label}: {verb} {purged} rows deleted before {before:%Y-%m-%d}, "
+                f"{blocked} kept (still referenced by live rows)"
+            )
@@ -0,0 +1,20 @@
+from django.db import models
+from django.utils import timezone
+
+class SoftDeleteQuerySet(models.QuerySet):
+    def alive(self):
+        return self.filter(is_deleted=False)
+
+    def dead(self):
+        return self.filter(is_deleted=True)
+
+    def soft_delete(self):
+        """Tombstone every row in one UPDATE (no signals, like QuerySet.update)."""
+        return self.update(is_deleted=True, deleted_at=timezone.now())
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """Live rows only. Use `Model.all_objects` to reach soft-deleted rows."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
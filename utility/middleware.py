@@ -0,0 +1,87 @@
+# -------------------  Django imports   ------------------------
+from django.conf import settings
+from django.utils.crypto import constant_time_compare
+# -------------------  DRF imports   ------------------------
+from rest_framework.permissions import SAFE_METHODS
+# -------------------   Apps imports ------------------------
+from .profiling import RequestProfile, profile_store
+from .routers import _primary_pinned, is_pinned_to_primary, reset_pin
+# -------------------  Other imports   ------------------------
+import random
+
+##################################################################################
+#                          ReplicaPinningMiddleware                              #
+##################################################################################
+
+class ReplicaPinningMiddleware:
+    """
+    Gives clients read-your-writes consistency on top of PrimaryReplicaRouter.
+
+    - Requests carrying the pin cookie (or the pin header) read from the primary.
+    - Unsafe requests, and safe ones that saved or deleted a model instance,
+      set the pin cookie for REPLICA_PIN_SECONDS, so the client's next reads
+      skip replica lag. Unsafe requests read from the primary throughout.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.cookie_name = getattr(settings, "REPLICA_PIN_COOKIE", "bcafe_primary_pin")
+        self.header_name = getattr(settings, "REPLICA_PIN_HEADER", "HTTP_X_READ_PRIMARY")
+        self.pin_seconds = getattr(settings, "REPLICA_PIN_SECONDS", 5)
+
+    def __call__(self, request):
+        forced = self.cookie_name in request.COOKIES or bool(request.META.get(self.header_name))
+        unsafe = request.method not in SAFE_METHODS
+        token = _primary_pinned.set(forced or unsafe)
+        try:
+            response = self.get_response(request)
+            wrote = unsafe or (is_pinned_to_primary() and not forced)
+            if wrote and response.status_code < 400:
+                response.set_cookie(
+                    self.cookie_name, "1",
+                    max_age=self.pin_seconds, httponly=True, samesite="Lax",
+                )
+        finally:
+            reset_pin(token)
+        return response
+
+##################################################################################
+#                             ProfilingMiddleware                                #
+##################################################################################
+
+class ProfilingMiddleware:
+    """
+    Profiles a request when it carries "X-Profile: <PROFILING_TOKEN>", or at
+    random for PROFILING_SAMPLE_RATE of requests. Both are off by default.
+
+    The profile (sampled stacks, SQL timings, serializer time) goes to the
+    on-disk ring buffer and its id is returned in the X-Profile-Id header.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.token = getattr(settings, "PROFILING_TOKEN", "")
+        self.header_name = getattr(settings, "PROFILING_HEADER", "HTTP_X_PROFILE")
+        self.sample_rate = getattr(settings, "PROFILING_SAMPLE_RATE", 0.0)
+        self.interval = getattr(settings, "PROFILING_INTERVAL", 0.001)
+        self.store = profile_store()
+
+    def reason(self, request):
+        header = request.META.get(self.header_name)
+        if self.token and header and constant_time_compare(header, self.token):
+            return "header"
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    def __call__(self, request):
+        reason = self.reason(request)
+        if reason is None:
+            return self.get_response(request)
+
+        with RequestProfile(self.interval) as profile:
+            response = self.get_response(request)
+        summary = profile.summary(request, response, reason)
+        name = f"{request.method} {request.path} ({summary['view']})"
+        response["X-Profile-Id"] = self.store.save(summary, profile.sampler.speedscope(name))
+        return response
@@ -1,4 +1,14 @@
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+from metrics.middleware import MetricsMiddleware
+from metrics.registry import count_cache
+from .httpcache import USER_RESPONSE_KEY, fresh_read_scope, get_or_compute
+from .readers import get_reader
+import hashlib
 
 class SoftDeleteMixin:
     def perform_destroy(self, instance):
@@ -8,8 +18,85 @@ class SoftDeleteMixin:
         return instance
 
 class RestoreMixin:
+    def get_restore_object(self, model, pk):
+        """The soft-deleted row, brought back from the tombstone archive if purged."""
+        from .tombstones import get_restorable
+        return get_restorable(model, pk)
+
     def perform_restore(self, instance):
         instance.is_deleted = False
         instance.deleted_at = None
         instance.save()
         return instance
+
+class AtomicWriteMixin:
+    """
+    Runs unsafe requests (POST, PUT, PATCH, DELETE) in one transaction.
+    On SQLite with transaction_mode=IMMEDIATE the write lock is taken up front,
+    so concurrent writers queue on busy_timeout instead of deadlocking.
+    DRF's exception handler marks the transaction for rollback on errors.
+    """
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+        with transaction.atomic():
+            return super().dispatch(request, *args, **kwargs)
+
+class CompiledListMixin:
+    """
+    list() through the compiled reader of the view's serializer (see
+    utility.readers): database rows turned into the dicts the serializer
+    would produce. Filtering, ordering and pagination are
+    unchanged. COMPILED_READERS = False falls back to the serializer everywhere.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if not getattr(settings, "COMPILED_READERS", True):
+            return super().list(request, *args, **kwargs)
+        items = get_reader(self.get_serializer_class()).items(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(items)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(list(items))
+
+class UserCachedListMixin:
+    """
+    list() data cached per authenticated user under `user_cache` (a
+    utility.httpcache.UserScope). Keys hold the user id and the user's
+    version of the scope, bumped by signals when their rows change, so no
+    entry is ever shared between users and writes show at once. The weak
+    ETag answers If-None-Match with 304 before the queryset is evaluated.
+    """
+    user_cache = None
+
+    def list(self, request, *args, **kwargs):
+        user_id = request.user.pk
+        if user_id is None:
+            return super().list(request, *args, **kwargs)
+        token = self.user_cache.token(user_id)
+        digest = hashlib.sha1(f"{token}\n{request.build_absolute_uri()}".encode()).hexdigest()
+        etag = f'W/"{digest[:32]}"'
+        namespace = MetricsMiddleware.namespace(request)
+
+        if "If-None-Match" in request.headers:
+            response = get_conditional_response(request, etag=etag)
+            if response is not None:
+                count_cache(namespace, hit=True)
+                return self.add_user_cache_headers(response, etag)
+
+        def compute():
+            with fresh_read_scope(self.user_cache.versions(user_id)):
+                return super(UserCachedListMixin, self).list(request, *args, **kwargs).data
+
+        data = get_or_compute(
+            USER_RESPONSE_KEY.format(scope=self.user_cache.name, user=user_id, digest=digest),
+            compute, getattr(settings, "CACHE_TTL", 60 * 5), namespace,
+        )
+        return self.add_user_cache_headers(Response(data), etag)
+
+    @staticmethod
+    def add_user_cache_headers(response, etag):
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, max-age=0, must-revalidate"
+        patch_vary_headers(response, ("Authorization",))
+        return response
@@ -1,4 +1,5 @@
 from django.db import models
+from .managers import SoftDeleteManager, SoftDeleteQuerySet
 
 class BaseModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
@@ -6,5 +7,15 @@ class BaseModel(models.Model):
     is_deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
+    # `objects` (live rows) is the default manager, so reverse relations
+    # (`order.items`) and generic views skip tombstones. The base manager,
+    # used for related-object access and cascades, and `all_objects` see
+    # every row. Uniqueness checks in the serializers read through
+    # `all_objects` (see utility.serializers.BaseSerializer).
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
     class Meta:
-        abstract = True
\ No newline at end of file
+        abstract = True
+        default_manager_name = "objects"
+        base_manager_name = "all_objects"
@@ -0,0 +1,182 @@
+# -------------------  DRF imports   ------------------------
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+# -------------------  Django imports   ------------------------
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+# -------------------  Other imports   ------------------------
+import base64
+import json
+# -------------------   Apps imports ------------------------
+from .history import read_archive, count_archive
+
+##################################################################################
+#                              KeysetPagination                                  #
+##################################################################################
+
+class KeysetPagination(BasePagination):
+    """
+    Newest-first keyset (seek) pagination on a (timestamp, id) pair.
+
+    Instead of COUNT(*) + OFFSET, each page filters on the last row seen:
+        WHERE (created_at, id) < (:created_at, :id) ORDER BY created_at DESC, id DESC
+    so page 10 000 costs the same as page 1 when an index on the pair exists.
+
+    Cursors are opaque base64 tokens. The response has no `count` unless the
+    client asks for it with `?count=true`.
+    """
+    ordering = ("created_at", "id")
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.count = None
+        if request.query_params.get(self.count_query_param, "").lower() in ("1", "true"):
+            self.count = queryset.count()
+
+        cursor = self.decode_cursor(request)
+        self.direction = cursor[0] if cursor else "next"
+        position = cursor[1] if cursor else None
+
+        results = self.fetch(queryset, self.direction, position, self.page_size + 1)
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if self.direction == "next":
+            self.has_next, self.has_previous = has_more, cursor is not None
+        else:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        payload = {"next": self.get_next_link(), "previous": self.get_previous_link()}
+        if self.count is not None:
+            payload["count"] = self.count
+        payload["results"] = data
+        return Response(payload)
+
+    def fetch(self, queryset, direction, position, limit):
+        """
+        Return up to `limit` rows past `position`: newest first for "next",
+        oldest first for "previous".
+        """
+        time_field, id_field = self.ordering
+        if direction == "next":
+            queryset = queryset.order_by(f"-{time_field}", f"-{id_field}")
+            lookup = "lt"
+        else:
+            queryset = queryset.order_by(time_field, id_field)
+            lookup = "gt"
+        if position is not None:
+            queryset = queryset.filter(self.seek_filter(position, lookup))
+        return list(queryset[:limit])
+
+    # ----------------- Cursor helpers -----------------
+
+    def seek_filter(self, position, lookup):
+        time_field, id_field = self.ordering
+        time_value, id_value = position
+        return Q(**{f"{time_field}__{lookup}": time_value}) | Q(
+            **{time_field: time_value, f"{id_field}__{lookup}": id_value}
+        )
+
+    def position_of(self, obj):
+        if isinstance(obj, dict):
+            return [obj[name] for name in self.ordering]
+        return [getattr(obj, name) for name in self.ordering]
+
+    def encode_cursor(self, direction, obj):
+        time_value, id_value = self.position_of(obj)
+        if not isinstance(time_value, str):
+            time_value = time_value.isoformat()
+        raw = json.dumps([direction, time_value, id_value])
+        token = base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+            direction, time_value, id_value = json.loads(raw)
+            if direction not in ("next", "previous"):
+                raise ValueError(direction)
+            time_value = parse_datetime(time_value)
+            if time_value is None:
+                raise ValueError("cursor timestamp")
+            return direction, (time_value, int(id_value))
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor("next", self.page[-1])
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor("previous", self.page[0])
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+
+class HistoryKeysetPagination(KeysetPagination):
+    """Keyset pagination for django-simple-history tables."""
+    ordering = ("history_date", "history_id")
+
+
+class ArchivedHistoryPagination(HistoryKeysetPagination):
+    """
+    HistoryKeysetPagination that continues into the gzip JSONL archive
+    (see utility.history) once the live history table runs out.
+    Archived rows are always older than live ones, so the archive is only
+    read past the end of the table or when paging back out of it.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.history_model = queryset.model.instance_type
+        results = super().paginate_queryset(queryset, request, view)
+        if self.count is not None:
+            self.count += count_archive(self.history_model)
+        return results
+
+    def fetch(self, queryset, direction, position, limit):
+        if direction == "next":
+            rows = super().fetch(queryset, direction, position, limit)
+            if len(rows) < limit:
+                seek = self.seek_position(rows[-1]) if rows else position
+                rows += read_archive(self.history_model, direction, seek, limit - len(rows))
+            return rows
+        rows = read_archive(self.history_model, direction, position, limit)
+        if len(rows) < limit:
+            seek = self.seek_position(rows[-1]) if rows else position
+            rows += super().fetch(queryset, direction, seek, limit - len(rows))
+        return rows
+
+    def seek_position(self, obj):
+        time_value, id_value = self.position_of(obj)
+        if isinstance(time_value, str):
+            time_value = parse_datetime(time_value)
+        return time_value, id_value
@@ -0,0 +1,35 @@
+# -------------------  DRF imports   ------------------------
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+# -------------------   Apps imports ------------------------
+from .renderers import MessagePackRenderer, ORJSONRenderer
+# -------------------  Other imports   ------------------------
+import msgpack
+import orjson
+
+##################################################################################
+#                                   Parsers                                      #
+##################################################################################
+
+class ORJSONParser(BaseParser):
+    """JSON request bodies through orjson (UTF-8, no NaN/Infinity, like JSONParser's strict mode)."""
+    media_type = "application/json"
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+class MessagePackParser(BaseParser):
+    """MessagePack request bodies ("Content-Type: application/msgpack")."""
+    media_type = "application/msgpack"
+    renderer_class = MessagePackRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except ValueError as exc:  # every msgpack unpacking error
+            raise ParseError(f"MessagePack parse error - {exc or type(exc).__name__}")
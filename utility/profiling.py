@@ -0,0 +1,229 @@
+# Opt-in request profiling. A profiled request has its Python stack sampled
+# pyinstrument-style (from a sys.setprofile hook, at most once per
+# PROFILING_INTERVAL) and every SQL statement timed through execute_wrapper.
+# Profiles are kept in a bounded ring buffer of files on disk: a small
+# summary per request plus a speedscope (https://www.speedscope.app) file.
+
+# -------------------  Django imports   ------------------------
+from django.conf import settings
+from django.db import connections
+# -------------------  DRF imports   ------------------------
+from rest_framework.serializers import BaseSerializer
+# -------------------  Other imports   ------------------------
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+import json
+import os
+import re
+import sys
+import time
+import uuid
+
+# Serializer time is the time spent under BaseSerializer.data, which both
+# Serializer.data and ListSerializer.data go through.
+SERIALIZER_CODE = BaseSerializer.data.fget.__code__
+PROFILE_ID = re.compile(r"^\d{20}-[0-9a-f]{8}$")
+SLOWEST_QUERIES = 10
+
+##################################################################################
+#                                  Recorders                                     #
+##################################################################################
+
+class StackSampler:
+    """
+    Samples the calling thread's stack from a profile hook. Each sample is
+    the stack (root first, as frame indexes) and the seconds since the
+    previous sample, so calls shorter than `interval` cost one clock read.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.frames = []
+        self.frame_index = {}
+        self.samples = []
+        self.weights = []
+        self.serializer_seconds = 0.0
+
+    def start(self):
+        self.last = time.perf_counter()
+        self.previous = sys.getprofile()
+        sys.setprofile(self.tick)
+
+    def stop(self):
+        sys.setprofile(self.previous)
+
+    def tick(self, frame, event, arg):
+        now = time.perf_counter()
+        if now - self.last < self.interval:
+            return
+        weight, self.last = now - self.last, now
+        stack, in_serializer = [], False
+        if event == "c_call":
+            stack.append(self.index(getattr(arg, "__qualname__", repr(arg)), "<built-in>", 0))
+        while frame is not None:
+            code = frame.f_code
+            in_serializer = in_serializer or code is SERIALIZER_CODE
+            stack.append(self.index(code.co_qualname, code.co_filename, code.co_firstlineno))
+            frame = frame.f_back
+        stack.reverse()
+        self.samples.append(stack)
+        self.weights.append(weight)
+        if in_serializer:
+            self.serializer_seconds += weight
+
+    def index(self, name, file, line):
+        key = (name, file, line)
+        if key not in self.frame_index:
+            self.frame_index[key] = len(self.frames)
+            self.frames.append(key)
+        return self.frame_index[key]
+
+    def speedscope(self, name):
+        """The samples as a speedscope "sampled" profile, in milliseconds."""
+        weights = [round(weight * 1000, 3) for weight in self.weights]
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "BCafe profiling",
+            "activeProfileIndex": 0,
+            "shared": {"frames": [{"name": n, "file": f, "line": line} for n, f, line in self.frames]},
+            "profiles": [{
+                "type": "sampled", "name": name, "unit": "milliseconds",
+                "startValue": 0, "endValue": round(sum(weights), 3),
+                "samples": self.samples, "weights": weights,
+            }],
+        }
+
+
+class QueryRecorder:
+    """execute_wrapper that times every statement: (alias, sql, seconds)."""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((context["connection"].alias, sql, time.perf_counter() - start))
+
+    def watch(self, stack):
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(self))
+
+    def summary(self):
+        slowest = sorted(self.queries, key=lambda query: query[2], reverse=True)[:SLOWEST_QUERIES]
+        return {
+            "count": len(self.queries),
+            "ms": round(sum(query[2] for query in self.queries) * 1000, 3),
+            "slowest": [{"alias": alias, "sql": sql, "ms": round(seconds * 1000, 3)} for alias, sql, seconds in slowest],
+        }
+
+
+class RequestProfile:
+    """Samples stacks and times SQL for the duration of a `with` block."""
+
+    def __init__(self, interval):
+        self.sampler = StackSampler(interval)
+        self.queries = QueryRecorder()
+
+    def __enter__(self):
+        self.stack = ExitStack()
+        self.queries.watch(self.stack)
+        self.started = time.perf_counter()
+        self.sampler.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.sampler.stop()
+        self.seconds = time.perf_counter() - self.started
+        self.stack.close()
+
+    def summary(self, request, response, reason):
+        match = request.resolver_match
+        view = getattr(match.func, "view_class", match.func).__name__ if match else None
+        return {
+            "method": request.method,
+            "path": request.get_full_path(),
+            "view": view,
+            "status": response.status_code,
+            "reason": reason,
+            "ms": round(self.seconds * 1000, 3),
+            "serializer_ms": round(self.sampler.serializer_seconds * 1000, 3),
+            "sql": self.queries.summary(),
+            "samples": len(self.sampler.samples),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+##################################################################################
+#                                 Ring buffer                                    #
+##################################################################################
+
+class ProfileStore:
+    """
+    The last `size` profiles as <id>.json (summary) and <id>.speedscope.json
+    files. Ids start with the time in nanoseconds, so names sort by age;
+    any worker process may write and trim.
+    """
+
+    def __init__(self, directory, size):
+        self.directory = Path(directory)
+        self.size = size
+
+    def save(self, summary, speedscope):
+        """Store a profile and drop the oldest beyond `size`. Returns its id."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        profile_id = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+        self._write(f"{profile_id}.speedscope.json", speedscope)
+        self._write(f"{profile_id}.json", {"id": profile_id, **summary})
+        self.trim()
+        return profile_id
+
+    def _write(self, name, content):
+        partial = self.directory / f".{name}.partial"
+        partial.write_text(json.dumps(content), encoding="utf-8")
+        os.replace(partial, self.directory / name)
+
+    def ids(self):
+        if not self.directory.is_dir():
+            return []
+        return sorted(path.name[:-5] for path in self.directory.glob("*.json") if PROFILE_ID.match(path.name[:-5]))
+
+    def trim(self):
+        for profile_id in self.ids()[:-self.size or None]:
+            for path in (self.summary_path(profile_id), self.speedscope_path(profile_id)):
+                try:
+                    path.unlink()
+                except FileNotFoundError:  # trimmed by another worker
+                    pass
+
+    def summaries(self):
+        found = []
+        for profile_id in self.ids():
+            try:
+                found.append(json.loads(self.summary_path(profile_id).read_text(encoding="utf-8")))
+            except FileNotFoundError:
+                pass
+        return found
+
+    def summary_path(self, profile_id):
+        return self.directory / f"{profile_id}.json"
+
+    def speedscope_path(self, profile_id):
+        return self.directory / f"{profile_id}.speedscope.json"
+
+    def find(self, profile_id):
+        """The speedscope file of `profile_id`, or None."""
+        if not PROFILE_ID.match(profile_id):
+            return None
+        path = self.speedscope_path(profile_id)
+        return path if path.is_file() else None
+
+
+def profile_store():
+    return ProfileStore(
+        getattr(settings, "PROFILING_DIR", settings.BASE_DIR / "profiles"),
+        getattr(settings, "PROFILING_MAX_PROFILES", 200),
+    )
@@ -0,0 +1,305 @@
+# Compiled read serializers. A ModelSerializer is turned, once, into the
+# lookups for a values_list() query and, per database connection, a
+# generated function from one cursor row to the dict the serializer would
+# have produced: same keys, same order, same values. Per item this skips
+# model instances, Django's generic from-db conversion loop, attribute
+# resolution and per-field dispatch. The columns' from-db converters are
+# inlined into the function, or skipped where the backend already returns
+# the value (sqlite3 parses booleans, dates and times by declared type;
+# its naive UTC datetimes are formatted without a time zone conversion).
+#
+# SerializerMethodFields need a row-level counterpart on the serializer:
+#
+#     row_methods = {"final_price": (("price", "discount_percent", ...), function)}
+#
+# where `function` takes the values of those model fields, as Django
+# returns them.
+
+# -------------------  Django imports   ------------------------
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models.query import BaseIterable
+from django.db.models.sql.constants import MULTI
+from django.utils import timezone
+# -------------------  DRF imports   ------------------------
+from rest_framework import fields, relations, serializers
+from rest_framework.settings import api_settings
+# -------------------  Other imports   ------------------------
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+from functools import lru_cache
+import decimal
+import sqlite3
+
+# SQLite backend converters whose work sqlite3 already did for the column's
+# declared type ("bool", "date", "time"), when it parses declared types.
+SQLITE_DECLTYPE_CONVERTERS = ("convert_booleanfield_value", "convert_datefield_value", "convert_timefield_value")
+
+# Field classes whose to_representation() returns database values unchanged.
+IDENTITY = {
+    fields.CharField.to_representation,
+    fields.IntegerField.to_representation,
+    fields.BooleanField.to_representation,
+    fields.ChoiceField.to_representation,
+}
+
+##################################################################################
+#                                 Converters                                     #
+##################################################################################
+
+def decimal_converter(field):
+    """DecimalField.to_representation for coerced-to-string output."""
+    quantum = Decimal(".1") ** field.decimal_places
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+    rounding = field.rounding
+
+    def convert(value):
+        return f"{value.quantize(quantum, rounding=rounding, context=context):f}"
+    return convert
+
+
+def iso_datetime(value, tz):
+    """DateTimeField.to_representation for aware values and ISO 8601 output."""
+    text = value.astimezone(tz).isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+def sqlite_iso_datetime(value, tz, utc):
+    """
+    iso_datetime() of a DateTimeField value as sqlite3 returns it to the
+    SQLite backend: a naive UTC datetime, only formatted for UTC output.
+    """
+    if value.tzinfo is None:
+        if utc:
+            return value.isoformat() + "Z"
+        value = value.replace(tzinfo=dt_timezone.utc)
+    return iso_datetime(value, tz)
+
+
+def is_utc(tz):
+    return tz is dt_timezone.utc or getattr(tz, "key", None) in ("UTC", "Etc/UTC")
+
+
+def is_iso_datetime(field):
+    """Whether `iso_datetime` (given the current time zone) matches the field's output."""
+    return (
+        type(field).to_representation is fields.DateTimeField.to_representation and settings.USE_TZ
+        and getattr(field, "format", api_settings.DATETIME_FORMAT).lower() == fields.ISO_8601
+        and not hasattr(field, "timezone")
+    )
+
+
+def is_iso_format(field, default):
+    """Whether the Date/TimeField's output is value.isoformat()."""
+    output_format = getattr(field, "format", default)
+    return output_format is not None and output_format.lower() == fields.ISO_8601
+
+
+def converter(field):
+    """A function for the field's values, or None when they pass through as is."""
+    represent = type(field).to_representation
+    if represent in IDENTITY:
+        return None
+    if represent is fields.BigIntegerField.to_representation and not getattr(
+        field, "coerce_to_string", api_settings.COERCE_BIGINT_TO_STRING
+    ):
+        return None
+    if isinstance(field, relations.PrimaryKeyRelatedField) and field.pk_field is None:
+        return None
+    if (
+        represent is fields.DecimalField.to_representation and field.decimal_places is not None
+        and getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+        and not field.localize and not field.normalize_output
+    ):
+        return decimal_converter(field)
+    return field.to_representation
+
+##################################################################################
+#                                  Compiler                                      #
+##################################################################################
+
+class ReaderIterable(BaseIterable):
+    """values_list() rows of a Reader's lookups, read into dicts straight from the cursor."""
+    reader = None
+
+    def __iter__(self):
+        queryset = self.queryset
+        compiler = queryset.query.get_compiler(queryset.db)
+        results = compiler.execute_sql(MULTI, chunked_fetch=self.chunked_fetch, chunk_size=self.chunk_size)
+        read = self.reader.function(compiler.connection)
+        tz = timezone.get_current_timezone()
+        utc = is_utc(tz)
+        for rows in results:
+            for row in rows:
+                yield read(row, tz, utc)
+
+
+class Reader:
+    """
+    A compiled serializer: the values_list() lookups it reads and, per
+    database connection, a (row, time zone, utc) -> dict function. items()
+    is a queryset of those dicts; it filters, counts and slices as usual.
+    """
+
+    def __init__(self, serializer_class, lookups):
+        self.serializer_class = serializer_class
+        self.lookups = lookups
+        self.functions = {}
+        self.iterable = type("ReaderIterable", (ReaderIterable,), {"reader": self})
+
+    def function(self, connection):
+        try:
+            return self.functions[connection.alias]
+        except KeyError:
+            read = ReaderCompiler(self.serializer_class, connection).compile()
+            self.functions[connection.alias] = read
+            return read
+
+    def items(self, queryset):
+        items = queryset.values_list(*self.lookups)
+        items._iterable_class = self.iterable
+        return items
+
+
+class ReaderCompiler:
+    def __init__(self, serializer_class, connection):
+        self.serializer_class = serializer_class
+        self.connection = connection
+        self.lookups = []
+        self.values = {}
+        self.namespace = {}
+
+    def fail(self, message):
+        raise ImproperlyConfigured(f"Cannot compile {self.serializer_class.__name__}: {message}")
+
+    def column(self, lookup):
+        if lookup not in self.lookups:
+            self.lookups.append(lookup)
+        return self.lookups.index(lookup)
+
+    def bind(self, value):
+        for name, bound in self.namespace.items():
+            if bound is value:
+                return name
+        name = f"_{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def db_converters(self, field):
+        """The column of `field` and the from-db converters Django would apply to it."""
+        col = field.get_col(field.model._meta.db_table)
+        return col, self.connection.ops.get_db_converters(col) + col.get_db_converters(self.connection)
+
+    def declared_types(self):
+        """Whether sqlite3 parses the declared column types for this connection."""
+        return self.connection.vendor == "sqlite" and bool(
+            self.connection.get_connection_params().get("detect_types", 0) & sqlite3.PARSE_DECLTYPES
+        )
+
+    def value(self, lookup, field):
+        """Source of the column's value as Django would return it."""
+        index = self.column(lookup)
+        col, converters = self.db_converters(field)
+        if self.declared_types() and converters in (
+            [getattr(self.connection.ops, name)] for name in SQLITE_DECLTYPE_CONVERTERS
+        ):
+            converters = []
+        if not converters:
+            return f"row[{index}]"
+        name = f"v{index}"
+        if name not in self.values:
+            call, col, connection = f"row[{index}]", self.bind(col), self.bind(self.connection)
+            for convert in converters:
+                call = f"{self.bind(convert)}({call}, {col}, {connection})"
+            self.values[name] = call
+        return name
+
+    def iso_datetime(self, lookup, field):
+        """Source of iso_datetime() of the column, for a non-null value."""
+        _, converters = self.db_converters(field)
+        if (
+            self.declared_types() and self.connection.timezone_name == "UTC"
+            and converters == [self.connection.ops.convert_datetimefield_value]
+        ):
+            return f"{self.bind(sqlite_iso_datetime)}(row[{self.column(lookup)}], tz, utc)"
+        return f"{self.bind(iso_datetime)}({self.value(lookup, field)}, tz)"
+
+    def model_field(self, model, source):
+        if "." in source or source == "*":
+            self.fail(f"source '{source}' is not a model field")
+        try:
+            field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            self.fail(f"'{source}' is not a field of {model.__name__}")
+        if not field.concrete:
+            self.fail(f"'{source}' is not a column of {model.__name__}")
+        return field
+
+    def expression(self, serializer, prefix=""):
+        """Source of the dict literal for `serializer`, reading columns under `prefix`."""
+        model = serializer.Meta.model
+        items = []
+        for field in serializer._readable_fields:
+            key = repr(field.field_name)
+            if isinstance(field, serializers.SerializerMethodField):
+                try:
+                    sources, function = serializer.row_methods[field.field_name]
+                except (AttributeError, KeyError):
+                    self.fail(f"method field '{field.field_name}' has no row_methods entry")
+                arguments = ", ".join(
+                    self.value(prefix + source, self.model_field(model, source)) for source in sources
+                )
+                items.append(f"{key}: {self.bind(function)}({arguments})")
+            elif isinstance(field, serializers.ListSerializer):
+                self.fail(f"'{field.field_name}' is a many=True serializer")
+            elif isinstance(field, serializers.BaseSerializer):
+                self.model_field(model, field.source)
+                nested_prefix = f"{prefix}{field.source}__"
+                pk = self.column(nested_prefix + field.Meta.model._meta.pk.name)
+                items.append(f"{key}: None if row[{pk}] is None else {self.expression(field, nested_prefix)}")
+            else:
+                model_field = self.model_field(model, field.source)
+                lookup = prefix + field.source
+                if is_iso_datetime(field):
+                    value, call = f"row[{self.column(lookup)}]", self.iso_datetime(lookup, model_field)
+                elif (
+                    type(field).to_representation is fields.DateField.to_representation
+                    and is_iso_format(field, api_settings.DATE_FORMAT)
+                ) or (
+                    type(field).to_representation is fields.TimeField.to_representation
+                    and is_iso_format(field, api_settings.TIME_FORMAT)
+                ):
+                    value = self.value(lookup, model_field)
+                    call = f"{value}.isoformat()"
+                else:
+                    value, convert = self.value(lookup, model_field), converter(field)
+                    call = None if convert is None else f"{self.bind(convert)}({value})"
+                if call is None:
+                    items.append(f"{key}: {value}")
+                elif model_field.null:
+                    items.append(f"{key}: None if {value} is None else {call}")
+                else:
+                    items.append(f"{key}: {call}")
+        return "{" + ", ".join(items) + "}"
+
+    def compile(self):
+        """The read(row, tz, utc) function; fills self.lookups."""
+        body = self.expression(self.serializer_class())
+        values = "".join(f"    {name} = {call}\n" for name, call in self.values.items())
+        source = f"def read(row, tz, utc):\n{values}    return {body}\n"
+        code = compile(source, f"<reader {self.serializer_class.__qualname__}>", "exec")
+        exec(code, self.namespace)
+        return self.namespace["read"]
+
+
+@lru_cache(maxsize=None)
+def get_reader(serializer_class):
+    """The compiled Reader of `serializer_class` (compiled, and checked, on first use)."""
+    compiler = ReaderCompiler(serializer_class, connections[DEFAULT_DB_ALIAS])
+    read = compiler.compile()
+    reader = Reader(serializer_class, tuple(compiler.lookups))
+    reader.functions[DEFAULT_DB_ALIAS] = read
+    return reader
@@ -0,0 +1,109 @@
+# -------------------  Django imports   ------------------------
+from django.db.models.query import QuerySet
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+# -------------------  DRF imports   ------------------------
+from rest_framework.renderers import BaseRenderer
+# -------------------  Other imports   ------------------------
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from uuid import UUID
+import ipaddress
+import msgpack
+import orjson
+
+IP_TYPES = (
+    ipaddress.IPv4Address, ipaddress.IPv6Address, ipaddress.IPv4Network,
+    ipaddress.IPv6Network, ipaddress.IPv4Interface, ipaddress.IPv6Interface,
+)
+
+##################################################################################
+#                               Encoding hooks                                   #
+##################################################################################
+
+def orjson_default(obj):
+    """
+    The types orjson does not know, encoded like DRF's JSONEncoder does:
+    Decimals as numbers, timedeltas (e.g. a raw `preparation_time`) as
+    seconds in a string. Serializer fields have usually converted both.
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, IP_TYPES):
+        return str(obj)
+    if isinstance(obj, QuerySet):
+        return tuple(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if hasattr(obj, "__getitem__"):
+        try:
+            return dict(obj)
+        except (TypeError, ValueError):
+            pass
+    if hasattr(obj, "__iter__"):
+        return tuple(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def msgpack_default(obj):
+    """orjson_default, plus the types orjson encodes natively, as JSON strings."""
+    if isinstance(obj, datetime):
+        text = obj.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    return orjson_default(obj)
+
+##################################################################################
+#                                  Renderers                                     #
+##################################################################################
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Compact UTF-8 JSON through orjson, matching JSONRenderer's output for
+    the same data (UTC datetimes end in "Z", Decimals are numbers unless
+    a serializer field already made them strings).
+    """
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if self.indented(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=orjson_default, option=option)
+
+    @staticmethod
+    def indented(accepted_media_type, renderer_context):
+        """"Accept: application/json; indent=4" (orjson only indents by 2)."""
+        if accepted_media_type and "indent=" in accepted_media_type:
+            return True
+        return bool(renderer_context.get("indent"))
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    MessagePack with the same values as the JSON responses (dates and
+    times as ISO strings, Decimals as floats), for "Accept: application/msgpack".
+    """
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=msgpack_default, use_bin_type=True)
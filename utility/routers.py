@@ -0,0 +1,102 @@
+# -------------------  Django imports   ------------------------
+from django.conf import settings
+from django.db import connections
+# -------------------  Other imports   ------------------------
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+##################################################################################
+#                          Primary / Replica Pinning                             #
+##################################################################################
+
+# True once the current request (or Celery task) must read from the primary:
+# it is an unsafe request, it saved or deleted a model instance
+# (utility.signals), or the client carries a fresh pin cookie. Requests and
+# tasks each run in their own scope (ReplicaPinningMiddleware, pin_scope).
+_primary_pinned = ContextVar("primary_pinned", default=False)
+
+
+def pin_to_primary():
+    """Send every following read of the current context to the primary."""
+    _primary_pinned.set(True)
+
+
+def is_pinned_to_primary():
+    return _primary_pinned.get()
+
+
+def reset_pin(token=None):
+    """Clear the pin set during a request (called by the middleware)."""
+    if token is not None:
+        _primary_pinned.reset(token)
+    else:
+        _primary_pinned.set(False)
+
+
+@contextmanager
+def pin_scope(pinned=False):
+    """
+    Run a unit of work with its own pin: writes inside it pin the reads that
+    follow them there, and the outer pin is back on exit.
+    """
+    token = _primary_pinned.set(pinned)
+    try:
+        yield
+    finally:
+        _primary_pinned.reset(token)
+
+
+def replica_alias():
+    """Return the configured replica alias, or None when no replica exists."""
+    alias = getattr(settings, "REPLICA_DATABASE", None)
+    return alias if alias in settings.DATABASES else None
+
+
+def read_database():
+    """
+    Alias that read-only querysets should use right now.
+
+    Falls back to the primary when no replica is configured, when the
+    context is pinned after a write, or inside an open transaction
+    (a replica could not see its uncommitted rows).
+    """
+    alias = replica_alias()
+    if alias is None or is_pinned_to_primary():
+        return "default"
+    if connections["default"].in_atomic_block:
+        return "default"
+    return alias
+
+##################################################################################
+#                          PrimaryReplicaRouter                                  #
+##################################################################################
+
+class PrimaryReplicaRouter:
+    """
+    Routes reads of read-heavy apps (menu, info, feedback) to the replica
+    and everything else, including all writes, to the primary.
+    """
+
+    def _routed_apps(self):
+        return getattr(settings, "REPLICA_ROUTED_APPS", ())
+
+    def db_for_read(self, model, **hints):
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        if model._meta.app_label in self._routed_apps():
+            return read_database()
+        return "default"
+
+    def db_for_write(self, model, **hints):
+        # Not a pin by itself: get_or_create() and select_for_update() ask
+        # for the write alias without necessarily writing.
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Primary and replica hold the same data set.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema from the primary.
+        return db == "default"
@@ -1,6 +1,44 @@
 from rest_framework import serializers
+from rest_framework.validators import BaseUniqueForValidator, UniqueTogetherValidator, UniqueValidator
+
+UNIQUE_VALIDATORS = (UniqueValidator, UniqueTogetherValidator, BaseUniqueForValidator)
+
+
+def include_tombstones(validators):
+    """
+    Point the generated uniqueness validators at `all_objects`: the database
+    constraints cover soft-deleted rows, so a clash with a tombstone is a 400
+    and not an IntegrityError.
+    """
+    for validator in validators:
+        if isinstance(validator, UNIQUE_VALIDATORS):
+            model = validator.queryset.model
+            if hasattr(model, "all_objects") and validator.queryset is model._default_manager:
+                validator.queryset = model.all_objects.all()
+    return validators
+
 
 class BaseSerializer(serializers.ModelSerializer):
     class Meta:
         abstract = True
         read_only_fields = ("id", "created_at", "updated_at", "is_deleted", "deleted_at")
+
+    def get_fields(self):
+        fields = super().get_fields()
+        for field in fields.values():
+            include_tombstones(field.validators)
+        return fields
+
+    def get_validators(self):
+        return include_tombstones(list(super().get_validators()))
+
+
+class HistoricalRecordSerializer(serializers.BaseSerializer):
+    """
+    Read-only flat representation of a django-simple-history row.
+    Rows read back from the history archive are already in this shape.
+    """
+    def to_representation(self, instance):
+        if isinstance(instance, dict):
+            return instance
+        return {field.attname: field.value_from_object(instance) for field in instance._meta.concrete_fields}
@@ -0,0 +1,49 @@
+# -------------------  Django imports   ------------------------
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+# -------------------   Apps imports ------------------------
+from .routers import _primary_pinned, pin_to_primary, reset_pin
+# -------------------  Other imports   ------------------------
+from celery.signals import task_postrun, task_prerun
+from .sqlite import get_pragmas, apply_pragmas
+
+@receiver(connection_created)
+def tune_sqlite_connection(sender, connection, **kwargs):
+    """
+    Apply the SQLite tuning profile as soon as a connection is opened.
+    Other database vendors are left untouched.
+    """
+    if connection.vendor != "sqlite":
+        return
+    pragmas = get_pragmas()
+    if pragmas:
+        cursor = connection.connection.cursor()
+        try:
+            apply_pragmas(cursor, pragmas)
+        finally:
+            cursor.close()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def pin_after_write(sender, **kwargs):
+    """Reads following an actual write in this context go to the primary."""
+    pin_to_primary()
+
+
+# Pin tokens of the running Celery tasks, by task id.
+_task_pins = {}
+
+
+@task_prerun.connect
+def unpin_task(task_id=None, **kwargs):
+    """A task starts unpinned: the writes of earlier tasks in the worker do not pin it."""
+    _task_pins[task_id] = _primary_pinned.set(False)
+
+
+@task_postrun.connect
+def restore_pin_after_task(task_id=None, **kwargs):
+    token = _task_pins.pop(task_id, None)
+    if token is not None:
+        reset_pin(token)
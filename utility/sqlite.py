@@ -0,0 +1,16 @@
+# -------------------  Django imports   ------------------------
+from django.conf import settings
+
+##################################################################################
+#                          SQLite Tuning Profile                                 #
+##################################################################################
+
+def get_pragmas():
+    """Return settings.SQLITE_PRAGMAS (empty dict or unset disables tuning)."""
+    return getattr(settings, "SQLITE_PRAGMAS", {})
+
+
+def apply_pragmas(cursor, pragmas):
+    """Execute each `PRAGMA name=value` on a DB-API cursor."""
+    for name, value in pragmas.items():
+        cursor.execute(f"PRAGMA {name}={value}")
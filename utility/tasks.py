@@ -0,0 +1,18 @@
+from celery import shared_task
+from django.apps import apps
+from django.conf import settings
+from django.utils import timezone
+from datetime import timedelta
+from .tombstones import PURGEABLE, purge_tombstones
+
+@shared_task
+def purge_expired_tombstones():
+    before = timezone.now() - timedelta(days=getattr(settings, 'TOMBSTONE_RETENTION_DAYS', 30))
+    purged = {}
+    for label in PURGEABLE:
+        purged[label], _ = purge_tombstones(
+            apps.get_model(label), before,
+            batch_size=getattr(settings, 'TOMBSTONE_BATCH_SIZE', 500),
+            pause=getattr(settings, 'TOMBSTONE_BATCH_PAUSE', 0.5),
+        )
+    return purged
@@ -0,0 +1,587 @@
+# -------------------  Django imports   ------------------------
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.db import connections
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+# -------------------  DRF imports   ------------------------
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APITestCase
+# -------------------   Apps imports ------------------------
+from ingredient_requests.models import IngredientItem, IngredientRequest, RecipeIngredient
+from menu.models import Category, MenuItem, SalesBucket
+from orders.models import Order, OrderItem
+from reservation.models import Table
+from .cache_backends import MISSING, Tier, TwoTierCache
+from .history import ARCHIVE_MANIFEST, archive_dir, archive_history, compact_history, count_archive, read_counts
+from .httpcache import bump_data_version, data_versions, fresh_read_scope
+from .middleware import ReplicaPinningMiddleware
+from .mixins import RestoreMixin
+from .pagination import KeysetPagination
+from .routers import is_pinned_to_primary, pin_scope, read_database, reset_pin
+from .tombstones import get_restorable, purge_tombstones
+# -------------------  Other imports   ------------------------
+from celery import shared_task
+from datetime import timedelta
+import base64
+import queue
+import tempfile
+import threading
+import time
+
+##################################################################################
+#                          Primary / Replica Routing                             #
+##################################################################################
+
+def replicate():
+    """Copy the primary test file into the replica file: replication caught up."""
+    for alias in ("default", "replica"):
+        connections[alias].ensure_connection()
+    connections["default"].connection.backup(connections["replica"].connection)
+
+
+@shared_task
+def add_category(name):
+    """A task that writes; run eagerly by the test settings."""
+    Category.objects.create(name=name)
+
+
+class PrimaryReplicaRouterTests(TransactionTestCase):
+    """
+    The two test databases are separate SQLite files (DATABASES[...]["TEST"]);
+    rows written to the primary reach the replica only through replicate(),
+    so replica lag is explicit.
+    """
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        self.category = Category.objects.create(name="Coffee")
+        replicate()
+        reset_pin()
+        self.addCleanup(reset_pin)
+
+    def test_routed_app_reads_from_replica(self):
+        Category.objects.create(name="Tea")
+        reset_pin()
+
+        self.assertEqual(read_database(), "replica")
+        self.assertEqual(Category.objects.count(), 1)
+        replicate()
+        self.assertEqual(Category.objects.count(), 2)
+
+    def test_other_apps_read_from_primary(self):
+        Table.objects.create(number=1, capacity="2")
+        reset_pin()
+
+        self.assertEqual(Table.objects.count(), 1)
+
+    def test_write_pins_following_reads(self):
+        Category.objects.create(name="Tea")
+
+        self.assertTrue(is_pinned_to_primary())
+        self.assertEqual(read_database(), "default")
+        self.assertEqual(Category.objects.count(), 2)
+
+    def test_delete_pins_following_reads(self):
+        Category.objects.filter(pk=self.category.pk).get().delete()
+
+        self.assertTrue(is_pinned_to_primary())
+
+    def test_write_querysets_without_writes_do_not_pin(self):
+        Category.objects.get_or_create(name="Coffee")
+        list(Category.objects.select_for_update().filter(pk=self.category.pk))
+
+        self.assertFalse(is_pinned_to_primary())
+        self.assertEqual(read_database(), "replica")
+
+    def test_pin_scope_ends_with_its_unit_of_work(self):
+        with pin_scope():
+            Category.objects.create(name="Tea")
+            self.assertTrue(is_pinned_to_primary())
+
+        self.assertFalse(is_pinned_to_primary())
+
+    def test_celery_task_writes_do_not_pin_the_worker(self):
+        add_category.delay("Tea")
+
+        self.assertFalse(is_pinned_to_primary())
+        self.assertEqual(read_database(), "replica")
+
+    def test_fresh_data_version_is_read_from_primary(self):
+        bump_data_version(Category)
+
+        with fresh_read_scope(data_versions([Category])):
+            self.assertEqual(read_database(), "default")
+        with override_settings(REPLICA_PIN_SECONDS=0), fresh_read_scope(data_versions([Category])):
+            self.assertEqual(read_database(), "replica")
+
+    def test_cache_refill_after_a_write_does_not_store_replica_lag(self):
+        cache.clear()
+
+        def names():
+            response = self.client.get("/menu/categories/")
+            return sorted(row["name"] for row in response.json()["results"])
+
+        self.assertEqual(names(), ["Coffee"])
+        Category.objects.create(name="Tea")  # bumps the version on commit
+        reset_pin()
+
+        # The replica has not caught up, yet the new version is not filled from it.
+        self.assertEqual(names(), ["Coffee", "Tea"])
+
+##################################################################################
+#                          ReplicaPinningMiddleware                              #
+##################################################################################
+
+class ReplicaPinningMiddlewareTests(TransactionTestCase):
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        Category.objects.create(name="Coffee")
+        replicate()
+        reset_pin()
+        self.addCleanup(reset_pin)
+        self.factory = RequestFactory()
+
+    def call(self, request, view=None):
+        """Run `view` through the middleware; returns (response, alias read inside)."""
+        seen = {}
+
+        def get_response(request):
+            result = view(request) if view else None
+            seen["alias"] = read_database()
+            seen["names"] = sorted(Category.objects.values_list("name", flat=True))
+            return result or HttpResponse()
+
+        response = ReplicaPinningMiddleware(get_response)(request)
+        return response, seen
+
+    def test_plain_read_uses_replica_without_cookie(self):
+        response, seen = self.call(self.factory.get("/menu/categories/"))
+
+        self.assertEqual(seen["alias"], "replica")
+        self.assertNotIn("bcafe_primary_pin", response.cookies)
+
+    def test_unsafe_request_reads_primary_and_sets_cookie(self):
+        response, seen = self.call(
+            self.factory.post("/menu/categories/"),
+            lambda request: Category.objects.create(name="Tea") and None,
+        )
+
+        self.assertEqual(seen["alias"], "default")
+        self.assertEqual(seen["names"], ["Coffee", "Tea"])
+        self.assertEqual(response.cookies["bcafe_primary_pin"]["max-age"], 5)
+
+    def test_failed_unsafe_request_sets_no_cookie(self):
+        response, _ = self.call(self.factory.post("/menu/categories/"), lambda request: HttpResponse(status=400))
+
+        self.assertNotIn("bcafe_primary_pin", response.cookies)
+
+    def test_safe_request_that_writes_sets_cookie(self):
+        response, seen = self.call(
+            self.factory.get("/menu/categories/"),
+            lambda request: Category.objects.create(name="Tea") and None,
+        )
+
+        self.assertEqual(seen["alias"], "default")
+        self.assertIn("bcafe_primary_pin", response.cookies)
+
+    def test_safe_request_with_write_querysets_sets_no_cookie(self):
+        response, seen = self.call(
+            self.factory.get("/menu/categories/"),
+            lambda request: Category.objects.get_or_create(name="Coffee") and None,
+        )
+
+        self.assertEqual(seen["alias"], "replica")
+        self.assertNotIn("bcafe_primary_pin", response.cookies)
+
+    def test_pin_cookie_gives_read_your_writes(self):
+        response, _ = self.call(
+            self.factory.post("/menu/categories/"),
+            lambda request: Category.objects.create(name="Tea") and None,
+        )
+        reset_pin()
+
+        # The replica has not caught up: without the cookie the write is invisible.
+        _, stale = self.call(self.factory.get("/menu/categories/"))
+        request = self.factory.get("/menu/categories/")
+        request.COOKIES["bcafe_primary_pin"] = response.cookies["bcafe_primary_pin"].value
+        renewed, fresh = self.call(request)
+
+        self.assertEqual(stale["names"], ["Coffee"])
+        self.assertEqual(fresh["alias"], "default")
+        self.assertEqual(fresh["names"], ["Coffee", "Tea"])
+        self.assertNotIn("bcafe_primary_pin", renewed.cookies)
+
+    def test_pin_header_forces_primary(self):
+        _, seen = self.call(self.factory.get("/menu/categories/", HTTP_X_READ_PRIMARY="1"))
+
+        self.assertEqual(seen["alias"], "default")
+
+##################################################################################
+#                           History retention                                    #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None)
+class HistoryRetentionTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.enterContext(override_settings(HISTORY_ARCHIVE_DIR=directory.name))
+        category = Category.objects.create(name="Coffee")
+        self.items = [MenuItem.objects.create(category=category, name=name, price="3") for name in ("Tea", "Mocha")]
+
+    def history_rows(self, item):
+        return list(item.history.order_by("history_date", "history_id").values_list("name", "stock"))
+
+    def test_compaction_keeps_changes_and_latest_rows_across_pages(self):
+        tea, mocha = self.items
+        for stock in (1, 2, 3):
+            tea.stock = stock
+            tea.save()
+        tea.name = "Green tea"
+        tea.save()
+        tea.stock = 4
+        tea.save()
+        mocha.stock = 9
+        mocha.save()
+
+        # One row per page: the comparison carries over page boundaries.
+        deleted = compact_history(MenuItem, batch_size=1)
+
+        self.assertEqual(deleted, 3)
+        self.assertEqual(self.history_rows(tea), [("Tea", 0), ("Green tea", 3), ("Green tea", 4)])
+        self.assertEqual(self.history_rows(mocha), [("Mocha", 0), ("Mocha", 9)])
+
+    def test_archive_counts_come_from_the_manifest(self):
+        MenuItem.history.update(history_date=timezone.now() - timedelta(days=400))
+
+        archived = archive_history(MenuItem, timezone.now() - timedelta(days=30), batch_size=1)
+
+        directory = archive_dir(MenuItem)
+        self.assertEqual(archived, 2)
+        self.assertEqual(sum(read_counts(directory).values()), 2)
+        self.assertEqual(count_archive(MenuItem), 2)
+        # Files from before the manifest are still counted.
+        (directory / ARCHIVE_MANIFEST).unlink()
+        self.assertEqual(count_archive(MenuItem), 2)
+
+##################################################################################
+#                                 Soft delete                                    #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None)
+class SoftDeleteTests(APITestCase):
+    """DELETE leaves a tombstone that only `all_objects` still reads."""
+
+    def setUp(self):
+        admin = get_user_model().objects.create_user("admin", password="secret-pass-1", is_staff=True)
+        self.client.force_authenticate(admin)
+        self.coffee = Category.objects.create(name="Coffee")
+        self.espresso = MenuItem.objects.create(category=self.coffee, name="Espresso", price="3.00", stock=10)
+
+    def test_delete_endpoint_soft_deletes(self):
+        response = self.client.delete(f"/menu/menu-items/{self.espresso.pk}/")
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(MenuItem.objects.filter(pk=self.espresso.pk).exists())
+        tombstone = MenuItem.all_objects.get(pk=self.espresso.pk)
+        self.assertTrue(tombstone.is_deleted)
+        self.assertIsNotNone(tombstone.deleted_at)
+
+    def test_reverse_relations_skip_tombstones(self):
+        self.assertEqual(MenuItem._meta.default_manager.name, "objects")
+        self.assertEqual(MenuItem._meta.base_manager.name, "all_objects")
+        latte = MenuItem.objects.create(category=self.coffee, name="Latte", price="4.00", stock=10)
+        order = Order.objects.create(user=get_user_model().objects.create_user("guest", password="secret-pass-1"))
+        OrderItem.objects.create(order=order, menu_item=self.espresso, quantity=1)
+        gone = OrderItem.objects.create(order=order, menu_item=latte, quantity=2)
+        gone.is_deleted = True
+        gone.save()
+
+        self.assertEqual(list(order.items.values_list("menu_item__name", flat=True)), ["Espresso"])
+        prefetched = Order.objects.prefetch_related("items").get(pk=order.pk)
+        self.assertEqual(prefetched.total_price(), 3)
+        # Related-object access goes through the base manager: a live line
+        # still reaches its tombstoned menu item.
+        latte.is_deleted = True
+        latte.save()
+        self.assertEqual(OrderItem.all_objects.get(pk=gone.pk).menu_item, latte)
+
+    def test_clash_with_a_tombstone_is_a_validation_error(self):
+        self.client.delete(f"/menu/menu-items/{self.espresso.pk}/")
+
+        response = self.client.post(
+            "/menu/menu-items/", {"name": "Espresso", "price": "3.50", "category_id": self.coffee.pk}
+        )
+        self.assertEqual(response.status_code, 400)
+
+##################################################################################
+#                              Tombstone purge                                   #
+##################################################################################
+
+@override_settings(REPLICA_DATABASE=None)
+class TombstonePurgeTests(TestCase):
+    """Purged tombstones come back from the archive with their cascade and history."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.enterContext(override_settings(TOMBSTONE_ARCHIVE_DIR=directory.name))
+        self.before = timezone.now() - timedelta(days=30)
+
+    def bury(self, instance):
+        instance.is_deleted = True
+        instance.deleted_at = self.before - timedelta(days=10)
+        instance.save()
+
+    def history_rows(self, instance):
+        return list(instance.history.order_by("history_id").values_list("history_id", "history_type"))
+
+    def test_purge_unarchive_restore(self):
+        chef = get_user_model().objects.create_user("chef", password="secret-pass-1")
+        request = IngredientRequest.objects.create(chef=chef, note="Weekly")
+        IngredientItem.objects.create(request=request, name="Milk", quantity="2 l")
+        request.note = "Weekly order"
+        request.save()
+        self.bury(request)
+        history = self.history_rows(request)
+
+        self.assertEqual(purge_tombstones(IngredientRequest, self.before), (1, 0))
+        self.assertFalse(IngredientRequest.all_objects.filter(pk=request.pk).exists())
+        self.assertFalse(IngredientItem.all_objects.filter(request_id=request.pk).exists())
+        self.assertEqual(self.history_rows(request), [])
+
+        restored = get_restorable(IngredientRequest, request.pk)
+        self.assertTrue(restored.is_deleted)
+        self.assertEqual(restored.note, "Weekly order")
+        self.assertEqual(list(restored.items.values_list("name", "quantity")), [("Milk", "2 l")])
+        self.assertEqual(self.history_rows(restored), history)
+
+        RestoreMixin().perform_restore(restored)
+        self.assertTrue(IngredientRequest.objects.filter(pk=request.pk).exists())
+
+    def test_sales_buckets_keep_a_menu_item(self):
+        item = MenuItem.objects.create(category=Category.objects.create(name="Coffee"), name="Tea", price="3")
+        RecipeIngredient.objects.create(menu_item=item, name="Tea leaves", quantity="5", unit="g")
+        bucket = SalesBucket.objects.create(menu_item=item, granularity="day", bucket_start=timezone.now(), quantity=4)
+        self.bury(item)
+
+        self.assertEqual(purge_tombstones(MenuItem, self.before, dry_run=True), (0, 1))
+        self.assertEqual(purge_tombstones(MenuItem, self.before), (0, 1))
+        self.assertTrue(SalesBucket.objects.filter(pk=bucket.pk).exists())
+
+        bucket.delete()
+        history = self.history_rows(item)
+        self.assertEqual(purge_tombstones(MenuItem, self.before), (1, 0))
+        self.assertFalse(RecipeIngredient.all_objects.filter(menu_item_id=item.pk).exists())
+
+        restored = get_restorable(MenuItem, item.pk)
+        self.assertEqual(list(restored.recipe.values_list("name", flat=True)), ["Tea leaves"])
+        self.assertEqual(self.history_rows(restored), history)
+
+##################################################################################
+#                              Keyset pagination                                 #
+##################################################################################
+
+class KeysetPaginationTests(TestCase):
+    """Cursors walk every row once, both ways, including rows that share a timestamp."""
+
+    def setUp(self):
+        now = timezone.now()
+        self.categories = [Category.objects.create(name=f"Category {number}") for number in range(8)]
+        # Rows 2-5 share one timestamp: only the id orders them.
+        for number, category in enumerate(self.categories):
+            at = now - timedelta(minutes=3) if 2 <= number <= 5 else now - timedelta(minutes=10 - number)
+            Category.all_objects.filter(pk=category.pk).update(created_at=at)
+        self.expected = list(Category.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+
+    def page(self, url):
+        pager = KeysetPagination()
+        rows = pager.paginate_queryset(Category.objects.all(), Request(RequestFactory().get(url)))
+        return [row.pk for row in rows], pager.get_next_link(), pager.get_previous_link()
+
+    def token(self, raw):
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def test_next_links_walk_every_row_once(self):
+        seen, link, pages = [], "/categories/?page_size=3", []
+        while link:
+            ids, link, _ = self.page(link)
+            seen += ids
+            pages.append(ids)
+        self.assertEqual(seen, self.expected)
+        self.assertEqual([len(ids) for ids in pages], [3, 3, 2])
+
+    def test_previous_links_walk_back_to_the_first_page(self):
+        pages, link = [], "/categories/?page_size=3"
+        while link:
+            ids, link, previous = self.page(link)
+            pages.append(ids)
+
+        back = []
+        while previous:
+            ids, _, previous = self.page(previous)
+            back.append(ids)
+        self.assertEqual(back, pages[-2::-1])
+        self.assertIn("cursor=", self.page("/categories/?page_size=3")[1])
+        self.assertIsNone(self.page("/categories/?page_size=3")[2])
+
+    def test_malformed_cursors_are_404(self):
+        for cursor in (
+            "!!!",
+            self.token("not json"),
+            self.token('["next", "2026-01-01T00:00:00+00:00"]'),
+            self.token('["sideways", "2026-01-01T00:00:00+00:00", 1]'),
+            self.token('["next", "yesterday", 1]'),
+            self.token('["next", "2026-01-01T00:00:00+00:00", "one"]'),
+        ):
+            with self.assertRaises(NotFound, msg=cursor):
+                self.page(f"/categories/?cursor={cursor}")
+
+##################################################################################
+#                          TwoTierCache invalidation                             #
+##################################################################################
+
+class FakeRedis:
+    """In-memory stand-in for the Redis pub/sub calls TwoTierCache makes."""
+
+    def __init__(self):
+        self.subscriptions = []
+        self.on_publish = None
+
+    def publish(self, channel, message):
+        if self.on_publish is not None:
+            self.on_publish(message)
+        for subscription in list(self.subscriptions):
+            if channel in subscription.channels:
+                subscription.messages.put({"type": "message", "channel": channel, "data": message.encode()})
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    def drop_connections(self):
+        for subscription in list(self.subscriptions):
+            subscription.messages.put(None)
+        self.subscriptions.clear()
+
+
+class FakePubSub:
+    def __init__(self, server):
+        self.server = server
+        self.channels = set()
+        self.messages = queue.Queue()
+
+    def subscribe(self, channel):
+        self.channels.add(channel)
+        self.server.subscriptions.append(self)
+        self.messages.put({"type": "subscribe", "channel": channel, "data": 1})
+
+    def listen(self):
+        while (message := self.messages.get()) is not None:
+            yield message
+
+
+class ProcessCache(TwoTierCache):
+    """A TwoTierCache with its own L1 and listener, as if in its own process."""
+
+    def __init__(self, server):
+        super().__init__("l2", {"OPTIONS": {"LOCAL_PREFIXES": ("v:",), "CHANNEL": "test:invalidate"}})
+        self.server = server
+        self.own_tier = Tier(self.max_entries, self.max_bytes)
+
+    @property
+    def tier(self):
+        if self.own_tier.listener is None:
+            self.own_tier.listener = threading.Thread(target=self.listen, args=(self.own_tier,), daemon=True)
+            self.own_tier.listener.start()
+        return self.own_tier
+
+    def redis(self):
+        return self.server
+
+
+@override_settings(CACHES={**settings.CACHES, "l2": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class TwoTierCacheTests(SimpleTestCase):
+    def setUp(self):
+        caches["l2"].clear()
+        self.server = FakeRedis()
+        self.first, self.second = ProcessCache(self.server), ProcessCache(self.server)
+        for cache in (self.first, self.second):
+            self.addCleanup(self.stop, cache.own_tier)
+            self.wait_for(lambda cache=cache: cache.tier.listening)
+
+    def stop(self, tier):
+        tier.pid = None  # the listener exits after its current connection
+        self.server.drop_connections()
+
+    def wait_for(self, condition, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            self.assertLess(time.monotonic(), deadline, "timed out")
+            time.sleep(0.01)
+
+    def cached(self, cache, key):
+        return cache.tier.local.get(cache.make_key(key)) is not MISSING
+
+    def test_not_local_until_subscribed(self):
+        cache = ProcessCache(self.server)
+        self.addCleanup(self.stop, cache.own_tier)
+        cache.own_tier.listener = threading.Thread()  # no listener: never subscribed
+
+        cache.set("v:menu", 1)
+
+        self.assertIsNone(cache.local_for("v:menu"))
+        self.assertEqual(cache.get("v:menu"), 1)
+
+    def test_write_discards_other_process_copy(self):
+        self.first.set("v:menu", 1)
+        self.assertEqual(self.second.get("v:menu"), 1)
+        self.assertTrue(self.cached(self.second, "v:menu"))
+
+        self.first.set("v:menu", 2)
+
+        self.wait_for(lambda: not self.cached(self.second, "v:menu"))
+        self.assertEqual(self.second.get("v:menu"), 2)
+        self.assertTrue(self.cached(self.first, "v:menu"))
+
+    def test_delete_and_incr_write_l2_before_invalidating(self):
+        self.first.set("v:menu", 1)
+        self.second.get("v:menu")
+        seen = []
+        self.server.on_publish = lambda message: seen.append(caches["l2"].get("v:menu"))
+
+        self.first.incr("v:menu")
+        self.wait_for(lambda: not self.cached(self.second, "v:menu"))
+        self.assertEqual(self.second.get("v:menu"), 2)
+        self.first.delete("v:menu")
+        self.wait_for(lambda: not self.cached(self.second, "v:menu"))
+
+        self.assertEqual(seen, [2, None])
+        self.assertIsNone(self.second.get("v:menu"))
+
+    def test_lost_connection_clears_and_resubscribes(self):
+        self.first.set("v:menu", 1)
+        self.second.get("v:menu")
+
+        self.server.drop_connections()
+
+        self.wait_for(lambda: not self.second.tier.listening)
+        self.assertFalse(self.cached(self.second, "v:menu"))
+        self.assertIsNone(self.second.local_for("v:menu"))
+        self.wait_for(lambda: self.second.tier.listening)
+        self.second.get("v:menu")
+        self.assertTrue(self.cached(self.second, "v:menu"))
+
+    def test_clear_empties_every_process(self):
+        self.first.set("v:menu", 1)
+        self.second.get("v:menu")
+
+        self.first.clear()
+
+        self.wait_for(lambda: not self.cached(self.second, "v:menu"))
+        self.assertFalse(self.cached(self.first, "v:menu"))
+        self.assertIsNone(self.second.get("v:menu"))
@@ -0,0 +1,224 @@
+# -------------------  Django imports   ------------------------
+from django.apps import apps
+from django.conf import settings
+from django.core import serializers
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, router, transaction
+from django.db.models.deletion import Collector
+from django.utils import timezone
+# -------------------  Other imports   ------------------------
+from pathlib import Path
+import gzip
+import json
+import time
+# -------------------   Apps imports ------------------------
+from .history import history_manager
+from .models import BaseModel
+
+# Models whose tombstones are purged, with the live rows they own. Purging
+# a row archives its whole cascade; a live row of any other model pointing
+# at it (e.g. an OrderItem of a deleted MenuItem) keeps the tombstone in place.
+# Rows of models without soft delete are always live: the sales buckets of a
+# MenuItem keep it, so top sellers and forecasts never lose history.
+PURGEABLE = {
+    "feedback.Feedback": (),
+    "ingredient_requests.IngredientRequest": (
+        "ingredient_requests.IngredientItem",
+        "ingredient_requests.ReorderSuggestion",
+    ),
+    "orders.Invoice": (),
+    "menu.MenuItem": (
+        "ingredient_requests.RecipeIngredient",
+        "ingredient_requests.ReorderRule",
+        "ingredient_requests.ReorderSuggestion",
+    ),
+}
+
+##################################################################################
+#                                Archive files                                   #
+##################################################################################
+
+def tombstone_root():
+    return Path(getattr(settings, "TOMBSTONE_ARCHIVE_DIR", settings.BASE_DIR / "tombstone_archive"))
+
+
+def tombstone_dir(model):
+    """Directory holding the monthly `YYYY-MM.jsonl.gz` bundles of one model."""
+    return tombstone_root() / model._meta.label_lower
+
+
+def _serialize(objects):
+    return serializers.serialize("python", objects)
+
+
+def _has_history(model):
+    return hasattr(model._meta, "simple_history_manager_attribute")
+
+##################################################################################
+#                                   Purge                                        #
+##################################################################################
+
+def blocked_pks(model, pks):
+    """
+    pks that live rows outside the model's owned children still point at.
+    Every row of a model without soft delete (e.g. menu.SalesBucket) is live.
+    """
+    owned = {apps.get_model(label) for label in PURGEABLE.get(model._meta.label, ())}
+    blocked = set()
+    for relation in model._meta.related_objects:
+        related = relation.related_model
+        if relation.on_delete is not models.CASCADE or related in owned:
+            continue
+        rows = related._base_manager.filter(**{f"{relation.field.name}__in": pks})
+        if issubclass(related, BaseModel):
+            rows = rows.filter(is_deleted=False)
+        blocked.update(rows.values_list(relation.field.attname, flat=True))
+    return blocked
+
+
+def purge_tombstones(model, before, batch_size=500, pause=0.0, dry_run=False):
+    """
+    Move rows of `model` soft-deleted before `before` out of the database.
+
+    Each batch runs in its own short transaction: Django's delete collector
+    gathers the cascade, every collected row (and the simple_history rows of
+    each) is appended to a gzip JSONL bundle per root row, then the batch is
+    deleted. `pause` seconds between batches let other writers in.
+    Returns (purged, blocked) counts.
+    """
+    candidates = model.all_objects.filter(is_deleted=True, deleted_at__lt=before).order_by("pk")
+    if dry_run:
+        pks = list(candidates.values_list("pk", flat=True))
+        blocked = blocked_pks(model, pks)
+        return len(pks) - len(blocked), len(blocked)
+
+    directory = tombstone_dir(model)
+    directory.mkdir(parents=True, exist_ok=True)
+    using = router.db_for_write(model)
+    purged = blocked_total = 0
+    last_pk = None
+    while True:
+        batch = candidates if last_pk is None else candidates.filter(pk__gt=last_pk)
+        pks = list(batch.values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return purged, blocked_total
+        last_pk = pks[-1]
+        with transaction.atomic(using=using):
+            blocked = blocked_pks(model, pks)
+            roots = list(model.all_objects.using(using).select_for_update().filter(pk__in=set(pks) - blocked))
+            collectors = [collect(root, using) for root in roots]
+            if collectors:
+                # Written (and flushed on close) before anything is deleted.
+                with gzip.open(directory / f"{timezone.now():%Y-%m}.jsonl.gz", "at", encoding="utf-8") as handle:
+                    handle.writelines(
+                        json.dumps(archive_bundle(root, collector), cls=DjangoJSONEncoder) + "\n"
+                        for root, collector in zip(roots, collectors)
+                    )
+                for collector in collectors:
+                    delete_collected(collector)
+        purged += len(roots)
+        blocked_total += len(blocked)
+        if pause:
+            time.sleep(pause)
+
+
+def collect(root, using):
+    """Django's delete collector for `root`, sorted children first."""
+    collector = Collector(using=using, origin=root)
+    collector.collect([root])
+    collector.sort()
+    return collector
+
+
+def collected_groups(collector):
+    """Lists of collected instances per model, parents first."""
+    groups = [list(instances) for instances in reversed(collector.data.values())]
+    groups += [list(queryset) for queryset in collector.fast_deletes]
+    return [instances for instances in groups if instances]
+
+
+def history_of(instances, using):
+    model = type(instances[0])
+    return history_manager(model).using(using).filter(
+        **{f"{model._meta.pk.attname}__in": [obj.pk for obj in instances]}
+    )
+
+
+def archive_bundle(root, collector):
+    """
+    One JSON-ready dict holding `root`, its cascade and their history rows.
+    Rows are listed parents first, the order in which they can be reinserted.
+    """
+    rows, history = [], []
+    for instances in collected_groups(collector):
+        rows.extend(_serialize(instances))
+        if _has_history(type(instances[0])):
+            history.extend(_serialize(history_of(instances, collector.using)))
+    return {
+        "model": root._meta.label_lower,
+        "pk": root.pk,
+        "deleted_at": root.deleted_at,
+        "purged_at": timezone.now(),
+        "rows": rows,
+        "history": history,
+    }
+
+
+def delete_collected(collector):
+    # pks are captured before the delete, which also writes "-" history rows.
+    histories = [
+        history_of(instances, collector.using)
+        for instances in collected_groups(collector) if _has_history(type(instances[0]))
+    ]
+    collector.delete()
+    for history in histories:
+        history.delete()
+
+##################################################################################
+#                                  Restore                                       #
+##################################################################################
+
+def find_bundle(model, pk):
+    """The most recent archived bundle of `model` row `pk`, or None."""
+    directory = tombstone_dir(model)
+    if not directory.exists():
+        return None
+    label = model._meta.label_lower
+    for path in sorted(directory.glob("*.jsonl.gz"), reverse=True):
+        found = None
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                bundle = json.loads(line)
+                if bundle["model"] == label and str(bundle["pk"]) == str(pk):
+                    found = bundle
+        if found is not None:
+            return found
+    return None
+
+
+def unarchive(model, pk):
+    """
+    Reinsert a purged row with its cascade and history, still soft-deleted,
+    so the usual restore flow can revive it. Returns the row or None.
+    """
+    bundle = find_bundle(model, pk)
+    if bundle is None:
+        return None
+    using = router.db_for_write(model)
+    with transaction.atomic(using=using):
+        for obj in serializers.deserialize("python", bundle["rows"] + bundle["history"], using=using):
+            obj.save(using=using)
+    return model.all_objects.using(using).get(pk=pk)
+
+
+def get_restorable(model, pk):
+    """A soft-deleted row from the table, or from the archive once purged."""
+    try:
+        return model.all_objects.get(pk=pk)
+    except model.DoesNotExist:
+        instance = unarchive(model, pk)
+        if instance is None:
+            raise
+        return instance
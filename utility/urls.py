@@ -0,0 +1,9 @@
+# -------------------  Django imports   ------------------------
+from django.urls import path
+# -------------------   Apps imports ------------------------
+from .views import ProfileDownloadView, ProfileListView
+
+urlpatterns = [
+    path('profiles/', ProfileListView.as_view(), name='profile-list'),
+    path('profiles/<str:profile_id>/', ProfileDownloadView.as_view(), name='profile-download'),
+]
@@ -1,5 +1,12 @@
+from django.http import FileResponse, Http404
+from django.urls import reverse
 from rest_framework import generics
+from rest_framework.response import Response
+from users.permissions import IsAdmin
 from .mixins import SoftDeleteMixin
+from .pagination import ArchivedHistoryPagination
+from .profiling import profile_store
+from .serializers import HistoricalRecordSerializer
 
 class BaseAPIView(generics.GenericAPIView):
     pass
@@ -9,3 +16,53 @@ class SoftDeleteGenericView(SoftDeleteMixin, generics.DestroyAPIView):
 
     def get_queryset(self):
         return super().get_queryset().filter(is_deleted=False)
+
+class HistoryListView(generics.ListAPIView):
+    """
+    Lists the django-simple-history rows of `model`, newest first,
+    reading through to the history archive for rows moved out of the table.
+    """
+    model = None
+    serializer_class = HistoricalRecordSerializer
+    pagination_class = ArchivedHistoryPagination
+
+    def get_queryset(self):
+        return self.model.history.all()
+
+
+class ProfileListView(BaseAPIView):
+    """
+    The slowest profiled requests still in the ring buffer. Optional
+    filters: ?view=<view class name>, ?path=<substring>; ?limit= (default 50).
+    """
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        summaries = profile_store().summaries()
+        view, path = request.query_params.get("view"), request.query_params.get("path")
+        if view:
+            summaries = [summary for summary in summaries if summary.get("view") == view]
+        if path:
+            summaries = [summary for summary in summaries if path in summary.get("path", "")]
+        try:
+            limit = max(1, int(request.query_params.get("limit", 50)))
+        except ValueError:
+            limit = 50
+        summaries.sort(key=lambda summary: summary["ms"], reverse=True)
+        for summary in summaries[:limit]:
+            summary["download"] = request.build_absolute_uri(reverse("profile-download", args=[summary["id"]]))
+        return Response(summaries[:limit])
+
+
+class ProfileDownloadView(BaseAPIView):
+    """A profile as a speedscope file (open it at https://www.speedscope.app)."""
+    permission_classes = [IsAdmin]
+
+    def get(self, request, profile_id):
+        path = profile_store().find(profile_id)
+        if path is None:
+            raise Http404
+        return FileResponse(
+            path.open("rb"), as_attachment=True,
+            filename=f"{profile_id}.speedscope.json", content_type="application/json",
+        )